@@ -0,0 +1,32 @@
+"""Compare the cost of reading the time from the different clocks
+
+Run from the repository root with ``python -m benchmarks.bench_clock``
+"""
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.helper import fmt_duration, print_table, timed
+from eascheduler.clocks import SYSTEM_CLOCK, CoarseClock, LoopClock
+
+
+READS = 100_000
+
+
+async def main() -> None:
+    rows = []
+    for clock in (SYSTEM_CLOCK, CoarseClock(), LoopClock()):
+        now = clock.now
+
+        def read(now=now) -> None:  # noqa: ANN001
+            for _ in range(READS):
+                now()
+
+        duration = timed(read)
+        rows.append((clock.__class__.__name__, fmt_duration(duration), fmt_duration(duration / READS)))
+
+    print_table(('clock', f'{READS:,d} reads', 'per read'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Compare countdown resets on the AsyncScheduler and the TimingWheelScheduler with and without lazy resets
+
+Run from the repository root with ``python -m benchmarks.bench_countdown_reset``
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from benchmarks.helper import fmt_duration, print_table, timed
+from eascheduler.executor import SyncExecutor
+from eascheduler.jobs import CountdownJob
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.timing_wheel import TimingWheelScheduler
+
+
+if TYPE_CHECKING:
+    from eascheduler.schedulers import SchedulerBase
+
+
+SIZES = (1_000, 10_000, 50_000)
+RESETS = 10_000
+
+
+def bench_scheduler(scheduler: SchedulerBase, count: int, *, lazy_reset: bool) -> float:
+    executor = SyncExecutor(lambda: None)
+    jobs = [CountdownJob(executor, 30 + i % 60, lazy_reset=lazy_reset) for i in range(count)]
+    for job in jobs:
+        job.link_scheduler(scheduler)
+        job.reset()
+
+    reset_jobs = [jobs[(i * 7919) % count] for i in range(RESETS)]
+
+    def reset() -> None:
+        for job in reset_jobs:
+            job.reset()
+
+    duration = timed(reset)
+    scheduler.remove_all()
+    return duration
+
+
+async def main() -> None:
+    rows = []
+    for size in SIZES:
+        for scheduler in (AsyncScheduler(), TimingWheelScheduler()):
+            for lazy_reset in (False, True):
+                duration = bench_scheduler(scheduler, size, lazy_reset=lazy_reset)
+                rows.append((f'{size:,d}', scheduler.__class__.__name__, 'yes' if lazy_reset else 'no',
+                             fmt_duration(duration), fmt_duration(duration / RESETS)))
+
+    print_table(('jobs', 'scheduler', 'lazy', f'{RESETS:,d} resets', 'per reset'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Measure the next run of an interval with a filter that only allows a small window
+
+Run from the repository root with ``python -m benchmarks.bench_interval_filter``
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+from whenever import Instant, Time
+
+from benchmarks.helper import fmt_duration, print_table, timed
+from eascheduler.producers import IntervalProducer
+from eascheduler.producers.base import ProducerFilterBase
+from eascheduler.producers.prod_filter import (
+    AllGroupProducerFilter,
+    DayOfWeekProducerFilter,
+    InvertingProducerFilter,
+    TimeProducerFilter,
+)
+
+
+if TYPE_CHECKING:
+    from whenever import ZonedDateTime
+
+
+INTERVAL_SECS = 30
+RUNS = 1_000
+
+
+class _NoSkip(ProducerFilterBase):
+    """Wraps a filter and hides its skip_to, so the producer has to check every run"""
+
+    __slots__ = ('_filter', )
+
+    def __init__(self, producer_filter: ProducerFilterBase) -> None:
+        self._filter = producer_filter
+
+    @override
+    def allow(self, dt: ZonedDateTime) -> bool:
+        return self._filter.allow(dt)
+
+
+def bench_filter(producer_filter: ProducerFilterBase) -> float:
+    start = Instant.from_utc(2001, 1, 1)
+    producer = IntervalProducer(start, INTERVAL_SECS)
+    producer._filter = producer_filter
+
+    def run() -> None:
+        dt = start
+        for _ in range(RUNS):
+            dt = producer.get_next(dt)
+
+    return timed(run, repeat=1)
+
+
+def main() -> None:
+    filters = {
+        'weekdays 08:00 - 09:00': AllGroupProducerFilter(
+            [DayOfWeekProducerFilter([1, 2, 3, 4, 5]), TimeProducerFilter(Time(8), Time(9))]),
+        'daily 12:00 - 12:05': TimeProducerFilter(Time(12), Time(12, 5)),
+        'sundays': DayOfWeekProducerFilter([7]),
+        'not weekdays (no skip)': InvertingProducerFilter(DayOfWeekProducerFilter([1, 2, 3, 4, 5])),
+    }
+
+    rows = []
+    for name, producer_filter in filters.items():
+        slow = bench_filter(_NoSkip(producer_filter))
+        fast = bench_filter(producer_filter)
+        rows.append((name, f'{RUNS:,d}', fmt_duration(slow), fmt_duration(fast), f'{slow / fast:.1f}x'))
+
+    print_table(('window', 'runs', 'step', 'skip', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
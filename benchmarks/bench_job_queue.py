@@ -0,0 +1,74 @@
+"""Compare the job queue implementations of the AsyncScheduler
+
+Run from the repository root with ``python -m benchmarks.bench_job_queue``
+"""
+from __future__ import annotations
+
+from whenever import Instant
+
+from benchmarks.helper import fmt_duration, print_table, spread_instants, timed
+from eascheduler.executor import SyncExecutor
+from eascheduler.jobs.base import JobBase
+from eascheduler.schedulers.job_queue import DequeJobQueue, HeapJobQueue, JobQueueBase
+
+
+SIZES = (1_000, 10_000, 100_000)
+RESETS = 1_000
+# The deque is very slow for big sizes, so we run these only once
+SINGLE_RUN_SIZE = 10_000
+
+
+def create_jobs(count: int) -> list[JobBase]:
+    executor = SyncExecutor(lambda: None)
+    jobs = []
+    for instant in spread_instants(Instant.now(), count, 3600):
+        job = JobBase(executor)
+        job.next_run = instant
+        jobs.append(job)
+    return jobs
+
+
+def bench_queue(cls: type[JobQueueBase], jobs: list[JobBase]) -> tuple[float, float, float]:
+    queue = cls()
+
+    def fill() -> None:
+        queue.clear()
+        for job in jobs:
+            queue.push(job)
+
+    # reset burst: like CountdownJob.reset() which is a remove + add
+    reset_jobs = jobs[::max(1, len(jobs) // RESETS)][:RESETS]
+    later = jobs[-1].next_run.add(seconds=1)
+
+    def reset() -> None:
+        for job in reset_jobs:
+            queue.remove(job)
+            job.next_run = later
+            queue.push(job)
+
+    def drain() -> None:
+        while queue:
+            queue.pop()
+
+    repeat = 1 if len(jobs) > SINGLE_RUN_SIZE else 3
+    t_fill = timed(fill, repeat=repeat)
+    t_reset = timed(reset, repeat=repeat, setup=fill)
+    t_drain = timed(drain, repeat=repeat, setup=fill)
+    return t_fill, t_reset, t_drain
+
+
+def main() -> None:
+    rows = []
+    for size in SIZES:
+        for cls in (DequeJobQueue, HeapJobQueue):
+            t_fill, t_reset, t_drain = bench_queue(cls, create_jobs(size))
+            rows.append((
+                f'{size:,d}', cls.__name__,
+                fmt_duration(t_fill), fmt_duration(t_reset), fmt_duration(t_drain),
+            ))
+
+    print_table(('jobs', 'queue', 'add all', f'{RESETS:d} resets', 'pop all'), rows)
+
+
+if __name__ == '__main__':
+    main()
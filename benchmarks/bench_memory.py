@@ -0,0 +1,102 @@
+"""Measure the memory that is used per scheduled job for every job type and per key of a debounce job
+
+Run from the repository root with ``python -m benchmarks.bench_memory``
+"""
+from __future__ import annotations
+
+import asyncio
+import gc
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from whenever import Instant
+
+from benchmarks.helper import print_table, spread_instants
+from eascheduler.executor import AsyncExecutor, SyncExecutor
+from eascheduler.job_control import CountdownJobControl, DateTimeJobControl, OneTimeJobControl
+from eascheduler.jobs import CountdownJob, DateTimeJob, DebounceJob, OneTimeJob
+from eascheduler.producers import IntervalProducer
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from eascheduler.job_control.base import BaseControl
+
+
+COUNT = 100_000
+SPREAD_SECS = 86_400
+INTERVAL_SECS = 3_600
+COUNTDOWN_SECS = 60
+
+
+async def _noop() -> None:
+    pass
+
+
+def measure(create: Callable[[int], BaseControl]) -> float:
+    """Create and schedule the jobs and return the allocated bytes per job"""
+    scheduler = AsyncScheduler()
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    with scheduler.batch():
+        controls = [create(i) for i in range(COUNT)]
+        for control in controls:
+            control._job.link_scheduler(scheduler)
+
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    scheduler.remove_all()
+    return size / COUNT
+
+
+def measure_debounce() -> float:
+    """Trigger the keys of a debounce job and return the allocated bytes per key"""
+    scheduler = AsyncScheduler()
+    job = DebounceJob(AsyncExecutor, COUNTDOWN_SECS, _noop)
+    job.link_scheduler(scheduler)
+    keys = [f'key_{i:d}' for i in range(COUNT)]
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    for key in keys:
+        job.trigger(key)
+
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    scheduler.remove_all()
+    return size / COUNT
+
+
+async def main() -> None:
+    instants = spread_instants(Instant.now().add(hours=1), COUNT, SPREAD_SECS)
+
+    def create_once(i: int) -> BaseControl:
+        return OneTimeJobControl(OneTimeJob(AsyncExecutor(_noop), instants[i]))
+
+    def create_datetime(i: int) -> BaseControl:
+        producer = IntervalProducer(instants[i], INTERVAL_SECS)
+        return DateTimeJobControl(DateTimeJob(AsyncExecutor(_noop), producer))
+
+    def create_countdown(i: int) -> BaseControl:  # noqa: ARG001
+        return CountdownJobControl(CountdownJob(AsyncExecutor(_noop), COUNTDOWN_SECS))
+
+    def create_sync(i: int) -> BaseControl:
+        return OneTimeJobControl(OneTimeJob(SyncExecutor(print), instants[i]))
+
+    rows = []
+    for name, create in (('OneTimeJob', create_once), ('DateTimeJob', create_datetime),
+                         ('CountdownJob', create_countdown), ('OneTimeJob (sync)', create_sync)):
+        rows.append((name, f'{COUNT:,d}', f'{measure(create):,.0f}'))
+    rows.append(('DebounceJob (per key)', f'{COUNT:,d}', f'{measure_debounce():,.0f}'))
+
+    print_table(('job', 'jobs', 'bytes per job'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
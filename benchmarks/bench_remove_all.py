@@ -0,0 +1,73 @@
+"""Compare finishing the jobs one by one with removing all jobs at once
+
+Run from the repository root with ``python -m benchmarks.bench_remove_all``
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from whenever import Instant
+
+from benchmarks.helper import fmt_duration, print_table, spread_instants, timed
+from eascheduler.executor import SyncExecutor
+from eascheduler.job_stores import InMemoryStore
+from eascheduler.jobs import OneTimeJob
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.job_queue import DequeJobQueue, HeapJobQueue
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from eascheduler.schedulers.job_queue import JobQueueBase
+
+
+SIZES = (1_000, 10_000, 30_000)
+SPREAD_SECS = 86_400
+# Finishing the jobs one by one is quadratic for the deque, so it's skipped for the large sizes
+DEQUE_SINGLE_MAX = 10_000
+
+
+def bench_remove(queue: Callable[[], JobQueueBase], count: int, *, bulk: bool) -> float:
+    instants = spread_instants(Instant.now().add(hours=1), count, SPREAD_SECS)
+    executor = SyncExecutor(lambda: None)
+    scheduler = AsyncScheduler(queue=queue())
+    jobs: list[OneTimeJob] = []
+
+    def setup() -> None:
+        store = InMemoryStore()
+        jobs.clear()
+        with scheduler.batch():
+            for instant in instants:
+                job = OneTimeJob(executor, instant)
+                store.add_job(job)
+                job.link_scheduler(scheduler)
+                jobs.append(job)
+
+    def remove() -> None:
+        if bulk:
+            scheduler.remove_all()
+            return None
+
+        for job in jobs:
+            job.job_finish()
+
+    return timed(remove, setup=setup)
+
+
+async def main() -> None:
+    rows = []
+    for size in SIZES:
+        for queue in (DequeJobQueue, HeapJobQueue):
+            single = '-'
+            if queue is not DequeJobQueue or size <= DEQUE_SINGLE_MAX:
+                single = fmt_duration(bench_remove(queue, size, bulk=False))
+            bulk = bench_remove(queue, size, bulk=True)
+            rows.append((f'{size:,d}', queue.__name__, single, fmt_duration(bulk)))
+
+    print_table(('jobs', 'queue', 'job_finish', 'remove_all'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Measure the dispatch throughput of the ShardedScheduler for different shard counts.
+
+All jobs are due at the same time and every run calculates the next run of the job.
+Without a free threaded interpreter the shards share the GIL, so the throughput can not scale with the shards.
+
+Run from the repository root with ``python -m benchmarks.bench_sharded``
+"""
+from __future__ import annotations
+
+from threading import Event, Lock
+from time import perf_counter, sleep
+
+from whenever import Instant
+
+from benchmarks.helper import fmt_duration, print_table
+from eascheduler.builder import JobBuilder, TriggerBuilder
+from eascheduler.executor import SyncExecutor
+from eascheduler.schedulers.sharded import ShardedScheduler
+
+
+JOBS = 20_000
+SHARDS = (1, 2, 4, 8)
+START_DELAY = 1
+
+
+def bench_shards(shards: int) -> float:
+    scheduler = ShardedScheduler(shards)
+    builder = JobBuilder(scheduler, SyncExecutor)
+
+    lock = Lock()
+    done = Event()
+    executed = 0
+
+    def func() -> None:
+        nonlocal executed
+        with lock:
+            executed += 1
+            if executed == JOBS:
+                done.set()
+
+    start = Instant.now().add(seconds=START_DELAY)
+    with builder.bulk():
+        for _ in range(JOBS):
+            builder.at(TriggerBuilder.interval(start, 3_600), func)
+
+    sleep(max((start - Instant.now()).in_seconds(), 0))
+    begin = perf_counter()
+    done.wait()
+    duration = perf_counter() - begin
+
+    scheduler.remove_all()
+    scheduler.stop()
+    return duration
+
+
+def main() -> None:
+    rows = []
+    for shards in SHARDS:
+        duration = bench_shards(shards)
+        rows.append((shards, fmt_duration(duration), f'{JOBS / duration:,.0f}'))
+
+    print_table(('shards', f'{JOBS:,d} jobs', 'jobs/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
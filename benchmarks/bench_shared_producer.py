@@ -0,0 +1,85 @@
+"""Simulate a month of many jobs with the same trigger, once with a shared producer and once with a producer per job
+
+Run from the repository root with ``python -m benchmarks.bench_shared_producer``
+"""
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self, override
+from whenever import ZonedDateTime
+
+from benchmarks.helper import fmt_duration, print_table
+from eascheduler import set_location, setup_holidays
+from eascheduler.builder import FilterBuilder, JobBuilder, TriggerBuilder
+from eascheduler.executor import SyncExecutor
+from eascheduler.producers.base import DateTimeProducerBase
+from eascheduler.schedulers.simulated import SimulatedScheduler
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from whenever import Instant
+
+
+JOBS = 2_000
+DAYS = 31
+
+
+class _NotShared(DateTimeProducerBase):
+    """Wraps a producer and hides its key, so every job evaluates its own producer"""
+
+    __slots__ = ('_producer', )
+
+    def __init__(self, producer: DateTimeProducerBase) -> None:
+        super().__init__()
+        self._producer = producer
+
+    @override
+    def copy(self) -> Self:
+        return self.__class__(self._producer.copy())
+
+    @override
+    def shared_key(self) -> Hashable | None:
+        return None
+
+    @override
+    def get_next(self, dt: Instant) -> Instant:
+        return self._producer.get_next(dt)
+
+
+def bench(*, shared: bool) -> tuple[int, float, SimulatedScheduler]:
+    start = ZonedDateTime.from_system_tz(2001, 1, 1, 12).to_instant()
+    scheduler = SimulatedScheduler(start, record=False)
+    builder = JobBuilder(scheduler, SyncExecutor)
+
+    for _ in range(JOBS):
+        trigger = TriggerBuilder.sunset().offset(-900).only_on(FilterBuilder.work_days())
+        if not shared:
+            trigger._producer = _NotShared(trigger._producer)
+        builder.at(trigger, lambda: None)
+
+    begin = perf_counter()
+    executed = scheduler.run_until(start.add(hours=24 * DAYS))
+    duration = perf_counter() - begin
+    return executed, duration, scheduler
+
+
+def main() -> None:
+    set_location(52.51870523376821, 13.376072914752532)
+    setup_holidays('DE', 'BE')
+
+    rows = []
+    for name, shared in (('producer per job', False), ('shared producer', True)):
+        executed, duration, scheduler = bench(shared=shared)
+        pool = scheduler.producer_pool
+        rows.append((name, f'{executed:,d}', fmt_duration(duration), f'{pool.calls:,d}', f'{pool.evaluations:,d}'))
+        scheduler.remove_all()
+
+    print_table(('producers', 'executions', 'duration', 'shared calls', 'evaluations'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Simulate a year of job executions on the SimulatedScheduler to measure the throughput of the producers
+
+Run from the repository root with ``python -m benchmarks.bench_simulated_year``
+"""
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from whenever import ZonedDateTime
+
+from benchmarks.helper import fmt_duration, print_table
+from eascheduler import set_location, setup_holidays
+from eascheduler.builder import FilterBuilder, JobBuilder, TriggerBuilder
+from eascheduler.executor import SyncExecutor
+from eascheduler.schedulers.simulated import SimulatedScheduler
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from eascheduler.builder.triggers import TriggerObject
+
+
+YEAR = 2001
+
+
+TRIGGERS: dict[str, Callable[[], TriggerObject]] = {
+    'interval 1min': lambda: TriggerBuilder.interval(None, 60),
+    'time hourly': lambda: TriggerBuilder.group(*(TriggerBuilder.time(f'{h:02d}:00:00') for h in range(24))),
+    'time work days': lambda: TriggerBuilder.time('08:00:00').only_on(FilterBuilder.work_days()),
+    'sunrise': TriggerBuilder.sunrise,
+    'sunset offset': lambda: TriggerBuilder.sunset().offset(-1_800).earliest('17:00:00').latest('21:00:00'),
+    'sun elevation': lambda: TriggerBuilder.sun_elevation(10, 'rising'),
+}
+
+
+def bench_trigger(factory: Callable[[], TriggerObject]) -> tuple[int, float]:
+    start = ZonedDateTime.from_system_tz(YEAR, 1, 1).to_instant()
+    scheduler = SimulatedScheduler(start, record=False)
+    builder = JobBuilder(scheduler, SyncExecutor)
+    builder.at(factory(), lambda: None)
+
+    begin = perf_counter()
+    executed = scheduler.run_until(ZonedDateTime.from_system_tz(YEAR + 1, 1, 1).to_instant())
+    duration = perf_counter() - begin
+
+    scheduler.remove_all()
+    return executed, duration
+
+
+def main() -> None:
+    set_location(52.51870523376821, 13.376072914752532)
+    setup_holidays('DE', 'BE')
+
+    rows = []
+    for name, factory in TRIGGERS.items():
+        executed, duration = bench_trigger(factory)
+        rows.append((name, f'{executed:,d}', fmt_duration(duration), f'{executed / duration:,.0f}'))
+
+    print_table(('trigger', 'executions', 'duration', 'executions/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Compare the sort keys for the heap of the job queue
+
+- ``Instant``: heap entries are ``[next_run, counter, job]`` lists which compare the Instant
+- ``int ns``: heap entries are ``[next_run_ns, counter, job]`` lists which compare the nanosecond timestamp
+- ``composite int``: the heap only contains plain integers ``next_run_ns << 64 + counter``
+
+Run from the repository root with ``python -m benchmarks.bench_sort_key``
+"""
+from __future__ import annotations
+
+from heapq import heappop, heappush
+
+from whenever import Instant
+
+from benchmarks.helper import fmt_duration, print_table, spread_instants, timed
+
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def bench_list_entries(keys: list) -> float:
+    def run() -> None:
+        heap: list = []
+        for i, key in enumerate(keys):
+            heappush(heap, [key, i, None])
+        while heap:
+            heappop(heap)
+
+    return timed(run)
+
+
+def bench_composite(keys: list[int]) -> float:
+    def run() -> None:
+        heap: list[int] = []
+        jobs: dict[int, None] = {}
+        for i, key in enumerate(keys):
+            composite = (key << 64) + i
+            jobs[composite] = None
+            heappush(heap, composite)
+        while heap:
+            jobs.pop(heappop(heap))
+
+    return timed(run)
+
+
+def main() -> None:
+    rows = []
+    for size in SIZES:
+        instants = spread_instants(Instant.now(), size, 3600)
+        nanos = [i.timestamp_nanos() for i in instants]
+
+        base = bench_list_entries(instants)
+        for name, duration in (
+            ('Instant', base),
+            ('int ns', bench_list_entries(nanos)),
+            ('composite int', bench_composite(nanos))
+        ):
+            rows.append((f'{size:,d}', name, fmt_duration(duration), f'{base / duration:.2f}x'))
+
+    print_table(('jobs', 'key', 'heap push+pop', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare the startup time when many jobs are created one by one and in bulk
+
+Run from the repository root with ``python -m benchmarks.bench_startup``
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from whenever import Instant
+
+from benchmarks.helper import fmt_duration, print_table, spread_instants, timed
+from eascheduler.builder import JobBuilder
+from eascheduler.executor import SyncExecutor
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.job_queue import DequeJobQueue, HeapJobQueue
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from eascheduler.schedulers.job_queue import JobQueueBase
+
+
+SIZES = (1_000, 10_000, 50_000)
+SPREAD_SECS = 86_400
+
+
+def bench_startup(queue: Callable[[], JobQueueBase], count: int, *, bulk: bool) -> tuple[float, int]:
+    instants = spread_instants(Instant.now().add(hours=1), count, SPREAD_SECS)
+    scheduler: AsyncScheduler | None = None
+
+    def setup() -> None:
+        nonlocal scheduler
+        if scheduler is not None:
+            scheduler.remove_all()
+        scheduler = AsyncScheduler(queue=queue())
+
+    def create() -> None:
+        builder = JobBuilder(scheduler, SyncExecutor)
+        if not bulk:
+            for instant in instants:
+                builder.once(instant, lambda: None)
+            return None
+
+        with builder.bulk():
+            for instant in instants:
+                builder.once(instant, lambda: None)
+
+    duration = timed(create, setup=setup)
+    armed = scheduler.timer_stats.armed
+    scheduler.remove_all()
+    return duration, armed
+
+
+async def main() -> None:
+    rows = []
+    for size in SIZES:
+        for queue in (DequeJobQueue, HeapJobQueue):
+            for bulk in (False, True):
+                duration, armed = bench_startup(queue, size, bulk=bulk)
+                rows.append((f'{size:,d}', queue.__name__, 'bulk' if bulk else 'single', fmt_duration(duration),
+                             f'{armed:,d}'))
+
+    print_table(('jobs', 'queue', 'mode', 'duration', 'timers armed'), rows)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from whenever import Instant
+
+
+def timed(func: Callable[[], Any], *, repeat: int = 3, setup: Callable[[], Any] | None = None) -> float:
+    """Run the function multiple times and return the best duration in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def fmt_duration(secs: float) -> str:
+    if secs >= 1:
+        return f'{secs:.2f}s'
+    if secs * 1_000 >= 1:
+        return f'{secs * 1_000:.2f}ms'
+    return f'{secs * 1_000_000:.2f}us'
+
+
+def print_table(header: Iterable[str], rows: Iterable[Iterable[Any]]) -> None:
+    header = [str(h) for h in header]
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [max(len(c) for c in col) for col in zip(header, *rows, strict=True)]
+
+    print(' | '.join(h.rjust(w) for h, w in zip(header, widths, strict=True)))
+    print('-+-'.join('-' * w for w in widths))
+    for row in rows:
+        print(' | '.join(c.rjust(w) for c, w in zip(row, widths, strict=True)))
+    print()
+
+
+def spread_instants(start: Instant, count: int, secs: float) -> list[Instant]:
+    """Return count instants that are spread in a pseudo random order over the given duration"""
+    step = secs / count
+    # multiplicative hashing gives a deterministic but well mixed order
+    return [start.add(seconds=((i * 2_654_435_761) % count) * step) for i in range(count)]
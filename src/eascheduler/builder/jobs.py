@@ -1,6 +1,9 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
 from typing import Any, Final
 
+from typing_extensions import Self
+
 from eascheduler.builder.helper import (
     HINT_INSTANT,
     HINT_POS_TIMEDELTA,
@@ -9,9 +12,9 @@ from eascheduler.builder.helper import (
 )
 from eascheduler.builder.triggers import TriggerObject, _get_producer
 from eascheduler.executor import ExecutorBase
-from eascheduler.job_control import CountdownJobControl, DateTimeJobControl, OneTimeJobControl
+from eascheduler.job_control import CountdownJobControl, DateTimeJobControl, KeyedJobControl, OneTimeJobControl
 from eascheduler.job_stores import JobStoreBase
-from eascheduler.jobs import CountdownJob, DateTimeJob, OneTimeJob
+from eascheduler.jobs import CountdownJob, DateTimeJob, DebounceJob, OneTimeJob, ThrottleJob
 from eascheduler.jobs.base import IdType
 from eascheduler.schedulers import SchedulerBase
 
@@ -20,57 +23,124 @@ from eascheduler.schedulers import SchedulerBase
 class JobBuilder:
     def __init__(self, scheduler: SchedulerBase,
                  executor: Callable[[Callable, tuple, dict[str, Any]], ExecutorBase],
-                 job_store: JobStoreBase | None = None) -> None:
+                 job_store: JobStoreBase | None = None, *,
+                 countdown_scheduler: SchedulerBase | None = None) -> None:
+        """
+
+        :param scheduler: scheduler for the jobs
+        :param executor: factory for the executor of the jobs
+        :param job_store: optional job store where all created jobs will be added
+        :param countdown_scheduler: optional scheduler for the countdown jobs, e.g. a TimingWheelScheduler
+        """
         self._scheduler: Final = scheduler
         self._executor: Final = executor
         self._job_store: Final = job_store
+        self._countdown_scheduler: Final = countdown_scheduler if countdown_scheduler is not None else scheduler
+
+    @contextmanager
+    def bulk(self) -> Generator[Self, None, None]:
+        """Context manager to create many jobs at once.
+        The jobs are handed to the scheduler when the context manager exits, so the scheduler only has to
+        order the jobs and set the timer once.
+        """
+        with self._scheduler.batch(), self._countdown_scheduler.batch():
+            yield self
 
     def countdown(self, secs: HINT_POS_TIMEDELTA, coro_func: Callable[..., Awaitable[Any]],
-                  *args: Any, job_id: IdType | None = None, **kwargs: Any) -> CountdownJobControl:
+                  *args: Any, job_id: IdType | None = None, priority: int = 0, lazy_reset: bool = False,
+                  **kwargs: Any) -> CountdownJobControl:
         """Create a job that count town a certain time and then execute.
 
         :param secs: countdown time in seconds
         :param coro_func: |param_scheduled_cb|
         :param args: |param_scheduled_cb_args|
         :param job_id: |param_job_id|
+        :param priority: |param_priority|
+        :param lazy_reset: A reset only stores the new deadline and the job is queued again when the old deadline
+                           is reached. This makes resets very cheap if the countdown is reset very often.
         :param kwargs: |param_scheduled_cb_kwargs|
         :return: Created job
         """
-        job = CountdownJob(self._executor(coro_func, args, kwargs), get_pos_timedelta_secs(secs), job_id=job_id)
-        job.link_scheduler(self._scheduler)
+        job = CountdownJob(self._executor(coro_func, args, kwargs), get_pos_timedelta_secs(secs),
+                           job_id=job_id, priority=priority, lazy_reset=lazy_reset)
+        job.link_scheduler(self._countdown_scheduler)
         if self._job_store is not None:
             self._job_store.add_job(job)
         return CountdownJobControl(job)
 
+    def debounce(self, secs: HINT_POS_TIMEDELTA, coro_func: Callable[..., Awaitable[Any]],
+                 *args: Any, job_id: IdType | None = None, priority: int = 0, **kwargs: Any) -> KeyedJobControl:
+        """Create a job that runs the callback for a key once the key was not triggered for a certain time.
+        All keys share the same job, the key is passed as the first argument to the callback.
+
+        :param secs: time in seconds the key must not be triggered
+        :param coro_func: |param_scheduled_cb|
+        :param args: |param_scheduled_cb_args|
+        :param job_id: |param_job_id|
+        :param priority: |param_priority|
+        :param kwargs: |param_scheduled_cb_kwargs|
+        :return: Created job
+        """
+        job = DebounceJob(self._executor, get_pos_timedelta_secs(secs), coro_func, args, kwargs,
+                          job_id=job_id, priority=priority)
+        job.link_scheduler(self._countdown_scheduler)
+        if self._job_store is not None:
+            self._job_store.add_job(job)
+        return KeyedJobControl(job)
+
+    def throttle(self, secs: HINT_POS_TIMEDELTA, coro_func: Callable[..., Awaitable[Any]],
+                 *args: Any, job_id: IdType | None = None, priority: int = 0, **kwargs: Any) -> KeyedJobControl:
+        """Create a job that runs the callback for a key immediately and at most once in a certain time.
+        All keys share the same job, the key is passed as the first argument to the callback.
+
+        :param secs: time in seconds after a run in which further triggers of the key are ignored
+        :param coro_func: |param_scheduled_cb|
+        :param args: |param_scheduled_cb_args|
+        :param job_id: |param_job_id|
+        :param priority: |param_priority|
+        :param kwargs: |param_scheduled_cb_kwargs|
+        :return: Created job
+        """
+        job = ThrottleJob(self._executor, get_pos_timedelta_secs(secs), coro_func, args, kwargs,
+                          job_id=job_id, priority=priority)
+        job.link_scheduler(self._countdown_scheduler)
+        if self._job_store is not None:
+            self._job_store.add_job(job)
+        return KeyedJobControl(job)
+
     def once(self, instant: HINT_INSTANT, coro_func: Callable[..., Awaitable[Any]],
-             *args: Any, job_id: IdType | None = None, **kwargs: Any) -> OneTimeJobControl:
+             *args: Any, job_id: IdType | None = None, priority: int = 0, **kwargs: Any) -> OneTimeJobControl:
         """Create a job that runs once.
 
         :param instant: countdown time in seconds
         :param coro_func: |param_scheduled_cb|
         :param args: |param_scheduled_cb_args|
         :param job_id: |param_job_id|
+        :param priority: |param_priority|
         :param kwargs: |param_scheduled_cb_kwargs|
         :return: Created job
         """
-        job = OneTimeJob(self._executor(coro_func, args, kwargs), get_instant(instant), job_id=job_id)
+        job = OneTimeJob(self._executor(coro_func, args, kwargs), get_instant(instant),
+                         job_id=job_id, priority=priority)
         job.link_scheduler(self._scheduler)
         if self._job_store is not None:
             self._job_store.add_job(job)
         return OneTimeJobControl(job)
 
     def at(self, trigger: TriggerObject, coro_func: Callable[..., Awaitable[Any]],
-           *args: Any, job_id: IdType | None = None, **kwargs: Any) -> DateTimeJobControl:
+           *args: Any, job_id: IdType | None = None, priority: int = 0, **kwargs: Any) -> DateTimeJobControl:
         """Create a job that will run at a specified time.
 
         :param trigger:
         :param coro_func: |param_scheduled_cb|
         :param args: |param_scheduled_cb_args|
         :param job_id: |param_job_id|
+        :param priority: |param_priority|
         :param kwargs: |param_scheduled_cb_kwargs|
         :return: Created job
         """
-        job = DateTimeJob(self._executor(coro_func, args, kwargs), _get_producer(trigger), job_id=job_id)
+        job = DateTimeJob(self._executor(coro_func, args, kwargs), _get_producer(trigger),
+                          job_id=job_id, priority=priority, max_runs=trigger._max_runs, until=trigger._until)
         job.link_scheduler(self._scheduler)
         if self._job_store is not None:
             self._job_store.add_job(job)
@@ -38,6 +38,8 @@ from eascheduler.producers.base import DateTimeProducerBase
 
 
 if TYPE_CHECKING:
+    from whenever import Instant
+
     from eascheduler.builder.filters import FilterObject
 
 
@@ -46,12 +48,22 @@ class TriggerObject:
     def __init__(self, producer: DateTimeProducerBase) -> None:
         self._producer: Final[DateTimeProducerBase] = producer
 
+        # The limits are not part of the producer because they depend on the runs of the job
+        self._max_runs: int | None = None
+        self._until: Instant | None = None
+
+    def _new(self, producer: DateTimeProducerBase) -> Self:
+        obj = self.__class__(producer)
+        obj._max_runs = self._max_runs
+        obj._until = self._until
+        return obj
+
     def offset(self, offset: HINT_TIMEDELTA) -> Self:
         """Offset the time returned by the trigger
 
         :param offset: The offset (positive or negative)
         """
-        return self.__class__(
+        return self._new(
             OffsetProducerOperation(_get_producer(self), get_timedelta(offset).in_seconds())
         )
 
@@ -64,7 +76,7 @@ class TriggerObject:
         :param clock_forward: How to handle the transition when the clock moves forward
         :param clock_backward: How to handle the transition when the clock moves backward
         """
-        return self.__class__(
+        return self._new(
             EarliestProducerOperation(
                 _get_producer(self),
                 get_time_replacer(earliest, clock_forward=clock_forward, clock_backward=clock_backward)
@@ -80,7 +92,7 @@ class TriggerObject:
         :param clock_forward: How to handle the transition when the clock moves forward
         :param clock_backward: How to handle the transition when the clock moves backward
         """
-        return self.__class__(
+        return self._new(
             LatestProducerOperation(
                 _get_producer(self),
                 get_time_replacer(latest, clock_forward=clock_forward, clock_backward=clock_backward)
@@ -93,7 +105,7 @@ class TriggerObject:
         :param low: The lower bound of the jitter
         :param high: The upper bound of the jitter. If not specified the jitter will be 0 .. low
         """
-        return self.__class__(
+        return self._new(
             JitterProducerOperation(
                 _get_producer(self),
                 get_timedelta(low).in_seconds(), get_timedelta(high).in_seconds() if high is not None else None
@@ -112,6 +124,28 @@ class TriggerObject:
 
     only_at = only_on
 
+    def max_runs(self, runs: int) -> Self:
+        """Limit how often the job will run. The job finishes after the last run.
+
+        :param runs: The maximum number of runs
+        """
+        if not isinstance(runs, int) or runs < 1:
+            msg = 'Max runs must be an int >= 1'
+            raise ValueError(msg)
+
+        obj = self._new(_get_producer(self))
+        obj._max_runs = runs
+        return obj
+
+    def until(self, until: HINT_INSTANT) -> Self:
+        """Set the time after which the job will not run any more. The job finishes after the last run.
+
+        :param until: The job will not run after this time
+        """
+        obj = self._new(_get_producer(self))
+        obj._until = get_instant(until)
+        return obj
+
 
 # noinspection PyProtectedMember
 class TriggerBuilder:
@@ -164,6 +198,10 @@ class TriggerBuilder:
         :param builders: Triggers that should be grouped together
         """
 
+        for b in builders:
+            if isinstance(b, TriggerObject) and (b._max_runs is not None or b._until is not None):
+                msg = 'Max runs and until can only be set on the trigger of the job and not on grouped triggers'
+                raise ValueError(msg)
         return TriggerObject(GroupProducer([_get_producer(b) for b in builders]))
 
     @staticmethod
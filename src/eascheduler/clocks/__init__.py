@@ -0,0 +1,3 @@
+from .base import SYSTEM_CLOCK, ClockBase, SystemClock
+from .loop import CoarseClock, LoopClock
+from .virtual import VirtualClock
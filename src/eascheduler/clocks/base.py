@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Final
+
+from typing_extensions import override
+from whenever import Instant
+
+
+class ClockBase:
+    """Source of the current time for the schedulers and the jobs"""
+
+    __slots__ = ()
+
+    def now(self) -> Instant:
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s}>'
+
+
+class SystemClock(ClockBase):
+    __slots__ = ()
+
+    @override
+    def now(self) -> Instant:
+        return Instant.now()
+
+
+SYSTEM_CLOCK: Final = SystemClock()
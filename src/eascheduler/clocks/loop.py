@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from threading import get_ident
+from typing import Final
+
+from typing_extensions import override
+from whenever import Instant
+
+from eascheduler.clocks.base import ClockBase
+
+
+class CoarseClock(ClockBase):
+    """Clock which reads the system time only once per event loop iteration.
+    All reads during the same iteration (e.g. a scheduler tick) return the same time.
+    Reads from other threads are not cached and always return the current system time."""
+
+    __slots__ = ('_invalidate', '_loop', '_now', '_thread')
+
+    def __init__(self, event_loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+
+        :param event_loop: event loop, if not provided the running loop will be used
+        """
+        self._loop: Final = event_loop if event_loop is not None else asyncio.get_running_loop()
+        self._now: Instant | None = None
+        self._invalidate: Final = self._clear
+
+        # Comparing the thread id is much cheaper than asyncio.get_running_loop() on every read.
+        # If the loop is not running yet, the thread is known when it runs the first callback.
+        self._thread: int | None = None
+        if event_loop is None:
+            self._bind()
+        else:
+            self._loop.call_soon_threadsafe(self._bind)
+
+    def _bind(self) -> None:
+        self._thread = get_ident()
+
+    def _clear(self) -> None:
+        self._now = None
+
+    @override
+    def now(self) -> Instant:
+        # The invalidation can only be scheduled without a lock from the thread of the loop
+        if get_ident() != self._thread:
+            return Instant.now()
+
+        if (now := self._now) is None:
+            self._now = now = Instant.now()
+            self._loop.call_soon(self._invalidate)
+        return now
+
+
+class LoopClock(ClockBase):
+    """Clock which derives the time from the monotonic time of the event loop, so it runs in lockstep with the
+    timers of the loop. It is synchronized with the system time in a fixed interval, so changes of the system time
+    are only picked up with the next synchronization."""
+
+    __slots__ = ('_loop', '_ref_instant', '_ref_loop', '_sync_interval')
+
+    def __init__(self, event_loop: asyncio.AbstractEventLoop | None = None, *, sync_interval: float = 60) -> None:
+        """
+
+        :param event_loop: event loop, if not provided the running loop will be used
+        :param sync_interval: interval in seconds in which the clock is synchronized with the system time
+        """
+        if sync_interval <= 0:
+            msg = 'Sync interval must be positive'
+            raise ValueError(msg)
+
+        self._loop: Final = event_loop if event_loop is not None else asyncio.get_running_loop()
+        self._sync_interval: Final = sync_interval
+        self._ref_loop: float = 0
+        self._ref_instant: Instant = Instant.now()
+        self.sync()
+
+    def sync(self) -> None:
+        self._ref_loop = self._loop.time()
+        self._ref_instant = Instant.now()
+
+    @override
+    def now(self) -> Instant:
+        if (diff := self._loop.time() - self._ref_loop) >= self._sync_interval:
+            self.sync()
+            return self._ref_instant
+        return self._ref_instant.add(seconds=diff)
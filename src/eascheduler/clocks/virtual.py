@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing_extensions import override
+from whenever import Instant
+
+from eascheduler.clocks.base import ClockBase
+
+
+class VirtualClock(ClockBase):
+    """Clock which only moves forward when it is advanced, e.g. to simulate schedules"""
+
+    __slots__ = ('_now', )
+
+    def __init__(self, start: Instant | None = None) -> None:
+        self._now: Instant = start if start is not None else Instant.now()
+
+    @override
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} {self._now}>'
+
+    @override
+    def now(self) -> Instant:
+        return self._now
+
+    def set(self, instant: Instant) -> None:
+        if instant < self._now:
+            msg = 'Virtual clock can not go backwards'
+            raise ValueError(msg)
+        self._now = instant
+
+    def advance(self, secs: float) -> None:
+        if secs < 0:
+            msg = 'Virtual clock can not go backwards'
+            raise ValueError(msg)
+        self._now = self._now.add(seconds=secs)
@@ -1 +1 @@
-from .base import AsyncExecutor, ExecutorBase, SyncExecutor
+from .base import AsyncExecutor, ExecutorBase, SyncExecutor, ThreadExecutor
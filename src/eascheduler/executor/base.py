@@ -1,4 +1,5 @@
 from collections.abc import Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Final
 
 from typing_extensions import override
@@ -8,12 +9,16 @@ from eascheduler.task_managers import ParallelTaskManager, TaskManagerBase
 
 
 class ExecutorBase:
+    __slots__ = ()
+
     def execute(self) -> None:
         raise NotImplementedError()
 
 
 # Sync e.g. for testing
 class SyncExecutor(ExecutorBase):
+    __slots__ = ('_args', '_func', '_kwargs')
+
     def __init__(self, func: Callable[..., Any], args: Iterable = (), kwargs: Mapping[str, Any] | None = None) -> None:
         self._func: Final = func
         self._args: Final = args
@@ -31,6 +36,8 @@ DEFAULT_TASK_MANAGER: TaskManagerBase = ParallelTaskManager()
 
 
 class AsyncExecutor(ExecutorBase):
+    __slots__ = ('_args', '_func', '_kwargs', 'task_manager')
+
     def __init__(self, coro_func: Callable[..., Awaitable[Any]],
                  args: Iterable = (), kwargs: Mapping[str, Any] | None = None,
                  task_manager: TaskManagerBase | None = None) -> None:
@@ -49,3 +56,39 @@ class AsyncExecutor(ExecutorBase):
     @override
     def execute(self) -> None:
         self.task_manager.create_task(self._execute())
+
+
+DEFAULT_THREAD_POOL: ThreadPoolExecutor | None = None
+
+
+def get_default_thread_pool() -> ThreadPoolExecutor:
+    global DEFAULT_THREAD_POOL
+
+    if DEFAULT_THREAD_POOL is None:
+        DEFAULT_THREAD_POOL = ThreadPoolExecutor(thread_name_prefix='EAScheduler')
+    return DEFAULT_THREAD_POOL
+
+
+# Threaded, e.g. for the ThreadedScheduler
+class ThreadExecutor(ExecutorBase):
+    __slots__ = ('_args', '_func', '_kwargs', 'pool')
+
+    def __init__(self, func: Callable[..., Any],
+                 args: Iterable = (), kwargs: Mapping[str, Any] | None = None,
+                 pool: ThreadPoolExecutor | None = None) -> None:
+        self._func: Final = func
+        self._args: Final = args
+        self._kwargs: Final = kwargs if kwargs is not None else {}
+
+        self.pool: Final = pool
+
+    def _execute(self) -> None:
+        try:
+            self._func(*self._args, **self._kwargs)
+        except Exception as e:
+            process_exception(e)
+
+    @override
+    def execute(self) -> None:
+        pool = self.pool if self.pool is not None else get_default_thread_pool()
+        pool.submit(self._execute)
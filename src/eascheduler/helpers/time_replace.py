@@ -74,6 +74,9 @@ class TimeReplacer:
             return NotImplemented
         return self._time == other._time and self._skipped == other._skipped and self._repeated == other._repeated
 
+    def __hash__(self) -> int:
+        return hash((self._time, self._skipped, self._repeated))
+
     def __repr__(self) -> str:
         return (f'<{self.__class__.__name__} {self._time!s}'
                 f' if_skipped={self._skipped.value:s} if_repeated={self._repeated.value:s}>')
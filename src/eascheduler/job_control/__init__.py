@@ -1,3 +1,4 @@
 from .job_countdown import CountdownJobControl
 from .job_datetime import DateTimeJobControl
+from .job_keyed import KeyedJobControl
 from .job_onetime import OneTimeJobControl
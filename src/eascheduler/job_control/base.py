@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 
 from typing_extensions import Self
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 
 class BaseControl:
+    __slots__ = ('_job', )
+
     _job: JobBase
 
     def __eq__(self, other: object) -> bool:
@@ -20,10 +23,17 @@ class BaseControl:
             return False
         return self._job is other._job
 
+    def _lock(self) -> AbstractContextManager:
+        # The job might be run from another thread, e.g. by the ThreadedScheduler or the ShardedScheduler
+        if (scheduler := self._job._scheduler) is None:
+            return nullcontext()
+        return scheduler.job_lock(self._job)
+
     def cancel(self: Self) -> Self:
         """Cancel the job"""
 
-        self._job.job_finish()
+        with self._lock():
+            self._job.job_finish()
         return self
 
     @property
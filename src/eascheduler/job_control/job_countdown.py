@@ -2,19 +2,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Final
 
-from typing_extensions import Self
+from typing_extensions import Self, override
 
 from .base import BaseControl
 
 
 if TYPE_CHECKING:
+    from datetime import datetime as dt_datetime
+
     from eascheduler.jobs import CountdownJob
 
 
 class CountdownJobControl(BaseControl):
+    __slots__ = ()
+
     def __init__(self, job: CountdownJob) -> None:
         self._job: Final[CountdownJob] = job  # type: ignore[misc]
 
+    @property
+    @override
+    def next_run_datetime(self) -> dt_datetime | None:
+        """Get the next run time as a naive datetime object (without timezone set) or None if not scheduled"""
+
+        if (nr := self._job.deadline) is None:
+            return None
+        return nr.to_system_tz().to_plain().py_datetime()
+
     def set_countdown(self, secs: float) -> Self:
         """Set the countdown time
 
@@ -25,10 +38,12 @@ class CountdownJobControl(BaseControl):
 
     def stop(self) -> Self:
         """Stop the countdown"""
-        self._job.job_pause()
+        with self._lock():
+            self._job.job_pause()
         return self
 
     def reset(self) -> Self:
         """Start the countdown again"""
-        self._job.reset()
+        with self._lock():
+            self._job.reset()
         return self
@@ -12,15 +12,19 @@ if TYPE_CHECKING:
 
 
 class DateTimeJobControl(BaseControl):
+    __slots__ = ()
+
     def __init__(self, job: DateTimeJob) -> None:
         self._job: Final = job  # type: ignore[misc]
 
     def pause(self) -> Self:
         """Stop executing this job"""
-        self._job.job_pause()
+        with self._lock():
+            self._job.job_pause()
         return self
 
     def resume(self) -> Self:
         """Resume executing this job"""
-        self._job.job_resume()
+        with self._lock():
+            self._job.job_resume()
         return self
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self
+
+from .base import BaseControl
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    from eascheduler.jobs.job_keyed import KeyedJobBase
+
+
+class KeyedJobControl(BaseControl):
+    __slots__ = ()
+
+    def __init__(self, job: KeyedJobBase) -> None:
+        self._job: Final[KeyedJobBase] = job  # type: ignore[misc]
+
+    def trigger(self, key: Hashable) -> Self:
+        """Trigger the job for the key
+
+        :param key: key for which the job is triggered, it will be passed to the callback
+        """
+        with self._lock():
+            self._job.trigger(key)
+        return self
+
+    def discard(self, key: Hashable) -> bool:
+        """Remove the key so the callback will not be run for the key
+
+        :return: True if the key was removed
+        """
+        with self._lock():
+            return self._job.discard(key)
+
+    @property
+    def pending(self) -> int:
+        """Get the number of keys which are currently waiting"""
+        return len(self._job)
+
+    @property
+    def suppressed(self) -> Mapping[Hashable, int]:
+        """Get the number of suppressed triggers for every pending key"""
+        return MappingProxyType(self._job.suppressed)
@@ -10,5 +10,7 @@ if TYPE_CHECKING:
 
 
 class OneTimeJobControl(BaseControl):
+    __slots__ = ()
+
     def __init__(self, job: OneTimeJob) -> None:
         self._job: Final = job  # type: ignore[misc]
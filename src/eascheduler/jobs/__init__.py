@@ -1,3 +1,5 @@
 from .job_countdown import CountdownJob
 from .job_datetime import DateTimeJob
+from .job_debounce import DebounceJob
 from .job_onetime import OneTimeJob
+from .job_throttle import ThrottleJob
@@ -14,6 +14,7 @@ from eascheduler.jobs.event_handler import JobCallbackHandler
 if TYPE_CHECKING:
     from eascheduler.executor import ExecutorBase
     from eascheduler.schedulers import SchedulerBase
+    from eascheduler.schedulers.misfire import MisfirePolicy
 
 IdType = TypeVar('IdType', bound=Hashable)
 
@@ -24,6 +25,10 @@ def _default_job_id_func(job: JobBase) -> Hashable:
 
 JOB_ID_FUNC: Callable[[JobBase], Hashable] = _default_job_id_func
 
+# The priority is part of the sort key of the job queue, so it has to fit in 16 bits
+PRIORITY_MIN: Final = -(2 ** 15)
+PRIORITY_MAX: Final = 2 ** 15 - 1
+
 
 class JobStatusEnum(str, Enum):
     CREATED = 'created'
@@ -54,10 +59,19 @@ STATUS_FINISHED: Final = JobStatusEnum.FINISHED
 
 
 class JobBase(Generic[IdType]):
-    def __init__(self, executor: ExecutorBase, *, job_id: IdType | None = None) -> None:
+    __slots__ = ('_id', '_on_finished', '_on_update', '_scheduler',
+                 'executor', 'last_run', 'misfire_policy', 'next_run', 'priority', 'status')
+
+    def __init__(self, executor: ExecutorBase, *, job_id: IdType | None = None, priority: int = 0) -> None:
         super().__init__()
+        if not isinstance(priority, int) or not PRIORITY_MIN <= priority <= PRIORITY_MAX:
+            msg = f'Priority must be an int between {PRIORITY_MIN:d} and {PRIORITY_MAX:d}'
+            raise ValueError(msg)
+
         self.executor: Final = executor
         self._id: Final[IdType] = job_id if job_id is not None else JOB_ID_FUNC(self)
+        # Jobs with a higher priority run first if they are due at the same time
+        self.priority: Final = priority
         self._scheduler: SchedulerBase | None = None
 
         # Job status
@@ -67,15 +81,29 @@ class JobBase(Generic[IdType]):
         self.next_run: Instant | None = None
         # for information only
         self.last_run: Instant | None = None
+        # overwrites the misfire policy of the scheduler
+        self.misfire_policy: MisfirePolicy | None = None
 
-        # callbacks
-        self.on_update: Final = JobCallbackHandler()       # running | paused -> running | paused
-        self.on_finished: Final = JobCallbackHandler()     # running | paused -> finished
+        # callbacks, they are only created when they are used because most jobs don't have callbacks
+        self._on_update: JobCallbackHandler | None = None      # running | paused -> running | paused
+        self._on_finished: JobCallbackHandler | None = None    # running | paused -> finished
 
     @property
     def id(self) -> IdType:
         return self._id
 
+    @property
+    def on_update(self) -> JobCallbackHandler:
+        if (handler := self._on_update) is None:
+            self._on_update = handler = JobCallbackHandler()
+        return handler
+
+    @property
+    def on_finished(self) -> JobCallbackHandler:
+        if (handler := self._on_finished) is None:
+            self._on_finished = handler = JobCallbackHandler()
+        return handler
+
     def link_scheduler(self, scheduler: SchedulerBase) -> Self:
         if self._scheduler is scheduler:
             return self
@@ -86,34 +114,77 @@ class JobBase(Generic[IdType]):
 
         self._scheduler = scheduler
         self.update_first()
-        self._scheduler.add_job(self)
+        # The job might already be finished, e.g. if it has an end which is in the past
+        scheduler.add_job(self)
         return self
 
-    def set_next_run(self, next_run: Instant | None) -> Self:
+    def _now(self) -> Instant:
+        # Read the time from the clock of the scheduler, so the job can be simulated
+        if (scheduler := self._scheduler) is None:
+            return Instant.now()
+        return scheduler.clock.now()
+
+    def set_next_run(self, next_run: Instant | None, now: Instant | None = None) -> Self:
         if next_run is None:
             self.next_run = next_run
             self.status = STATUS_PAUSED
         else:
-            if next_run < Instant.now().subtract(milliseconds=100):
+            if next_run < (now if now is not None else self._now()).subtract(milliseconds=100):
                 raise ScheduledRunInThePastError()
 
             self.next_run = next_run
             self.status = STATUS_RUNNING
 
         # trigger callbacks
-        self.on_update.run(self)
+        if (handler := self._on_update) is not None:
+            handler.run(self)
         return self
 
     def update_first(self) -> None:
         self.update_next()
 
-    def update_next(self) -> None:
+    def update_next(self, now: Instant | None = None) -> None:
         raise NotImplementedError()
 
-    def execute(self) -> JobStatusEnum:
+    def update_postponed(self, now: Instant) -> bool:  # noqa: ARG002
+        """Called by the scheduler before the job is run. Jobs can move their next run without updating the queue.
+        If the job was postponed the next run is updated and the scheduler queues the job again instead of running it.
+
+        :param now: time of the scheduler tick
+        :return: True if the job was postponed
+        """
+        return False
+
+    def run(self, now: Instant | None = None) -> None:  # noqa: ARG002
+        """Run the job without calculating the next run
+
+        :param now: time of the scheduler tick, if not provided the current time will be used
+        """
         self.executor.execute()
-        self.last_run = Instant.now()
-        self.update_next()
+
+    def execute(self, now: Instant | None = None) -> JobStatusEnum:
+        """Run the job and calculate the next run
+
+        :param now: time of the scheduler tick, if not provided the current time will be used
+        """
+        self.run(now)
+        return self.update_after_run(now)
+
+    def update_after_run(self, now: Instant | None = None) -> JobStatusEnum:
+        """Set the last run and calculate the next run after the job was executed
+
+        :param now: time of the scheduler tick, if not provided the current time will be used
+        """
+        if now is None:
+            now = self._now()
+        self.last_run = now
+
+        # The scheduler might run the job slightly before the next run (coalescing),
+        # so the next run has to be calculated from the planned run, otherwise the job would run twice
+        if (next_run := self.next_run) is not None and next_run > now:
+            now = next_run
+
+        self.update_next(now)
         return self.status
 
     def __lt__(self, other_job: JobBase) -> bool:
@@ -124,7 +195,7 @@ class JobBase(Generic[IdType]):
             return True
         if (this := self.next_run) is None:
             return False
-        return this < other
+        return this < other or (this == other and self.priority > other_job.priority)
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} id={self.id!r} status={self.status.value} next_run={self.next_run}>'
@@ -134,13 +205,18 @@ class JobBase(Generic[IdType]):
             raise JobAlreadyFinishedError()
 
         self._scheduler.remove_job(self)
+        self._set_finished()
+        return self
+
+    def _set_finished(self) -> None:
+        # The scheduler calls this directly when it removes all jobs at once
         self._scheduler = None
 
         self.status = STATUS_FINISHED
         self.next_run = None
 
-        self.on_finished.run(self)
-        return self
+        if (handler := self._on_finished) is not None:
+            handler.run(self)
 
     def job_pause(self) -> Self:
         if self.status is STATUS_FINISHED:
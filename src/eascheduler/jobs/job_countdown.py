@@ -1,26 +1,42 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from typing_extensions import Self, override
-from whenever import Instant
 
 from eascheduler.errors.errors import JobNotLinkedToSchedulerError
-from eascheduler.jobs.base import IdType, JobBase
+from eascheduler.jobs.base import STATUS_RUNNING, IdType, JobBase
 
 
 if TYPE_CHECKING:
+    from whenever import Instant
+
     from eascheduler.executor import ExecutorBase
 
 
 class CountdownJob(JobBase):
-    def __init__(self, executor: ExecutorBase, secs: float, *, job_id: IdType | None = None) -> None:
-        super().__init__(executor, job_id=job_id)
+    __slots__ = ('_lazy_reset', '_postponed', '_seconds')
+
+    def __init__(self, executor: ExecutorBase, secs: float, *,
+                 job_id: IdType | None = None, priority: int = 0, lazy_reset: bool = False) -> None:
+        super().__init__(executor, job_id=job_id, priority=priority)
         self._seconds: float = 0
         self.set_countdown(secs)    # Validate and set the countdown
 
+        # With lazy resets only the new deadline is stored and the queue entry is kept.
+        # When the old entry is due the scheduler queues the job again with the new deadline.
+        self._lazy_reset: Final = lazy_reset
+        self._postponed: Instant | None = None
+
+    @property
+    def deadline(self) -> Instant | None:
+        """The time when the countdown will run out, this includes lazy resets"""
+        if (postponed := self._postponed) is not None:
+            return postponed
+        return self.next_run
+
     @override
-    def update_next(self) -> None:
+    def update_next(self, now: Instant | None = None) -> None:
         self.set_next_run(None)
 
     def set_countdown(self, secs: float) -> None:
@@ -30,11 +46,34 @@ class CountdownJob(JobBase):
             raise ValueError()
         self._seconds = secs
 
+    @override
+    def set_next_run(self, next_run: Instant | None, now: Instant | None = None) -> Self:
+        self._postponed = None
+        return super().set_next_run(next_run, now)
+
+    @override
+    def update_postponed(self, now: Instant) -> bool:
+        if (postponed := self._postponed) is None or postponed <= now:
+            self._postponed = None
+            return False
+
+        self.set_next_run(postponed, now)
+        return True
+
     def reset(self) -> None:
         if (scheduler := self._scheduler) is None:
             raise JobNotLinkedToSchedulerError()
 
-        self.set_next_run(Instant.now().add(seconds=self._seconds))
+        deadline = scheduler.clock.now().add(seconds=self._seconds)
+
+        # The deadline of a countdown only moves forward, so the queued entry will come due before the new deadline.
+        # That's why it's enough to just store the new deadline without touching the queue.
+        if self._lazy_reset and self.status is STATUS_RUNNING and \
+                (next_run := self.next_run) is not None and next_run <= deadline:
+            self._postponed = deadline
+            return None
+
+        self.set_next_run(deadline)
         scheduler.update_job(self)
 
     @override
@@ -2,28 +2,69 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Final
 
-from typing_extensions import override
-from whenever import Instant
+from typing_extensions import Self, override
 
 from eascheduler.errors.errors import JobNotLinkedToSchedulerError
 from eascheduler.jobs.base import IdType, JobBase
 
 
 if TYPE_CHECKING:
+    from whenever import Instant
+
     from eascheduler.executor import ExecutorBase
+    from eascheduler.jobs.base import JobStatusEnum
     from eascheduler.producers.base import DateTimeProducerBase
+    from eascheduler.schedulers.base import SchedulerBase
 
 
 class DateTimeJob(JobBase):
-    def __init__(self, executor: ExecutorBase, producer: DateTimeProducerBase, *, job_id: IdType | None = None) -> None:
-        super().__init__(executor, job_id=job_id)
+    __slots__ = ('_producer', 'max_runs', 'producer', 'runs', 'until')
+
+    def __init__(self, executor: ExecutorBase, producer: DateTimeProducerBase, *,  # noqa: PLR0913
+                 job_id: IdType | None = None, priority: int = 0,
+                 max_runs: int | None = None, until: Instant | None = None) -> None:
+        if max_runs is not None and (not isinstance(max_runs, int) or max_runs < 1):
+            msg = 'Max runs must be an int >= 1'
+            raise ValueError(msg)
+
+        super().__init__(executor, job_id=job_id, priority=priority)
 
         self.producer: Final = producer
+        # producer which is evaluated, it's replaced by the shared producer when the job is linked to a scheduler
+        self._producer: DateTimeProducerBase = producer
+
+        # The job finishes itself when one of the limits is reached
+        self.max_runs: Final = max_runs
+        self.until: Final = until
+        self.runs: int = 0
+
+    @override
+    def link_scheduler(self, scheduler: SchedulerBase) -> Self:
+        if self._scheduler is None:
+            # Jobs with the same trigger use the same producer, so it's evaluated only once for all of them
+            self._producer = scheduler.producer_pool.share(self.producer)
+        return super().link_scheduler(scheduler)
+
+    @override
+    def update_after_run(self, now: Instant | None = None) -> JobStatusEnum:
+        self.runs += 1
+        return super().update_after_run(now)
 
     @override
-    def update_next(self) -> None:
+    def update_next(self, now: Instant | None = None) -> None:
         if self._scheduler is None:
             raise JobNotLinkedToSchedulerError()
 
-        next_run = self.producer.get_next(Instant.now())
-        self.set_next_run(next_run)
+        if (max_runs := self.max_runs) is not None and self.runs >= max_runs:
+            self.job_finish()
+            return None
+
+        if now is None:
+            now = self._now()
+        next_run = self._producer.get_next(now)
+
+        if (until := self.until) is not None and next_run > until:
+            self.job_finish()
+            return None
+
+        self.set_next_run(next_run, now)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from eascheduler.errors.errors import JobNotLinkedToSchedulerError
+from eascheduler.jobs.job_keyed import KeyedJobBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class DebounceJob(KeyedJobBase):
+    """Runs the callback for a key once there was no trigger for the key for the length of the window (trailing edge)"""
+
+    __slots__ = ()
+
+    @override
+    def trigger(self, key: Hashable) -> None:
+        if self._scheduler is None:
+            raise JobNotLinkedToSchedulerError()
+
+        deadline = self._now().timestamp_nanos() + self._window_ns
+
+        # The previous trigger of the key will not run, only the deadline is moved
+        if key in (deadlines := self._deadlines):
+            self._suppress(key)
+            deadlines[key] = deadline
+            return None
+
+        self._set_deadline(key, deadline)
+
+    @override
+    def _deadline_reached(self, key: Hashable) -> None:
+        self._run_key(key)
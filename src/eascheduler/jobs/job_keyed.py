@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING, Any, Final, NoReturn
+
+from typing_extensions import override
+from whenever import Instant
+
+from eascheduler.errors.errors import JobNotLinkedToSchedulerError
+from eascheduler.executor.base import ExecutorBase
+from eascheduler.jobs.base import IdType, JobBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Mapping
+
+
+class _KeyedExecutor(ExecutorBase):
+    """Executor of the keyed job, it processes all keys which are due"""
+
+    __slots__ = ('_job', )
+
+    def __init__(self, job: KeyedJobBase) -> None:
+        self._job: Final = job
+
+    @override
+    def execute(self) -> None:
+        self._job._process_due(None)
+
+
+class KeyedJobBase(JobBase):
+    """Job which keeps a deadline for many keys. All keys share the job and the entry in the scheduler,
+    the deadlines of the keys are kept in a heap and the job is always scheduled for the earliest deadline.
+    """
+
+    __slots__ = ('_args', '_counter', '_deadlines', '_executor_factory', '_executors', '_func', '_heap', '_kwargs',
+                 '_window_ns', 'suppressed')
+
+    def __init__(self, executor: Callable[[Callable, tuple, dict[str, Any]], ExecutorBase], secs: float,  # noqa: PLR0913
+                 func: Callable[..., Any], args: Iterable = (), kwargs: Mapping[str, Any] | None = None, *,
+                 job_id: IdType | None = None, priority: int = 0) -> None:
+        """
+
+        :param executor: factory for the executor which runs the callback for a key
+        :param secs: length of the window in seconds
+        :param func: callback which gets the key as the first argument
+        :param args: additional arguments for the callback
+        :param kwargs: keyword arguments for the callback
+        """
+        if not isinstance(secs, (int, float)):
+            raise TypeError()
+        if secs <= 0:
+            raise ValueError()
+
+        super().__init__(_KeyedExecutor(self), job_id=job_id, priority=priority)
+        self._executor_factory: Final = executor
+        self._func: Final = func
+        self._args: Final = tuple(args)
+        self._kwargs: Final = dict(kwargs) if kwargs is not None else {}
+        self._window_ns: Final = round(secs * 1_000_000_000)
+
+        # key -> current deadline as a nanosecond timestamp
+        self._deadlines: Final[dict[Hashable, int]] = {}
+        # The heap entries are not updated when the deadline of a key moves.
+        # Outdated entries are queued again with the current deadline when they come due.
+        self._heap: Final[list[tuple[int, int, Hashable]]] = []
+        self._counter: Final = count()
+
+        # key -> executor which runs the callback for the key, it's kept as long as the key is pending
+        self._executors: Final[dict[Hashable, ExecutorBase]] = {}
+
+        # key -> number of triggers that were suppressed, the key is removed together with its deadline
+        self.suppressed: Final[dict[Hashable, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def _suppress(self, key: Hashable) -> None:
+        suppressed = self.suppressed
+        suppressed[key] = suppressed.get(key, 0) + 1
+
+    def _run_key(self, key: Hashable) -> None:
+        if (executor := self._executors.get(key)) is None:
+            executor = self._executors[key] = self._executor_factory(self._func, (key, *self._args), self._kwargs)
+        executor.execute()
+
+    def _remove_key(self, key: Hashable) -> None:
+        self.suppressed.pop(key, None)
+        self._executors.pop(key, None)
+
+    def _set_deadline(self, key: Hashable, deadline: int) -> None:
+        self._deadlines[key] = deadline
+        heappush(self._heap, (deadline, next(self._counter), key))
+
+        # Only the earliest deadline is scheduled, so the scheduler has to be updated only for a new first entry
+        if (next_run := self.next_run) is None or next_run.timestamp_nanos() > deadline:
+            self.set_next_run(Instant.from_timestamp_nanos(deadline))
+            self._scheduler.update_job(self)
+
+    def _deadline_reached(self, key: Hashable) -> None:
+        raise NotImplementedError()
+
+    def _process_due(self, now: Instant | None) -> None:
+        # The job might be run slightly before the planned run (coalescing),
+        # so every key that is due at the planned run is processed
+        now_ns = (now if now is not None else self._now()).timestamp_nanos()
+        if (next_run := self.next_run) is not None:
+            now_ns = max(now_ns, next_run.timestamp_nanos())
+
+        heap = self._heap
+        deadlines = self._deadlines
+        while heap and heap[0][0] <= now_ns:
+            deadline, _, key = heappop(heap)
+            if (current := deadlines.get(key)) is None:
+                continue
+            if current > deadline:
+                heappush(heap, (current, next(self._counter), key))
+                continue
+
+            del deadlines[key]
+            try:
+                self._deadline_reached(key)
+            finally:
+                self._remove_key(key)
+
+    def trigger(self, key: Hashable) -> None:
+        raise NotImplementedError()
+
+    def discard(self, key: Hashable) -> bool:
+        """Remove the key, the heap entry is removed when it comes due
+
+        :return: True if the key was removed
+        """
+        if self._deadlines.pop(key, None) is None:
+            return False
+        self._remove_key(key)
+        return True
+
+    @override
+    def run(self, now: Instant | None = None) -> None:
+        # The keys are processed with the time of the scheduler tick
+        self._process_due(now)
+
+    @override
+    def update_next(self, now: Instant | None = None) -> None:
+        if self._scheduler is None:
+            raise JobNotLinkedToSchedulerError()
+
+        if not (heap := self._heap):
+            self.set_next_run(None, now)
+            return None
+
+        if now is None:
+            now = self._now()
+        # The deadline of a key might already be reached if the job was not run, e.g. because it was skipped
+        self.set_next_run(Instant.from_timestamp_nanos(max(heap[0][0], now.timestamp_nanos())), now)
+
+    @override
+    def job_pause(self) -> NoReturn:
+        raise NotImplementedError()
+
+    @override
+    def job_resume(self) -> NoReturn:
+        raise NotImplementedError()
@@ -15,12 +15,15 @@ if TYPE_CHECKING:
 
 
 class OneTimeJob(JobBase):
-    def __init__(self, executor: ExecutorBase, execution_time: Instant, *, job_id: IdType | None = None) -> None:
-        super().__init__(executor, job_id=job_id)
+    __slots__ = ('execution_time', )
+
+    def __init__(self, executor: ExecutorBase, execution_time: Instant, *,
+                 job_id: IdType | None = None, priority: int = 0) -> None:
+        super().__init__(executor, job_id=job_id, priority=priority)
         self.execution_time: Final = execution_time
 
     @override
-    def update_next(self) -> None:
+    def update_next(self, now: Instant | None = None) -> None:
         self.job_finish()
 
     @override
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from eascheduler.errors.errors import JobNotLinkedToSchedulerError
+from eascheduler.jobs.job_keyed import KeyedJobBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class ThrottleJob(KeyedJobBase):
+    """Runs the callback for a key immediately and ignores all triggers of the key for the length of the window
+    (leading edge)"""
+
+    __slots__ = ()
+
+    @override
+    def trigger(self, key: Hashable) -> None:
+        if self._scheduler is None:
+            raise JobNotLinkedToSchedulerError()
+
+        now_ns = self._now().timestamp_nanos()
+        deadlines = self._deadlines
+
+        if (end := deadlines.get(key)) is None:
+            self._set_deadline(key, now_ns + self._window_ns)
+        elif end > now_ns:
+            # The window of the key is still open
+            self._suppress(key)
+            return None
+        else:
+            # The window is closed but the key was not processed yet, so the entry is still queued
+            deadlines[key] = now_ns + self._window_ns
+            self.suppressed.pop(key, None)
+
+        self._run_key(key)
+
+    @override
+    def _deadline_reached(self, key: Hashable) -> None:
+        # The window is closed, the key is only removed
+        pass
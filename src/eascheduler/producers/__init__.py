@@ -17,6 +17,7 @@ from .prod_operation import (
     LatestProducerOperation,
     OffsetProducerOperation,
 )
+from .prod_shared import ProducerPool, SharedProducer
 from .prod_sun import (
     DawnProducer,
     DuskProducer,
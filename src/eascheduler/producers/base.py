@@ -8,9 +8,19 @@ from eascheduler.errors import InfiniteLoopDetectedError
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Hashable
 
-    from whenever import Instant, ZonedDateTime
+    from whenever import Date, Instant, ZonedDateTime
+
+
+# Producers can cache their results, the cached results are only valid as long as the generation does not change.
+# It is changed when something that affects the results changes (e.g. the location, the holidays or the timezone).
+CACHE_GENERATION: int = 0
+
+
+def invalidate_producer_caches() -> None:
+    global CACHE_GENERATION
+    CACHE_GENERATION += 1
 
 
 class CompareEqualityBySlotValues:
@@ -29,6 +39,29 @@ class ProducerFilterBase(CompareEqualityBySlotValues):
     def allow(self, dt: ZonedDateTime) -> bool:
         raise NotImplementedError()
 
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:  # noqa: ARG002
+        """Called for a date time which is not allowed. Return the earliest date time which might be allowed,
+        so producers can skip all times in between. Return None if it's not known."""
+        return None
+
+    def allow_date(self, date: Date) -> bool | None:  # noqa: ARG002
+        """Return if the filter allows the date or None if it's not possible to decide only by the date"""
+        return None
+
+    def shared_key(self) -> Hashable | None:
+        """Return a hashable key which is the same for all filters that allow the same date times
+        or None if the filter can not be shared between jobs"""
+        return None
+
+    def next_date(self, date: Date) -> Date:
+        """Return the first date which is the same or after the given date where the filter might allow a time.
+        Producers use this to skip the dates which are not allowed without calculating a time for them."""
+        for _ in not_infinite_loop():
+            if self.allow_date(date) is not False:
+                return date
+            date = date.add(days=1)
+        return None
+
     def copy(self) -> Self:
         raise NotImplementedError()
 
@@ -47,6 +80,26 @@ class DateTimeProducerBase(CompareEqualityBySlotValues):
         Has to guarantee that the returned date time is after the given date time."""
         raise NotImplementedError()
 
+    def shared_key(self) -> Hashable | None:
+        """Return a hashable key which is the same for all producers that return the same date times.
+        Producers with the same key are shared between jobs and evaluated only once.
+        Return None if the producer can not be shared, e.g. because it has a state or returns random values."""
+        return None
+
+    def is_range_stable(self) -> bool:
+        """Return True if the producer returns the first matching date time after the given date time.
+        Then the result is also the result for every date time between the given date time and the result,
+        so it can be cached for that range. Operations (e.g. offset or jitter) don't have this property."""
+        return False
+
+    def _shared_key(self, *values: Hashable) -> Hashable | None:
+        # The key is built from the class, the filter and the values which define the producer
+        if (f := self._filter) is None:
+            return self.__class__, None, *values
+        if (filter_key := f.shared_key()) is None:
+            return None
+        return self.__class__, filter_key, *values
+
     def _copy_filter(self, obj: DTPB_TYPE) -> DTPB_TYPE:
         obj._filter = self._filter.copy() if self._filter is not None else None
         return obj
@@ -65,6 +118,11 @@ class DateTimeProducerOperationBase(DateTimeProducerBase):
     def apply_operation(self, next_dt: Instant, dt: Instant) -> Instant:
         raise NotImplementedError()
 
+    def _shared_operation_key(self, *values: Hashable) -> Hashable | None:
+        if (producer_key := self._producer.shared_key()) is None:
+            return None
+        return self._shared_key(producer_key, *values)
+
     @override
     def get_next(self, dt: Instant) -> Instant:   # type: ignore[return]
         next_dt = dt
@@ -3,14 +3,26 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Final
 
 from typing_extensions import Self, override
+from whenever import Time
 
-from eascheduler.producers.base import ProducerFilterBase
+from eascheduler.producers.base import ProducerFilterBase, not_infinite_loop
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Hashable, Iterable
 
-    from whenever import Time, ZonedDateTime
+    from whenever import Date, ZonedDateTime
+
+
+# Filters which only depend on the date can skip to the next day.
+# The date time has to be a lower bound, that's why it's always the earlier one for ambiguous or skipped times.
+# The filters get the date times in the system timezone, which might not have a name (e.g. a POSIX TZ string).
+def _start_of_day(date: Date, time: Time | None = None) -> ZonedDateTime:
+    return date.at(time if time is not None else Time()).assume_system_tz(disambiguate='earlier')
+
+
+def _next_day(dt: ZonedDateTime) -> ZonedDateTime:
+    return _start_of_day(dt.date().add(days=1))
 
 
 class ProducerFilterGroupBase(ProducerFilterBase):
@@ -27,18 +39,83 @@ class ProducerFilterGroupBase(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(f.copy() for f in self._filters)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        keys = tuple(f.shared_key() for f in self._filters)
+        if any(key is None for key in keys):
+            return None
+        return self.__class__, keys
+
 
 class AnyGroupProducerFilter(ProducerFilterGroupBase):
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return any(f.allow(dt) for f in self._filters)
 
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        # None of the filters allows the date time, so it's possible to skip to the earliest of the filters
+        skip = None
+        for f in self._filters:
+            if (value := f.skip_to(dt)) is None:
+                return None
+            if skip is None or value < skip:
+                skip = value
+        return skip
+
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        ret: bool | None = False
+        for f in self._filters:
+            if (allow := f.allow_date(date)) is True:
+                return True
+            if allow is None:
+                ret = None
+        return ret
+
+    @override
+    def next_date(self, date: Date) -> Date:
+        if not self._filters:
+            return super().next_date(date)
+        return min(f.next_date(date) for f in self._filters)
+
 
 class AllGroupProducerFilter(ProducerFilterGroupBase):
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return all(f.allow(dt) for f in self._filters)
 
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        # All filters have to allow the date time, so it's possible to skip to the latest of the filters
+        skip = None
+        for f in self._filters:
+            if not f.allow(dt) and (value := f.skip_to(dt)) is not None and (skip is None or value > skip):
+                skip = value
+        return skip
+
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        ret: bool | None = True
+        for f in self._filters:
+            if (allow := f.allow_date(date)) is False:
+                return False
+            if allow is None:
+                ret = None
+        return ret
+
+    @override
+    def next_date(self, date: Date) -> Date:
+        # Every filter can only move the date forward, so the date is allowed if no filter moves it any more
+        for _ in not_infinite_loop():
+            next_date = date
+            for f in self._filters:
+                next_date = f.next_date(next_date)
+            if next_date == date:
+                return date
+            date = next_date
+        return None
+
 
 class InvertingProducerFilter(ProducerFilterBase):
     __slots__ = ('_filter', )
@@ -51,10 +128,22 @@ class InvertingProducerFilter(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(self._filter.copy())
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        if (key := self._filter.shared_key()) is None:
+            return None
+        return self.__class__, key
+
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return not self._filter.allow(dt)
 
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        if (allow := self._filter.allow_date(date)) is None:
+            return None
+        return not allow
+
 
 class TimeProducerFilter(ProducerFilterBase):
     __slots__ = ('_lower', '_upper')
@@ -68,6 +157,10 @@ class TimeProducerFilter(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(self._lower, self._upper)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self.__class__, self._lower, self._upper
+
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
 
@@ -80,6 +173,16 @@ class TimeProducerFilter(ProducerFilterBase):
 
         return True
 
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        # A window which spans midnight can not be described with lower and upper
+        if (lower := self._lower) is not None and (upper := self._upper) is not None and lower >= upper:
+            return None
+
+        if lower is not None and dt.time() < lower:
+            return _start_of_day(dt.date(), lower)
+        return _start_of_day(dt.date().add(days=1), lower)
+
 
 class DayOfWeekProducerFilter(ProducerFilterBase):
     __slots__ = ('_weekdays', )
@@ -92,10 +195,35 @@ class DayOfWeekProducerFilter(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(self._weekdays)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self.__class__, self._weekdays
+
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return dt.py_datetime().isoweekday() in self._weekdays
 
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        if not (weekdays := self._weekdays):
+            return None
+
+        weekday = dt.py_datetime().isoweekday()
+        days = min((w - weekday) % 7 for w in weekdays) or 7
+        return _start_of_day(dt.date().add(days=days))
+
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return date.day_of_week().value in self._weekdays
+
+    @override
+    def next_date(self, date: Date) -> Date:
+        if not (weekdays := self._weekdays):
+            return super().next_date(date)
+
+        weekday = date.day_of_week().value
+        return date.add(days=min((w - weekday) % 7 for w in weekdays))
+
 
 class DayOfMonthProducerFilter(ProducerFilterBase):
     __slots__ = ('_days', )
@@ -108,10 +236,22 @@ class DayOfMonthProducerFilter(ProducerFilterBase):
     def copy(self) -> DayOfMonthProducerFilter:
         return self.__class__(self._days)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self.__class__, self._days
+
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return dt.day in self._days
 
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        return _next_day(dt)
+
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return date.day in self._days
+
 
 class MonthOfYearProducerFilter(ProducerFilterBase):
     __slots__ = ('_months', )
@@ -123,6 +263,33 @@ class MonthOfYearProducerFilter(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(self._months)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self.__class__, self._months
+
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return dt.month in self._months
+
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        if not (months := self._months):
+            return None
+
+        month = dt.month
+        offset = min((m - month) % 12 for m in months) or 12
+        date = dt.date().replace(day=1)
+        return _start_of_day(date.add(months=offset))
+
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return date.month in self._months
+
+    @override
+    def next_date(self, date: Date) -> Date:
+        if not (months := self._months):
+            return super().next_date(date)
+
+        if (month := date.month) in months:
+            return date
+        return date.replace(day=1).add(months=min((m - month) % 12 for m in months))
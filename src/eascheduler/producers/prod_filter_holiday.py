@@ -7,14 +7,15 @@ from holidays import country_holidays
 from typing_extensions import Self, override
 
 from eascheduler.errors.errors import HolidaysNotSetUpError
-from eascheduler.producers.base import ProducerFilterBase
+from eascheduler.producers.base import ProducerFilterBase, invalidate_producer_caches
+from eascheduler.producers.prod_filter import _next_day
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Hashable, Iterable
     from datetime import date as dt_date
 
-    from whenever import ZonedDateTime
+    from whenever import Date, ZonedDateTime
 
 
 class HolidayProducerFilterBase(ProducerFilterBase):
@@ -28,18 +29,36 @@ class HolidayProducerFilterBase(ProducerFilterBase):
     def copy(self) -> Self:
         return self.__class__(self._holidays)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        # The holidays can be modified, so filters are only the same if they use the same object
+        return self.__class__, id(self._holidays)
+
+    @override
+    def skip_to(self, dt: ZonedDateTime) -> ZonedDateTime | None:
+        # The filters only depend on the date
+        return _next_day(dt)
+
 
 class HolidayProducerFilter(HolidayProducerFilterBase):
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return dt.date().py_date() in self._holidays
 
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return date.py_date() in self._holidays
+
 
 class NotWorkDayProducerFilter(HolidayProducerFilterBase):
     @override
     def allow(self, dt: ZonedDateTime) -> bool:
         return not self._holidays.is_working_day(dt.date().py_date())
 
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return not self._holidays.is_working_day(date.py_date())
+
 
 class WorkDayProducerFilter(HolidayProducerFilterBase):
 
@@ -47,6 +66,10 @@ class WorkDayProducerFilter(HolidayProducerFilterBase):
     def allow(self, dt: ZonedDateTime) -> bool:
         return self._holidays.is_working_day(dt.date().py_date())
 
+    @override
+    def allow_date(self, date: Date) -> bool | None:
+        return self._holidays.is_working_day(date.py_date())
+
 
 def _get_holiday_obj(holidays: _HolidayBase | None = None) -> _HolidayBase:
     if holidays is None:
@@ -97,6 +120,7 @@ def setup_holidays(country: str, subdiv: str | None = None, *, observed: bool =
         raise ValueError(msg)
 
     HOLIDAYS = country_holidays(country, subdiv, observed=observed, language=language, categories=categories)
+    invalidate_producer_caches()
 
 
 def is_holiday(dt: dt_date) -> bool:
@@ -111,10 +135,13 @@ def pop_holiday(dt: dt_date, default: Any = None) -> None | str:
         raise HolidaysNotSetUpError()
 
     try:
-        return HOLIDAYS.pop(dt)
+        value = HOLIDAYS.pop(dt)
     except KeyError:
         return default
 
+    invalidate_producer_caches()
+    return value
+
 
 def get_holiday_name(dt: dt_date, default: Any = None) -> None | str:
     if HOLIDAYS is None:
@@ -137,3 +164,4 @@ def add_holiday(dt: dt_date, name: str | None = None) -> None:
         HOLIDAYS.update({dt: name})
     else:
         HOLIDAYS.append(dt)
+    invalidate_producer_caches()
@@ -1,39 +1,101 @@
 from __future__ import annotations
 
+from heapq import heapify, heappop, heappush
 from typing import TYPE_CHECKING, Final
 
 from typing_extensions import Self, override
 
+from . import base as _base
 from .base import DateTimeProducerBase, not_infinite_loop
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Hashable, Iterable
 
     from whenever import Instant
 
 
 class GroupProducer(DateTimeProducerBase):
-    __slots__ = ('_producers', )
+    __slots__ = ('_cache', '_cache_generation', '_cached', '_producers', '_uncached')
 
     def __init__(self, producers: Iterable[DateTimeProducerBase]) -> None:
         super().__init__()
         self._producers: Final = tuple(producers)
 
+        # (dt, value) for every producer, where value is the result of get_next(dt) of the producer.
+        # Since value is the next date time after dt it's also the result for every date time in between.
+        # This only holds for range stable producers, the other ones (e.g. operations) are evaluated every time.
+        self._cache: list[tuple[Instant, Instant] | None] = [None] * len(self._producers)
+        self._cache_generation: int = _base.CACHE_GENERATION
+        self._cached: Final = tuple(pos for pos, p in enumerate(self._producers) if p.is_range_stable())
+        self._uncached: Final = tuple(pos for pos, p in enumerate(self._producers) if not p.is_range_stable())
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            raise TypeError()
+        # the cache is not part of the configuration
+        return all(getattr(self, s) == getattr(other, s) for s in self.__slots__ if not s.startswith('_cache'))
+
+    @override
+    def __hash__(self) -> int:
+        # Equal producers have the same key
+        return hash(self.shared_key())
+
     @override
     def copy(self) -> Self:
         cls = self.__class__(p.copy() for p in self._producers)
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        keys = tuple(p.shared_key() for p in self._producers)
+        if any(key is None for key in keys):
+            return None
+        return self._shared_key(keys)
+
+    @override
+    def is_range_stable(self) -> bool:
+        return not self._uncached
+
+    def _get_next(self, pos: int, dt: Instant) -> Instant:
+        cache = self._cache
+        if (entry := cache[pos]) is not None and entry[0] <= dt < entry[1]:
+            return entry[1]
+
+        value = self._producers[pos].get_next(dt)
+        cache[pos] = (dt, value)
+        return value
+
     def get_next(self, dt: Instant) -> Instant:   # type: ignore[return]
+        if self._cache_generation != _base.CACHE_GENERATION:
+            self._cache = [None] * len(self._producers)
+            self._cache_generation = _base.CACHE_GENERATION
 
-        next_dt = dt
+        producers = self._producers
+        heap = [(self._get_next(pos, dt), pos) for pos in self._cached]
+        uncached = sorted((producers[pos].get_next(dt), pos) for pos in self._uncached)
+        if (f := self._filter) is None:
+            return min(heap + uncached)[0]
+
+        heapify(heap)
+        candidates = sorted(heap + uncached)
 
         for _ in not_infinite_loop():  # noqa: RET503
+            for value, _pos in candidates:
+                if value > dt and f.allow(value.to_system_tz()):
+                    return value
 
-            values = sorted(p.get_next(next_dt) for p in self._producers)
-            next_dt = values[0]
+            # All values were rejected, so the producers are advanced from the earliest value.
+            # The range stable producers which returned a later value would return the same value again,
+            # and it was already rejected. So only the ones which returned the earliest value are evaluated.
+            next_dt = min([*heap[:1], *uncached[:1]])[0]
+            refreshed = []
+            while heap and heap[0][0] == next_dt:
+                pos = heappop(heap)[1]
+                refreshed.append((self._get_next(pos, next_dt), pos))
+            for entry in refreshed:
+                heappush(heap, entry)
 
-            for value in values:
-                if value > dt and ((f := self._filter) is None or f.allow(value.to_system_tz())):
-                    return value
+            uncached = sorted((producers[pos].get_next(next_dt), pos) for pos in self._uncached)
+            candidates = sorted(refreshed + uncached)
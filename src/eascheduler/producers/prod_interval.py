@@ -1,45 +1,56 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final
+from typing import Final
 
 from typing_extensions import Self, override
+from whenever import Instant
 
 from .base import DateTimeProducerBase
 
 
-if TYPE_CHECKING:
-    from whenever import Instant
-
-
 class IntervalProducer(DateTimeProducerBase):
-    __slots__ = ('_interval', '_next', )
+    __slots__ = ('_interval', '_interval_ns', '_next')
 
     def __init__(self, start: Instant | None, interval: float) -> None:
         super().__init__()
 
         self._next: Instant | None = start
         self._interval: Final = interval
+        # All calculations are done with integers so there is no drift
+        self._interval_ns: Final = round(interval * 1_000_000_000)
 
     @override
     def copy(self) -> Self:
         cls = self.__class__(start=self._next, interval=self._interval)
         return self._copy_filter(cls)
 
+    @override
+    def is_range_stable(self) -> bool:
+        return True
+
     @override
     def get_next(self, dt: Instant) -> Instant:
-        interval = self._interval
+        interval_ns = self._interval_ns
 
         # Possibility to immediately start the interval
         if (new_dt := self._next) is None:
             new_dt = dt.add(microseconds=1)
 
         # The producer should be stateless. We still need the DateTime in case we have odd intervals.
-        # That's why we move backwards in time here
-        while new_dt > dt:
-            new_dt = new_dt.subtract(seconds=interval)
-
-        while new_dt <= dt or ((f := self._filter) is not None and not f.allow(new_dt.to_system_tz())):
-            new_dt = new_dt.add(seconds=interval)
+        # The first run after dt is calculated directly from the distance to the last known run,
+        # this works regardless if the last known run is before or after dt.
+        dt_ns = dt.timestamp_nanos()
+        next_ns = dt_ns - (dt_ns - new_dt.timestamp_nanos()) % interval_ns + interval_ns
+        new_dt = Instant.from_timestamp_nanos(next_ns)
+
+        if (f := self._filter) is not None:
+            while not f.allow(zdt := new_dt.to_system_tz()):
+                # Skip all runs which are before the next time the filter might allow
+                if (skip := f.skip_to(zdt)) is not None and (skip_ns := skip.timestamp_nanos()) > next_ns:
+                    next_ns += -((next_ns - skip_ns) // interval_ns) * interval_ns
+                else:
+                    next_ns += interval_ns
+                new_dt = Instant.from_timestamp_nanos(next_ns)
 
         self._next = new_dt
         return new_dt
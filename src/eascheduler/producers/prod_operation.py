@@ -11,6 +11,8 @@ from eascheduler.producers.base import DateTimeProducerBase, DateTimeProducerOpe
 
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from whenever import Instant
 
 
@@ -39,6 +41,10 @@ class OffsetProducerOperation(DateTimeProducerOperationBase):
         cls = self.__class__(self._producer.copy(), self.offset)
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._shared_operation_key(self.offset)
+
     @override
     def apply_operation(self, next_dt: Instant, dt: Instant) -> Instant:
         return next_dt.add(seconds=self.offset)
@@ -56,6 +62,10 @@ class EarliestProducerOperation(DateTimeProducerOperationBase):
         cls = self.__class__(self._producer.copy(), self.earliest.copy())
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._shared_operation_key(self.earliest)
+
     @override
     def apply_operation(self, next_dt: Instant, dt: Instant) -> Instant:
         try:
@@ -84,6 +94,10 @@ class LatestProducerOperation(DateTimeProducerOperationBase):
         cls = self.__class__(self._producer.copy(), self.latest.copy())
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._shared_operation_key(self.latest)
+
     @override
     def apply_operation(self, next_dt: Instant, dt: Instant) -> Instant:
         try:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Final
+from weakref import WeakValueDictionary
+
+from typing_extensions import override
+
+from . import base as _base
+from .base import DateTimeProducerBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from whenever import Instant
+
+
+class SharedProducer(DateTimeProducerBase):
+    """Producer which is used by all jobs of a scheduler with the same trigger.
+    The last results are memoized, so jobs which are updated with the same reference instant only evaluate
+    the producer once. If the producer is range stable the result is also the result for every instant
+    up to it, so jobs which were created at slightly different times share the evaluation, too."""
+
+    __slots__ = ('__weakref__', '_generation', '_lock', '_memo', '_pool', '_producer', '_range')
+
+    MEMO_SIZE: Final = 8
+
+    def __init__(self, producer: DateTimeProducerBase, pool: ProducerPool) -> None:
+        super().__init__()
+        self._producer: Final = producer
+        self._pool: Final = pool
+        self._range: Final = producer.is_range_stable()
+        # The jobs might run in different threads, e.g. in the shards of the ShardedScheduler
+        self._lock: Final = Lock()
+
+        # (reference instant, result of the producer), the latest entry is the last one
+        self._memo: Final[list[tuple[Instant, Instant]]] = []
+        self._generation: int = _base.CACHE_GENERATION
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            raise TypeError()
+        return self._producer == other._producer
+
+    @override
+    def __hash__(self) -> int:
+        # Equal producers have the same key
+        return hash(self._producer.shared_key())
+
+    @override
+    def copy(self) -> DateTimeProducerBase:  # type: ignore[override]
+        # A copy is not shared
+        return self._producer.copy()
+
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._producer.shared_key()
+
+    @override
+    def is_range_stable(self) -> bool:
+        return self._range
+
+    def _get_memoized(self, dt: Instant) -> Instant | None:
+        memo = self._memo
+        if self._generation != _base.CACHE_GENERATION:
+            memo.clear()
+            self._generation = _base.CACHE_GENERATION
+
+        if self._range:
+            for start, value in reversed(memo):
+                if start <= dt < value:
+                    return value
+        else:
+            for start, value in reversed(memo):
+                if start == dt:
+                    return value
+        return None
+
+    @override
+    def get_next(self, dt: Instant) -> Instant:
+        # Only this producer is locked during the evaluation, so the other shared producers can be used in parallel
+        with self._lock:
+            if (value := self._get_memoized(dt)) is None:
+                value = self._producer.get_next(dt)
+
+                # The jobs which share the producer are typically updated together, so only the last results are kept
+                memo = self._memo
+                if len(memo) >= self.MEMO_SIZE:
+                    del memo[0]
+                memo.append((dt, value))
+                evaluated = True
+            else:
+                evaluated = False
+
+        self._pool._count(evaluated=evaluated)
+        return value
+
+
+class ProducerPool:
+    """Interns the producers of the jobs of a scheduler. Jobs with structurally equal producers get the same
+    ``SharedProducer``, so the producer is evaluated only once per reference instant for all of them.
+    A shared producer is removed from the pool when no job uses it anymore.
+    The pool and its shared producers are thread safe."""
+
+    __slots__ = ('_lock', '_producers', 'calls', 'evaluations', 'reused', 'shared', 'unshared')
+
+    def __init__(self) -> None:
+        self._producers: Final[WeakValueDictionary[Hashable, SharedProducer]] = WeakValueDictionary()
+        self._lock: Final = Lock()
+
+        self.shared: int = 0        # producers which could be shared
+        self.reused: int = 0        # shared producers which were already in the pool
+        self.unshared: int = 0      # producers which can not be shared, e.g. intervals or jitter
+        self.calls: int = 0         # calls of the shared producers
+        self.evaluations: int = 0   # calls which evaluated the producer because there was no memoized result
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__:s} producers={len(self):d} shared={self.shared:d} '
+                f'reused={self.reused:d} unshared={self.unshared:d} calls={self.calls:d} '
+                f'evaluations={self.evaluations:d}>')
+
+    def __len__(self) -> int:
+        return len(self._producers)
+
+    def reset(self) -> None:
+        """Reset the counters"""
+        with self._lock:
+            self.shared = 0
+            self.reused = 0
+            self.unshared = 0
+            self.calls = 0
+            self.evaluations = 0
+
+    def _count(self, *, evaluated: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            if evaluated:
+                self.evaluations += 1
+
+    def share(self, producer: DateTimeProducerBase) -> DateTimeProducerBase:
+        """Return the shared producer for the given producer or the producer itself if it can't be shared"""
+        if isinstance(producer, SharedProducer):
+            return producer
+
+        key = producer.shared_key()
+        with self._lock:
+            if key is None:
+                self.unshared += 1
+                return producer
+
+            self.shared += 1
+            if (shared := self._producers.get(key)) is not None:
+                self.reused += 1
+                return shared
+
+            shared = self._producers[key] = SharedProducer(producer, self)
+            return shared
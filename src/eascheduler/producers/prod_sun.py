@@ -4,14 +4,15 @@ from collections import OrderedDict
 from datetime import datetime as dt_datetime
 from datetime import timedelta as dt_timedelta
 from datetime import timezone as dt_timezone
+from threading import Lock
 from typing import TYPE_CHECKING, Final, Literal
 
 from astral import Observer, SunDirection, sun
 from typing_extensions import Self, override
-from whenever import Instant
+from whenever import Instant, Time
 
 from eascheduler.errors.errors import LocationNotSetError
-from eascheduler.producers.base import DateTimeProducerBase, not_infinite_loop
+from eascheduler.producers.base import DateTimeProducerBase, invalidate_producer_caches, not_infinite_loop
 
 
 if TYPE_CHECKING:
@@ -53,9 +54,12 @@ def set_location(latitude: float | str, longitude: float | str, elevation: float
         raise TypeError(msg)
 
     OBSERVER = Observer(latitude, longitude, elevation)
+    invalidate_producer_caches()
 
 
 SUN_CACHE: Final[OrderedDict[tuple[Hashable, ...], Instant]] = OrderedDict()
+# The producers might be evaluated in different threads, e.g. in the shards of the ShardedScheduler
+SUN_CACHE_LOCK: Final = Lock()
 
 
 class SunProducer(DateTimeProducerBase):
@@ -71,6 +75,14 @@ class SunProducer(DateTimeProducerBase):
         cls = self.__class__()
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._shared_key(*self._cache_key())
+
+    @override
+    def is_range_stable(self) -> bool:
+        return True
+
     def _cache_key(self) -> tuple[Hashable, ...]:
         return (self.__class__, )
 
@@ -82,9 +94,10 @@ class SunProducer(DateTimeProducerBase):
 
         # we cache the SUN calculations because they are somewhat expensive
         key = (dt.to_tz('UTC').date(), id(observer)) + self._cache_key()
-        if (obj := sun_cache.get(key)) is not None:
-            sun_cache.move_to_end(key)
-            return obj
+        with SUN_CACHE_LOCK:
+            if (obj := sun_cache.get(key)) is not None:
+                sun_cache.move_to_end(key)
+                return obj
 
         # If we are very far north or very far south it's possible that we don't have a sunrise at all
         # If that's the case we advance and schedule for the next date that actually has a sunrise
@@ -107,24 +120,33 @@ class SunProducer(DateTimeProducerBase):
         else:
             instant = Instant.from_py_datetime(next_sun)
 
-        # limit cache size
-        if len(sun_cache) >= 64:
-            for _ in range(10):
-                sun_cache.popitem(last=False)
+        with SUN_CACHE_LOCK:
+            # limit cache size
+            if len(sun_cache) >= 64:
+                for _ in range(10):
+                    sun_cache.popitem(last=False)
 
-        sun_cache[key] = instant
+            sun_cache[key] = instant
         return instant
 
     @override
     def get_next(self, dt: Instant) -> Instant:   # type: ignore[return]
 
         new_dt = dt
+        f = self._filter
 
         for _ in not_infinite_loop():  # noqa: RET503
 
+            # Skip the dates which are not allowed by the filter before the sun is calculated.
+            # All times before the start of the next allowed date are not allowed, so it's safe to continue from there.
+            if f is not None:
+                date = new_dt.to_system_tz().date()
+                if (next_date := f.next_date(date)) != date:
+                    new_dt = next_date.at(Time()).assume_system_tz(disambiguate='earlier').to_instant()
+
             # Date has to be in the future
             new_dt = self._get_next_sun(new_dt)
-            if new_dt > dt and ((f := self._filter) is None or f.allow(new_dt.to_system_tz())):
+            if new_dt > dt and (f is None or f.allow(new_dt.to_system_tz())):
                 return new_dt
 
             new_dt = new_dt.add(hours=24)
@@ -9,6 +9,8 @@ from eascheduler.producers.base import DateTimeProducerBase, not_infinite_loop
 
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from whenever import Instant, ZonedDateTime
 
 
@@ -24,13 +26,27 @@ class TimeProducer(DateTimeProducerBase):
         cls = self.__class__(time=self._time.copy())
         return self._copy_filter(cls)
 
+    @override
+    def shared_key(self) -> Hashable | None:
+        return self._shared_key(self._time)
+
+    @override
+    def is_range_stable(self) -> bool:
+        return True
+
     @override
     def get_next(self, dt: Instant) -> Instant:     # type: ignore[return]
 
         local_dts: tuple[ZonedDateTime, ...]
 
         date = dt.to_system_tz().date()
+        f = self._filter
+
         for _ in not_infinite_loop():  # noqa: RET503
+            # Skip the dates which are not allowed by the filter before the time is calculated
+            if f is not None:
+                date = f.next_date(date)
+
             try:
                 local_dts = (self._time.replace(date), )
             except TimeSkippedError:
@@ -40,7 +56,7 @@ class TimeProducer(DateTimeProducerBase):
 
             for local_dt in local_dts:
                 next_dt = local_dt.to_instant()
-                if next_dt > dt and ((f := self._filter) is None or f.allow(local_dt)):
+                if next_dt > dt and (f is None or f.allow(local_dt)):
                     return next_dt
 
             date = date.add(days=1)
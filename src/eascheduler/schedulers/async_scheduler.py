@@ -1,37 +1,91 @@
 from __future__ import annotations
 
 import asyncio
-from bisect import insort
-from collections import deque
+from contextlib import contextmanager
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Final
 
 from typing_extensions import Self, override
-from whenever import Instant
 
-from eascheduler.errors.errors import JobExecutionTimeIsNotSetError
 from eascheduler.errors.handler import process_exception
 from eascheduler.jobs.base import STATUS_RUNNING
 from eascheduler.schedulers.base import SchedulerBase
+from eascheduler.schedulers.job_queue import HeapJobQueue
+from eascheduler.schedulers.stats import TimerStats
 
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from whenever import Instant
+
+    from eascheduler.clocks import ClockBase
     from eascheduler.jobs.base import JobBase
+    from eascheduler.schedulers.job_queue import JobQueueBase
+    from eascheduler.schedulers.misfire import MisfireHandler
+    from eascheduler.schedulers.stats import SchedulerMetrics, SchedulerMetricsSnapshot
 
 
 class AsyncScheduler(SchedulerBase):
-    __slots__ = ('_enabled', '_loop', 'jobs', 'timer')
+    __slots__ = ('_budget_jobs', '_budget_ns', '_catch_up', '_catch_up_timer', '_coalesce_ns', '_continued',
+                 '_enabled', '_loop', '_pending', 'jobs', 'metrics', 'misfire', 'timer', 'timer_stats')
+
+    def __init__(self, event_loop: asyncio.AbstractEventLoop | None = None, *, enabled: bool = True,  # noqa: PLR0913
+                 queue: JobQueueBase | None = None, coalesce: float = 0,
+                 metrics: SchedulerMetrics | None = None, clock: ClockBase | None = None,
+                 max_jobs: int | None = None, max_time: float | None = None,
+                 misfire: MisfireHandler | None = None) -> None:
+        """
 
-    def __init__(self, event_loop: asyncio.AbstractEventLoop | None = None, *, enabled: bool = True) -> None:
+        :param event_loop: event loop, if not provided the running loop will be used
+        :param enabled: if the scheduler should run the jobs
+        :param queue: job queue implementation, defaults to a binary heap
+        :param coalesce: Jobs that are due within this amount of seconds will be run in the same tick
+        :param metrics: optional metrics instance, if provided the scheduler collects the lag and tick metrics
+        :param clock: clock which is used to read the current time, defaults to the system clock
+        :param max_jobs: maximum number of jobs that are run in one tick before control is handed back to the loop
+        :param max_time: maximum time in seconds of a tick before control is handed back to the loop
+        :param misfire: optional handler for jobs that run too late, e.g. after the event loop was blocked
+        """
+        if coalesce < 0:
+            msg = 'Coalesce window must not be negative'
+            raise ValueError(msg)
+        if max_jobs is not None and max_jobs < 1:
+            msg = 'Max jobs must be >= 1'
+            raise ValueError(msg)
+        if max_time is not None and max_time <= 0:
+            msg = 'Max time must be positive'
+            raise ValueError(msg)
+
+        super().__init__(clock)
         self._loop: Final = event_loop if event_loop is not None else asyncio.get_running_loop()
         self._enabled: bool = enabled
+        self._coalesce_ns: Final = round(coalesce * 1_000_000_000)
+        self._budget_jobs: Final = max_jobs
+        self._budget_ns: Final = round(max_time * 1_000_000_000) if max_time is not None else None
         self.timer: asyncio.TimerHandle | None = None
-        self.jobs: Final[deque[JobBase]] = deque()
+        self.timer_stats: Final = TimerStats()
+        self.jobs: Final[JobQueueBase] = queue if queue is not None else HeapJobQueue()
+        self.metrics: SchedulerMetrics | None = metrics
+        self.misfire: MisfireHandler | None = misfire
+        # jobs which are added while a batch is open
+        self._pending: dict[JobBase, None] | None = None
+        # the tick continues the previous tick, e.g. because the budget was used up
+        self._continued: bool = False
+        # jobs with missed runs which are queued again after the catch up interval
+        self._catch_up: Final[dict[JobBase, None]] = {}
+        self._catch_up_timer: asyncio.TimerHandle | None = None
 
     def __repr__(self) -> str:
         next_run = f'{self.timer.when() - self._loop.time():.3f}s' if self.timer is not None else 'None'
         enabled = '' if self._enabled else f' enabled={self._enabled}'
         return f'<{self.__class__.__name__:s}{enabled:s} jobs={len(self.jobs):d} next_run={next_run}>'
 
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop which runs the jobs"""
+        return self._loop
+
     def set_enabled(self, enabled: bool) -> Self:  # noqa: FBT001
         if enabled == self._enabled:
             return self
@@ -40,88 +94,291 @@ class AsyncScheduler(SchedulerBase):
         self._set_timer()
         return self
 
-    def run_jobs(self) -> None:
+    def get_metrics(self) -> SchedulerMetricsSnapshot | None:
+        """Return a snapshot of the metrics or None if the metrics are disabled"""
+        if (metrics := self.metrics) is None:
+            return None
+        return metrics.snapshot(self.timer_stats)
+
+    def run_jobs(self) -> None:  # noqa: C901, PLR0912, PLR0915
         self.timer = None
         jobs = self.jobs
 
+        # The time is only read once per tick and all jobs are run with the same time
+        now = self.clock.now()
+        now_ns = now.timestamp_nanos()
+        deadline = now_ns + self._coalesce_ns
+
+        # A tick can be limited, so a large amount of due jobs does not block the event loop
+        max_jobs = self._budget_jobs
+        budget_ns = self._budget_ns
+        metrics = self.metrics
+        tick_start = perf_counter_ns() if metrics is not None or budget_ns is not None else 0
+        time_limit = tick_start + budget_ns if budget_ns is not None else None
+
+        dispatched = 0
+        exhausted = False
+        # jobs with missed runs that will be caught up in one of the next ticks
+        deferred: list[JobBase] = []
+        # Jobs that were run are queued again after the tick, so a job runs at most once per tick
+        # even if its next run is within the coalesce window
+        rescheduled: list[JobBase] = []
+
+        if (misfire := self.misfire) is not None:
+            self._check_stall(misfire, now_ns)
+        self._continued = False
+
         try:
-            while jobs:
-                job = jobs[0]
-                if (next_run := job.next_run) is None:
-                    raise JobExecutionTimeIsNotSetError()  # noqa: TRY301
-                if next_run > Instant.now():
+            # The queue compares the cached deadlines so there is no need to compare the instants
+            while (next_deadline := jobs.peek_deadline()) is not None:
+                if next_deadline > deadline:
+                    break
+
+                # At least one job is run per tick so the scheduler always makes progress
+                if dispatched and (
+                        (max_jobs is not None and dispatched >= max_jobs) or
+                        (time_limit is not None and perf_counter_ns() >= time_limit)):
+                    exhausted = True
                     break
 
-                jobs.popleft()
+                job = jobs.pop()
 
                 try:
-                    job.execute()
+                    # The job was postponed without updating the queue.
+                    # It was not run, so it does not count against the budget.
+                    if job.update_postponed(now):
+                        jobs.push(job)
+                        continue
+
+                    dispatched += 1
+                    if metrics is not None:
+                        metrics.add_lag(now_ns - next_deadline)
+
+                    # Only the calculation of the next run is measured, the duration of the executor is up to the user
+                    if misfire is not None and now_ns - next_deadline > misfire.grace_ns:
+                        missed = misfire.process(job, now, metrics) and job.status is STATUS_RUNNING
+                    elif metrics is not None:
+                        missed = False
+                        job.run(now)
+                        update_start = perf_counter_ns()
+                        job.update_after_run(now)
+                        metrics.add_update(job.id, perf_counter_ns() - update_start)
+                    else:
+                        missed = False
+                        job.execute(now)
+
+                    if missed:
+                        deferred.append(job)
+                        continue
                 except Exception as e:
                     process_exception(e)
 
-                # Reschedule job if it's still running
+                # Reschedule job if it's still running.
+                # The timer is set once after all jobs of the tick have been processed.
                 if job.status is STATUS_RUNNING:
-                    self.add_job(job)
+                    rescheduled.append(job)
 
         except Exception as e:
             process_exception(e)
 
+        if rescheduled:
+            jobs.push_many(rescheduled)
+
+        if metrics is not None:
+            metrics.add_tick(dispatched, perf_counter_ns() - tick_start, len(jobs))
+
+        # Only the jobs with missed runs wait for the catch up interval, the other jobs are run on time
+        if deferred:
+            if misfire.catch_up_interval > 0:
+                self._hold_catch_up(deferred, misfire.catch_up_interval)
+            else:
+                jobs.push_many(deferred)
+                exhausted = True
+
+        # The remaining due jobs are run in the next iteration of the loop.
+        # They are still at the front of the queue so the order is kept.
+        if exhausted:
+            self._run_soon(0)
+            return None
+
         if jobs:
             self._set_timer()
 
-    def _set_timer(self) -> None:
+    def _check_stall(self, misfire: MisfireHandler, now_ns: int) -> None:
+        # A stall is only detected once and not again for the ticks which process the late jobs
+        if not self._continued and (first := self.jobs.peek_deadline()) is not None:
+            misfire.check_stall(now_ns - first)
+
+    def _run_soon(self, delay: float) -> None:
+        self._cancel_timer()
+        loop = self._loop
+        self.timer = loop.call_at(loop.time() + delay, self.run_jobs)
+        self.timer_stats.armed += 1
+        self._continued = True
+
+    def _hold_catch_up(self, jobs: Iterable[JobBase], delay: float) -> None:
+        catch_up = self._catch_up
+        for job in jobs:
+            catch_up[job] = None
+
+        if self._catch_up_timer is None:
+            loop = self._loop
+            self._catch_up_timer = loop.call_at(loop.time() + delay, self._release_catch_up)
+
+    def _release_catch_up(self) -> None:
+        self._catch_up_timer = None
+        jobs = tuple(self._catch_up)
+        self._catch_up.clear()
+
+        # The missed runs are late anyway, so they are not reported as a stall again
+        self._continued = True
+        self.add_jobs(jobs)
+
+    def _cancel_catch_up(self) -> None:
+        if (timer := self._catch_up_timer) is not None:
+            self._catch_up_timer = None
+            timer.cancel()
+
+    def _cancel_timer(self) -> None:
         if (timer := self.timer) is not None:
             self.timer = None
             timer.cancel()
+            self.timer_stats.canceled += 1
 
-        if not (jobs := self.jobs) or not self._enabled:
+    def _set_timer(self) -> None:
+        if (next_deadline := self.jobs.peek_deadline()) is None or not self._enabled:
+            self._cancel_timer()
             return None
 
-        if (next_run := jobs[0].next_run) is None:
-            raise JobExecutionTimeIsNotSetError()
-
-        diff = (next_run - Instant.now()).in_seconds()
+        diff = (next_deadline - self.clock.now().timestamp_nanos()) / 1_000_000_000
         if diff <= 0:
+            self._cancel_timer()
             self.run_jobs()
-        else:
-            self.timer = self._loop.call_at(self._loop.time() + diff, self.run_jobs)
+            return None
+
+        loop = self._loop
+        when = loop.time() + diff
+
+        # Only re-arm if the new head is earlier than the existing timer.
+        # If the timer fires too early run_jobs will just set the timer again.
+        if (timer := self.timer) is not None:
+            if timer.when() <= when:
+                self.timer_stats.kept += 1
+                return None
+            self._cancel_timer()
+
+        self.timer = loop.call_at(when, self.run_jobs)
+        self.timer_stats.armed += 1
 
     @override
     def add_job(self, job: JobBase) -> Self:
         if job.status is STATUS_RUNNING:
-            insort(self.jobs, job)
-            if job is self.jobs[0]:
+            if (pending := self._pending) is not None:
+                pending[job] = None
+                return self
+
+            self.jobs.push(job)
+            if job is self.jobs.peek():
                 self._set_timer()
         return self
 
     @override
-    def remove_job(self, job: JobBase) -> Self:
-        if not (jobs := self.jobs):
-            self._set_timer()
+    def add_jobs(self, jobs: Iterable[JobBase]) -> Self:
+        if (pending := self._pending) is not None:
+            for job in jobs:
+                if job.status is STATUS_RUNNING:
+                    pending[job] = None
             return self
 
-        is_first = job is self.jobs[0]
-        try:  # noqa: SIM105
-            jobs.remove(job)
-        except ValueError:
-            pass
+        # The queue is only ordered once and the timer is only set once
+        self.jobs.push_many([job for job in jobs if job.status is STATUS_RUNNING])
+        self._set_timer()
+        return self
 
-        if not jobs:
-            self._set_timer()
-            return self
+    @override
+    @contextmanager
+    def batch(self) -> Generator[Self, None, None]:
+        # nested batches are part of the outer batch
+        if self._pending is not None:
+            yield self
+            return None
 
-        if is_first:
-            self._set_timer()
+        self._pending = {}
+        try:
+            yield self
+        finally:
+            pending = self._pending
+            self._pending = None
+            self.add_jobs(pending)
+
+    def reschedule(self, jobs: Iterable[JobBase]) -> int:
+        """Calculate the next run of the jobs again and set the timer, e.g. after the system time has changed.
+        Only the jobs whose next run moved are updated in the queue.
+
+        :param jobs: jobs of this scheduler which will be rescheduled
+        :return: number of jobs whose next run moved
+        """
+        # The timer was armed with the old time, so it has to be set again even if the next job did not change
+        self._cancel_timer()
+
+        moved = 0
+        now = self.clock.now()
+        with self.batch():
+            for job in jobs:
+                try:
+                    next_run = job.next_run
+                    job.update_next(now)
+                    if job.next_run != next_run:
+                        moved += 1
+                        self.update_job(job)
+                except Exception as e:  # noqa: PERF203
+                    process_exception(e)
+
+        self._set_timer()
+        return moved
+
+    @override
+    def remove_job(self, job: JobBase) -> Self:
+        if (pending := self._pending) is not None:
+            pending.pop(job, None)
+        self._catch_up.pop(job, None)
+
+        # The new head can only be later than the removed job,
+        # so the timer has to be canceled only if there are no more jobs
+        jobs = self.jobs
+        jobs.remove(job)
+        if not jobs:
+            self._cancel_timer()
         return self
 
     @override
     def update_job(self, job: JobBase) -> Self:
-        self.remove_job(job)
-        self.add_job(job)
+        if (pending := self._pending) is not None:
+            pending.pop(job, None)
+        self._catch_up.pop(job, None)
+
+        # Don't go through remove_job, otherwise the timer gets canceled if this is the only job
+        self.jobs.remove(job)
+        if job.status is STATUS_RUNNING:
+            return self.add_job(job)
+        if not self.jobs:
+            self._cancel_timer()
         return self
 
     @override
     def remove_all(self) -> Self:
-        for job in tuple(reversed(self.jobs)):
-            job.job_finish()
+        # The jobs are finished in reverse order of their next run
+        jobs = tuple(reversed(tuple(self.jobs)))
+        if (pending := self._pending) is not None:
+            jobs += tuple(pending)
+            pending.clear()
+        jobs += tuple(self._catch_up)
+        self._catch_up.clear()
+
+        # Clear the queue and cancel the timer only once instead of removing the jobs one by one
+        self.jobs.clear()
+        self._cancel_timer()
+        self._cancel_catch_up()
+
+        self._finish_jobs(jobs)
         return self
@@ -1,25 +1,78 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, Final
 
 from typing_extensions import Self
 
+from eascheduler.clocks import SYSTEM_CLOCK
+from eascheduler.errors.handler import process_exception
+from eascheduler.producers.prod_shared import ProducerPool
+
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from eascheduler.clocks import ClockBase
     from eascheduler.jobs.base import JobBase
 
 
 class SchedulerBase:
-    __slots__ = ()
+    __slots__ = ('clock', 'producer_pool')
+
+    def __init__(self, clock: ClockBase | None = None) -> None:
+        # The scheduler and all linked jobs read the time from this clock
+        self.clock: Final[ClockBase] = clock if clock is not None else SYSTEM_CLOCK
+        # DateTimeJobs with the same trigger share the producer
+        self.producer_pool: Final = ProducerPool()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if the attribute is not set, e.g. for subclasses that don't call __init__.
+        # These get the system clock and their own producer pool.
+        if name == 'clock':
+            value: Any = SYSTEM_CLOCK
+        elif name == 'producer_pool':
+            value = ProducerPool()
+        else:
+            msg = f"'{self.__class__.__name__:s}' object has no attribute '{name:s}'"
+            raise AttributeError(msg)
+
+        setattr(self, name, value)
+        return value
 
     def add_job(self, job: JobBase) -> Self:
         raise NotImplementedError()
 
+    def add_jobs(self, jobs: Iterable[JobBase]) -> Self:
+        for job in jobs:
+            self.add_job(job)
+        return self
+
+    @contextmanager
+    def batch(self) -> Generator[Self, None, None]:
+        """Context manager to add many jobs at once.
+        Schedulers can defer the ordering of the jobs and the timer until the context manager exits."""
+        yield self
+
     def remove_job(self, job: JobBase) -> Self:
         raise NotImplementedError()
 
+    def job_lock(self, job: JobBase) -> AbstractContextManager:  # noqa: ARG002
+        """Lock which has to be held while the job is modified from outside the scheduler.
+        Only schedulers which run the jobs in another thread need a lock."""
+        return nullcontext()
+
     def update_job(self, job: JobBase) -> Self:
         raise NotImplementedError()
 
     def remove_all(self) -> Self:
         raise NotImplementedError()
+
+    @staticmethod
+    def _finish_jobs(jobs: Iterable[JobBase]) -> None:
+        # The jobs are already removed, so an error in a callback must not stop the other jobs from finishing
+        for job in jobs:
+            try:
+                job._set_finished()
+            except Exception as e:  # noqa: PERF203
+                process_exception(e)
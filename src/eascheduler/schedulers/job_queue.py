@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from bisect import insort
+from collections import deque
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import override
+
+from eascheduler.errors.errors import JobExecutionTimeIsNotSetError
+from eascheduler.jobs.base import PRIORITY_MAX
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from eascheduler.jobs.base import JobBase
+
+
+class JobQueueBase:
+    """Queue which keeps the jobs of a scheduler ordered by their next run time"""
+
+    __slots__ = ()
+
+    def push(self, job: JobBase) -> None:
+        raise NotImplementedError()
+
+    def push_many(self, jobs: Iterable[JobBase]) -> None:
+        for job in jobs:
+            self.push(job)
+
+    def remove(self, job: JobBase) -> bool:
+        raise NotImplementedError()
+
+    def peek(self) -> JobBase | None:
+        raise NotImplementedError()
+
+    def peek_deadline(self) -> int | None:
+        """Return the next run of the first job as a nanosecond timestamp or None if the queue is empty"""
+        raise NotImplementedError()
+
+    def pop(self) -> JobBase:
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+    def __iter__(self) -> Iterator[JobBase]:
+        """Iterate over the jobs in the order they will be run"""
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} jobs={len(self):d}>'
+
+
+class DequeJobQueue(JobQueueBase):
+    """Sorted deque. Every push and remove is O(n), but it's very fast for a small amount of jobs."""
+
+    __slots__ = ('_jobs', )
+
+    def __init__(self) -> None:
+        self._jobs: Final[deque[JobBase]] = deque()
+
+    @override
+    def push(self, job: JobBase) -> None:
+        if job.next_run is None:
+            raise JobExecutionTimeIsNotSetError()
+        insort(self._jobs, job)
+
+    @override
+    def push_many(self, jobs: Iterable[JobBase]) -> None:
+        jobs = tuple(jobs)
+        for job in jobs:
+            if job.next_run is None:
+                raise JobExecutionTimeIsNotSetError()
+
+        self._jobs.extend(jobs)
+        ordered = sorted(self._jobs)
+        self._jobs.clear()
+        self._jobs.extend(ordered)
+
+    @override
+    def remove(self, job: JobBase) -> bool:
+        try:
+            self._jobs.remove(job)
+        except ValueError:
+            return False
+        return True
+
+    @override
+    def peek(self) -> JobBase | None:
+        return self._jobs[0] if self._jobs else None
+
+    @override
+    def peek_deadline(self) -> int | None:
+        if not self._jobs or (next_run := self._jobs[0].next_run) is None:
+            return None
+        return next_run.timestamp_nanos()
+
+    @override
+    def pop(self) -> JobBase:
+        return self._jobs.popleft()
+
+    @override
+    def clear(self) -> None:
+        self._jobs.clear()
+
+    @override
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @override
+    def __iter__(self) -> Iterator[JobBase]:
+        return iter(self._jobs)
+
+
+class HeapJobQueue(JobQueueBase):
+    """Binary heap with lazy deletion. Push, remove and pop are O(log n).
+
+    The heap only contains integers which are built from the next run of the job as a nanosecond timestamp,
+    the priority of the job and an insertion counter, so the heap only has to compare plain integers.
+    Jobs with the same next run are ordered by priority and then keep the FIFO order.
+    Removed jobs stay in the heap as invalidated entries until they reach the top or until
+    there are more invalidated entries than valid ones in which case the heap gets rebuilt.
+    """
+
+    __slots__ = ('_counter', '_heap', '_jobs', '_keys', '_removed')
+
+    # Rebuilding the heap is only worth it if there are enough dead entries
+    COMPACT_MIN_SIZE: Final = 64
+    # The lower bits of the key are used for the insertion counter
+    COUNTER_BITS: Final = 64
+    # The bits above the counter are used for the inverted priority, so a higher priority sorts first
+    PRIORITY_BITS: Final = 16
+    DEADLINE_SHIFT: Final = COUNTER_BITS + PRIORITY_BITS
+
+    def __init__(self) -> None:
+        self._heap: Final[list[int]] = []
+        self._jobs: Final[dict[int, JobBase]] = {}
+        self._keys: Final[dict[JobBase, int]] = {}
+        self._counter = count()
+        self._removed: int = 0
+
+    @override
+    def push(self, job: JobBase) -> None:
+        if (next_run := job.next_run) is None:
+            raise JobExecutionTimeIsNotSetError()
+
+        self.remove(job)
+        key = self._get_key(next_run.timestamp_nanos(), job.priority)
+        self._jobs[key] = job
+        self._keys[job] = key
+        heappush(self._heap, key)
+
+    def _get_key(self, deadline: int, priority: int) -> int:
+        rank = (deadline << self.PRIORITY_BITS) + (PRIORITY_MAX - priority)
+        return (rank << self.COUNTER_BITS) + next(self._counter)
+
+    @override
+    def push_many(self, jobs: Iterable[JobBase]) -> None:
+        keys = []
+        for job in jobs:
+            if (next_run := job.next_run) is None:
+                raise JobExecutionTimeIsNotSetError()
+
+            self.remove(job)
+            key = self._get_key(next_run.timestamp_nanos(), job.priority)
+            self._jobs[key] = job
+            self._keys[job] = key
+            keys.append(key)
+
+        # Building the heap is O(n) but pushing is O(k log n), so we only rebuild for many new jobs
+        heap = self._heap
+        if len(keys) * 4 >= len(heap):
+            heap.extend(keys)
+            heapify(heap)
+        else:
+            for key in keys:
+                heappush(heap, key)
+
+    @override
+    def remove(self, job: JobBase) -> bool:
+        if (key := self._keys.pop(job, None)) is None:
+            return False
+
+        del self._jobs[key]
+        self._removed += 1
+        if self._removed > self.COMPACT_MIN_SIZE and self._removed * 2 > len(self._heap):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        heap = self._heap
+        jobs = self._jobs
+        heap[:] = [key for key in heap if key in jobs]
+        heapify(heap)
+        self._removed = 0
+
+    def _peek_key(self) -> int | None:
+        heap = self._heap
+        jobs = self._jobs
+        while heap:
+            if (key := heap[0]) in jobs:
+                return key
+            heappop(heap)
+            self._removed -= 1
+        return None
+
+    @override
+    def peek(self) -> JobBase | None:
+        if (key := self._peek_key()) is None:
+            return None
+        return self._jobs[key]
+
+    @override
+    def peek_deadline(self) -> int | None:
+        if (key := self._peek_key()) is None:
+            return None
+        return key >> self.DEADLINE_SHIFT
+
+    @override
+    def pop(self) -> JobBase:
+        heap = self._heap
+        jobs = self._jobs
+        while heap:
+            if (job := jobs.pop(heappop(heap), None)) is not None:
+                del self._keys[job]
+                return job
+            self._removed -= 1
+
+        msg = 'pop from an empty queue'
+        raise IndexError(msg)
+
+    @override
+    def clear(self) -> None:
+        self._heap.clear()
+        self._jobs.clear()
+        self._keys.clear()
+        self._removed = 0
+
+    @override
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @override
+    def __iter__(self) -> Iterator[JobBase]:
+        # The keys sort the same way as the heap, so the jobs are returned in the order they will be run
+        jobs = self._jobs
+        return iter([jobs[key] for key in sorted(jobs)])
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+from enum import Enum
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Final
+
+from eascheduler.jobs.base import STATUS_RUNNING
+
+
+if TYPE_CHECKING:
+    from whenever import Instant
+
+    from eascheduler.jobs.base import JobBase
+    from eascheduler.schedulers.stats import SchedulerMetrics
+
+
+log = logging.getLogger('EAScheduler')
+
+
+class MisfirePolicy(str, Enum):
+    COALESCE = 'coalesce'   # run once and continue from the current time
+    SKIP = 'skip'           # don't run and continue from the current time
+    CATCH_UP = 'catch_up'   # run every missed run, one run per job and tick
+
+
+MISFIRE_COALESCE: Final = MisfirePolicy.COALESCE
+MISFIRE_SKIP: Final = MisfirePolicy.SKIP
+MISFIRE_CATCH_UP: Final = MisfirePolicy.CATCH_UP
+
+
+class MisfireHandler:
+    """Handles jobs that run later than their grace time, e.g. because the event loop was blocked
+    or the host was suspended. The policy can be overwritten per job with ``JobBase.misfire_policy``."""
+
+    __slots__ = ('catch_up_interval', 'caught_up', 'coalesced', 'grace_ns', 'last_stall', 'policy', 'skipped',
+                 'stall_ns', 'stalls')
+
+    def __init__(self, grace: float = 1, policy: MisfirePolicy = MISFIRE_COALESCE, *,
+                 catch_up_interval: float = 0, stall: float = 5) -> None:
+        """
+
+        :param grace: jobs that run later than this amount of seconds are misfired
+        :param policy: default policy for misfired jobs
+        :param catch_up_interval: seconds between two ticks that catch up missed runs
+        :param stall: a tick that runs later than this amount of seconds is logged as a stall
+        """
+        if grace < 0:
+            msg = 'Grace time must not be negative'
+            raise ValueError(msg)
+        if catch_up_interval < 0:
+            msg = 'Catch up interval must not be negative'
+            raise ValueError(msg)
+        if stall <= 0:
+            msg = 'Stall time must be positive'
+            raise ValueError(msg)
+
+        self.grace_ns: Final = round(grace * 1_000_000_000)
+        self.policy: MisfirePolicy = policy
+        self.catch_up_interval: Final = catch_up_interval
+        self.stall_ns: Final = round(stall * 1_000_000_000)
+
+        self.coalesced: int = 0
+        self.skipped: int = 0
+        self.caught_up: int = 0
+        self.stalls: int = 0
+        self.last_stall: float = 0
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__:s} policy={self.policy.value:s} coalesced={self.coalesced:d} '
+                f'skipped={self.skipped:d} caught_up={self.caught_up:d} stalls={self.stalls:d}>')
+
+    def check_stall(self, lag_ns: int) -> None:
+        if lag_ns <= self.stall_ns:
+            return None
+
+        self.stalls += 1
+        self.last_stall = lag_ns / 1_000_000_000
+        log.warning(f'Scheduler tick is late by {self.last_stall:.3f}s')
+
+    def process(self, job: JobBase, now: Instant, metrics: SchedulerMetrics | None = None) -> bool:
+        """Process a misfired job.
+
+        :param metrics: optional metrics, the calculation of the next run is measured the same way as for regular runs
+        :return: True if the job has missed runs left which should be run in one of the next ticks
+        """
+        if (policy := job.misfire_policy) is None:
+            policy = self.policy
+
+        if policy is MISFIRE_SKIP:
+            self.skipped += 1
+            update_start = perf_counter_ns()
+            job.update_next(now)
+            if metrics is not None:
+                metrics.add_update(job.id, perf_counter_ns() - update_start)
+            # Jobs which only run once (e.g. one time or countdown jobs) are finished or paused by the skip
+            if (status := job.status) is not STATUS_RUNNING:
+                log.warning(f'Skipped misfired run of job {job.id!r}, job is {status.value:s} now')
+            return False
+
+        if policy is MISFIRE_CATCH_UP and (planned := job.next_run) is not None:
+            self.caught_up += 1
+            job.executor.execute()
+            # The next run is calculated from the planned run, so the job will run for every missed run
+            update_start = perf_counter_ns()
+            job.update_after_run(planned)
+            if metrics is not None:
+                metrics.add_update(job.id, perf_counter_ns() - update_start)
+            job.last_run = now
+            return (next_run := job.next_run) is not None and next_run <= now
+
+        self.coalesced += 1
+        job.run(now)
+        update_start = perf_counter_ns()
+        job.update_after_run(now)
+        if metrics is not None:
+            metrics.add_update(job.id, perf_counter_ns() - update_start)
+        return False
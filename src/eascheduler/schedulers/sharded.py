@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from threading import RLock, Thread, current_thread
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self, override
+
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.base import SchedulerBase
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+
+    from eascheduler.clocks import ClockBase
+    from eascheduler.jobs.base import JobBase
+
+
+class _Shard(AsyncScheduler):
+    """AsyncScheduler which runs in its own thread. The queue is guarded by a lock,
+    and the timer is only touched from the thread of the event loop."""
+
+    __slots__ = ('_thread', 'lock')
+
+    def __init__(self, clock: ClockBase | None, name: str) -> None:
+        super().__init__(asyncio.new_event_loop(), clock=clock)
+        self.lock: Final = RLock()
+        self._thread: Final = Thread(target=self._run_loop, name=name, daemon=True)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+        if not self._loop.is_running():
+            self._loop.close()
+
+    @override
+    def run_jobs(self) -> None:
+        with self.lock:
+            super().run_jobs()
+
+    @override
+    def _set_timer(self) -> None:
+        # The event loop is not thread safe, so the timer is set in the thread of the loop
+        if current_thread() is not self._thread:
+            self._loop.call_soon_threadsafe(self._set_timer)
+            return None
+
+        with self.lock:
+            super()._set_timer()
+
+    @override
+    def _cancel_timer(self) -> None:
+        # _set_timer cancels the timer if there are no more jobs
+        if current_thread() is not self._thread:
+            self._loop.call_soon_threadsafe(self._set_timer)
+            return None
+        super()._cancel_timer()
+
+
+class ShardedScheduler(SchedulerBase):
+    """Spreads the jobs over multiple AsyncSchedulers which run in their own thread and event loop.
+    The shard of a job is selected by the hash of the job id. All methods and the job controls are thread safe.
+    """
+
+    __slots__ = ('_shards', )
+
+    def __init__(self, shards: int = 2, *, clock: ClockBase | None = None, name: str = 'EAScheduler') -> None:
+        """
+
+        :param shards: number of shards
+        :param clock: clock which is used to read the current time, defaults to the system clock
+        :param name: prefix for the names of the threads
+        """
+        if not isinstance(shards, int) or shards < 1:
+            msg = 'Shards must be an int >= 1'
+            raise ValueError(msg)
+
+        super().__init__(clock)
+        self._shards: Final = tuple(_Shard(self.clock, f'{name:s}Shard{i:d}') for i in range(shards))
+        for shard in self._shards:
+            shard.start()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} shards={len(self._shards):d} jobs={len(self):d}>'
+
+    def __len__(self) -> int:
+        return sum(len(shard.jobs) for shard in self._shards)
+
+    @property
+    def shards(self) -> tuple[AsyncScheduler, ...]:
+        return self._shards
+
+    def _get_shard(self, job: JobBase) -> _Shard:
+        return self._shards[hash(job.id) % len(self._shards)]
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the threads and close the event loops. The jobs stay in the scheduler.
+
+        :param timeout: maximum time in seconds to wait for each thread
+        """
+        for shard in self._shards:
+            shard.stop(timeout)
+
+    @override
+    def job_lock(self, job: JobBase) -> AbstractContextManager:
+        return self._get_shard(job).lock
+
+    @override
+    def add_job(self, job: JobBase) -> Self:
+        shard = self._get_shard(job)
+        with shard.lock:
+            shard.add_job(job)
+        return self
+
+    @override
+    def add_jobs(self, jobs: Iterable[JobBase]) -> Self:
+        groups: dict[_Shard, list[JobBase]] = {}
+        for job in jobs:
+            groups.setdefault(self._get_shard(job), []).append(job)
+
+        for shard, shard_jobs in groups.items():
+            with shard.lock:
+                shard.add_jobs(shard_jobs)
+        return self
+
+    @override
+    def remove_job(self, job: JobBase) -> Self:
+        shard = self._get_shard(job)
+        with shard.lock:
+            shard.remove_job(job)
+        return self
+
+    @override
+    def update_job(self, job: JobBase) -> Self:
+        shard = self._get_shard(job)
+        with shard.lock:
+            shard.update_job(job)
+        return self
+
+    @override
+    def remove_all(self) -> Self:
+        for shard in self._shards:
+            with shard.lock:
+                shard.remove_all()
+        return self
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self, override
+
+from eascheduler.clocks import VirtualClock
+from eascheduler.errors.handler import process_exception
+from eascheduler.jobs.base import STATUS_RUNNING
+from eascheduler.schedulers.base import SchedulerBase
+from eascheduler.schedulers.job_queue import HeapJobQueue
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from whenever import Instant
+
+    from eascheduler.jobs.base import JobBase
+
+
+class SimulatedScheduler(SchedulerBase):
+    """Scheduler which runs the jobs on a virtual clock instead of the event loop.
+    Jobs are executed as fast as possible, so it's possible to simulate long periods of time in a very short time.
+    Use a SyncExecutor for the jobs, otherwise the execution is only scheduled on the event loop.
+    """
+
+    __slots__ = ('_virtual_clock', 'fired', 'jobs', 'record')
+
+    def __init__(self, start: Instant | None = None, *, record: bool = True) -> None:
+        """
+
+        :param start: start of the virtual time, defaults to the current time
+        :param record: record the execution time and the id of every executed job in ``fired``
+        """
+        self._virtual_clock: Final = VirtualClock(start)
+        super().__init__(self._virtual_clock)
+
+        self.jobs: Final = HeapJobQueue()
+        self.record: bool = record
+        self.fired: Final[list[tuple[Instant, Hashable]]] = []
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} jobs={len(self.jobs):d} now={self._virtual_clock.now()}>'
+
+    def run_until(self, instant: Instant) -> int:
+        """Execute all jobs that are due until the given instant and advance the clock to the instant
+
+        :param instant: the virtual time after the run
+        :return: number of executed jobs
+        """
+        clock = self._virtual_clock
+        if instant < clock.now():
+            msg = 'Virtual clock can not go backwards'
+            raise ValueError(msg)
+
+        jobs = self.jobs
+        fired = self.fired if self.record else None
+        end = instant.timestamp_nanos()
+
+        executed = 0
+        while (next_deadline := jobs.peek_deadline()) is not None and next_deadline <= end:
+            job = jobs.pop()
+            # The next run can be slightly before the current time, e.g. if it was set while a job was running
+            now = max(job.next_run, clock.now())
+            clock.set(now)
+
+            try:
+                if job.update_postponed(now):
+                    jobs.push(job)
+                    continue
+                job.execute(now)
+            except Exception as e:
+                process_exception(e)
+
+            executed += 1
+            if fired is not None:
+                fired.append((now, job.id))
+
+            if job.status is STATUS_RUNNING:
+                jobs.push(job)
+
+        clock.set(instant)
+        return executed
+
+    def run_for(self, secs: float) -> int:
+        """Execute all jobs that are due in the next seconds and advance the clock
+
+        :param secs: seconds the virtual time should be advanced
+        :return: number of executed jobs
+        """
+        return self.run_until(self._virtual_clock.now().add(seconds=secs))
+
+    @override
+    def add_job(self, job: JobBase) -> Self:
+        if job.status is STATUS_RUNNING:
+            self.jobs.push(job)
+        return self
+
+    @override
+    def add_jobs(self, jobs: Iterable[JobBase]) -> Self:
+        self.jobs.push_many([job for job in jobs if job.status is STATUS_RUNNING])
+        return self
+
+    @override
+    def remove_job(self, job: JobBase) -> Self:
+        self.jobs.remove(job)
+        return self
+
+    @override
+    def update_job(self, job: JobBase) -> Self:
+        self.jobs.remove(job)
+        return self.add_job(job)
+
+    @override
+    def remove_all(self) -> Self:
+        jobs = tuple(reversed(tuple(self.jobs)))
+        self.jobs.clear()
+        self._finish_jobs(jobs)
+        return self
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from heapq import heappush, heapreplace
+from itertools import count
+from typing import TYPE_CHECKING, Final
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+
+class TimerStats:
+    """Counters for the event loop timer of a scheduler"""
+
+    __slots__ = ('armed', 'canceled', 'kept')
+
+    def __init__(self) -> None:
+        self.armed: int = 0       # timers that have been created
+        self.canceled: int = 0    # timers that have been canceled before they fired
+        self.kept: int = 0        # re-arms that were avoided because the existing timer fires earlier
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} armed={self.armed:d} canceled={self.canceled:d} kept={self.kept:d}>'
+
+    def reset(self) -> None:
+        self.armed = 0
+        self.canceled = 0
+        self.kept = 0
+
+
+# Upper bounds of the fire lag histogram in seconds. Everything above the last bound goes into the last bucket.
+LAG_BUCKETS: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+
+class SchedulerMetrics:
+    """Opt-in metrics of a scheduler. They are collected only if an instance is passed to the scheduler
+    and can be exported with ``snapshot``. All durations are collected in nanoseconds."""
+
+    __slots__ = (
+        '_counter', '_lag_bounds', 'dispatched', 'lag_buckets', 'lag_max', 'lag_sum', 'queue_depth',
+        'queue_depth_max', 'slowest_size', 'slowest_updates', 'tick_jobs_max', 'tick_max', 'tick_sum', 'ticks',
+    )
+
+    def __init__(self, *, lag_buckets: Sequence[float] = LAG_BUCKETS, slowest: int = 5) -> None:
+        """
+
+        :param lag_buckets: ascending upper bounds of the fire lag histogram in seconds
+        :param slowest: number of the slowest next run calculations of the jobs that will be kept
+        """
+        if not lag_buckets or list(lag_buckets) != sorted(lag_buckets):
+            msg = 'Lag buckets must be ascending'
+            raise ValueError(msg)
+        if slowest < 0:
+            msg = 'Slowest must not be negative'
+            raise ValueError(msg)
+
+        self._lag_bounds: Final = tuple(round(b * 1_000_000_000) for b in lag_buckets)
+        self.slowest_size: Final = slowest
+        self._counter = count()
+
+        self.lag_buckets: list[int] = []
+        self.lag_sum: int = 0
+        self.lag_max: int = 0
+
+        self.ticks: int = 0
+        self.dispatched: int = 0
+        self.tick_jobs_max: int = 0
+        self.tick_sum: int = 0
+        self.tick_max: int = 0
+
+        self.queue_depth: int = 0
+        self.queue_depth_max: int = 0
+
+        # min heap of (duration, counter, job id) so the fastest of the slow calls can be replaced
+        self.slowest_updates: list[tuple[int, int, Hashable]] = []
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} ticks={self.ticks:d} dispatched={self.dispatched:d}>'
+
+    def reset(self) -> None:
+        self.lag_buckets = [0] * (len(self._lag_bounds) + 1)
+        self.lag_sum = 0
+        self.lag_max = 0
+        self.ticks = 0
+        self.dispatched = 0
+        self.tick_jobs_max = 0
+        self.tick_sum = 0
+        self.tick_max = 0
+        self.queue_depth = 0
+        self.queue_depth_max = 0
+        self.slowest_updates.clear()
+
+    def add_lag(self, lag: int) -> None:
+        # jobs can run slightly early if the scheduler coalesces them
+        lag = max(lag, 0)
+        self.lag_buckets[bisect_left(self._lag_bounds, lag)] += 1
+        self.lag_sum += lag
+        self.lag_max = max(self.lag_max, lag)
+
+    def add_update(self, job_id: Hashable, duration: int) -> None:
+        if not self.slowest_size:
+            return None
+
+        entry = (duration, next(self._counter), job_id)
+        if len(slowest := self.slowest_updates) < self.slowest_size:
+            heappush(slowest, entry)
+        elif duration > slowest[0][0]:
+            heapreplace(slowest, entry)
+
+    def add_tick(self, jobs: int, duration: int, queue_depth: int) -> None:
+        self.ticks += 1
+        self.dispatched += jobs
+        self.tick_jobs_max = max(self.tick_jobs_max, jobs)
+        self.tick_sum += duration
+        self.tick_max = max(self.tick_max, duration)
+        self.queue_depth = queue_depth
+        self.queue_depth_max = max(self.queue_depth_max, queue_depth)
+
+    def snapshot(self, timer: TimerStats | None = None) -> SchedulerMetricsSnapshot:
+        return SchedulerMetricsSnapshot(self, timer)
+
+
+class SchedulerMetricsSnapshot:
+    """Immutable copy of the scheduler metrics. All durations are in seconds."""
+
+    __slots__ = (
+        'dispatched', 'lag_buckets', 'lag_max', 'lag_mean', 'queue_depth', 'queue_depth_max', 'slowest_updates',
+        'tick_jobs_max', 'tick_max', 'tick_mean', 'ticks', 'timer_armed', 'timer_canceled', 'timer_kept',
+    )
+
+    def __init__(self, metrics: SchedulerMetrics, timer: TimerStats | None = None) -> None:
+        ns: Final = 1_000_000_000
+        lag_count = sum(metrics.lag_buckets)
+
+        # (upper bound, count), the last bucket contains everything above the largest bound
+        self.lag_buckets: Final[tuple[tuple[float, int], ...]] = tuple(zip(
+            (*(b / ns for b in metrics._lag_bounds), float('inf')), metrics.lag_buckets, strict=True
+        ))
+        self.lag_mean: Final = metrics.lag_sum / lag_count / ns if lag_count else 0.
+        self.lag_max: Final = metrics.lag_max / ns
+
+        self.ticks: Final = metrics.ticks
+        self.dispatched: Final = metrics.dispatched
+        self.tick_jobs_max: Final = metrics.tick_jobs_max
+        self.tick_mean: Final = metrics.tick_sum / metrics.ticks / ns if metrics.ticks else 0.
+        self.tick_max: Final = metrics.tick_max / ns
+
+        self.queue_depth: Final = metrics.queue_depth
+        self.queue_depth_max: Final = metrics.queue_depth_max
+
+        # (job id, duration) with the slowest first
+        self.slowest_updates: Final[tuple[tuple[Hashable, float], ...]] = tuple(
+            (job_id, duration / ns) for duration, _, job_id in sorted(metrics.slowest_updates, reverse=True)
+        )
+
+        self.timer_armed: Final = timer.armed if timer is not None else 0
+        self.timer_canceled: Final = timer.canceled if timer is not None else 0
+        self.timer_kept: Final = timer.kept if timer is not None else 0
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__:s} ticks={self.ticks:d} dispatched={self.dispatched:d} '
+            f'lag_mean={self.lag_mean:.6f}s lag_max={self.lag_max:.6f}s tick_max={self.tick_max:.6f}s '
+            f'queue_depth={self.queue_depth:d}>'
+        )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from threading import Condition, RLock, Thread
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self, override
+
+from eascheduler.errors.handler import process_exception
+from eascheduler.jobs.base import STATUS_RUNNING
+from eascheduler.schedulers.base import SchedulerBase
+from eascheduler.schedulers.job_queue import HeapJobQueue
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+
+    from whenever import Instant
+
+    from eascheduler.clocks import ClockBase
+    from eascheduler.jobs.base import JobBase
+    from eascheduler.schedulers.job_queue import JobQueueBase
+
+
+class ThreadedScheduler(SchedulerBase):
+    """Scheduler which runs the jobs from a dispatcher thread, so it can be used without an event loop.
+    All methods and the job controls are thread safe. The jobs are run in the dispatcher thread,
+    so they should use an executor which hands the work off, e.g. the ThreadExecutor.
+    """
+
+    __slots__ = ('_condition', '_running', '_thread', 'jobs')
+
+    def __init__(self, *, queue: JobQueueBase | None = None, clock: ClockBase | None = None,
+                 name: str = 'EAScheduler') -> None:
+        """
+
+        :param queue: job queue implementation, defaults to a binary heap
+        :param clock: clock which is used to read the current time, defaults to the system clock
+        :param name: name of the dispatcher thread
+        """
+        super().__init__(clock)
+        self.jobs: Final[JobQueueBase] = queue if queue is not None else HeapJobQueue()
+
+        # Reentrant, because the jobs call back into the scheduler while they are run
+        self._condition: Final = Condition(RLock())
+        self._running: bool = True
+        self._thread: Final = Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        running = '' if self._running else ' stopped'
+        return f'<{self.__class__.__name__:s}{running:s} jobs={len(self.jobs):d}>'
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the dispatcher thread. The jobs stay in the scheduler.
+
+        :param timeout: maximum time in seconds to wait for the thread
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        condition = self._condition
+        jobs = self.jobs
+        clock = self.clock
+
+        with condition:
+            while self._running:
+                if (next_deadline := jobs.peek_deadline()) is None:
+                    condition.wait()
+                    continue
+
+                now = clock.now()
+                if (wait := (next_deadline - now.timestamp_nanos()) / 1_000_000_000) > 0:
+                    condition.wait(wait)
+                    continue
+
+                self._run_jobs(now)
+
+    def _run_jobs(self, now: Instant) -> None:
+        jobs = self.jobs
+        now_ns = now.timestamp_nanos()
+
+        while (next_deadline := jobs.peek_deadline()) is not None and next_deadline <= now_ns:
+            job = jobs.pop()
+
+            try:
+                if not job.update_postponed(now):
+                    job.execute(now)
+            except Exception as e:
+                process_exception(e)
+
+            # Reschedule job if it's still running
+            if job.status is STATUS_RUNNING:
+                jobs.push(job)
+
+    @override
+    def add_job(self, job: JobBase) -> Self:
+        if job.status is not STATUS_RUNNING:
+            return self
+
+        with self._condition:
+            self.jobs.push(job)
+            # wake up the dispatcher only if it has to wait for a shorter time
+            if job is self.jobs.peek():
+                self._condition.notify()
+        return self
+
+    @override
+    def add_jobs(self, jobs: Iterable[JobBase]) -> Self:
+        with self._condition:
+            self.jobs.push_many([job for job in jobs if job.status is STATUS_RUNNING])
+            self._condition.notify()
+        return self
+
+    @override
+    def job_lock(self, job: JobBase) -> AbstractContextManager:
+        return self._condition
+
+    @override
+    def remove_job(self, job: JobBase) -> Self:
+        # The dispatcher wakes up at the old deadline and just waits again, so there is no need to notify
+        with self._condition:
+            self.jobs.remove(job)
+        return self
+
+    @override
+    def update_job(self, job: JobBase) -> Self:
+        with self._condition:
+            self.jobs.remove(job)
+            return self.add_job(job)
+
+    @override
+    def remove_all(self) -> Self:
+        with self._condition:
+            jobs = tuple(reversed(tuple(self.jobs)))
+            self.jobs.clear()
+            self._finish_jobs(jobs)
+        return self
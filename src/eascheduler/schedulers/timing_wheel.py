@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+from math import ceil, floor
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self, override
+
+from eascheduler.errors.errors import JobExecutionTimeIsNotSetError
+from eascheduler.errors.handler import process_exception
+from eascheduler.jobs.base import STATUS_RUNNING
+from eascheduler.schedulers.base import SchedulerBase
+
+
+if TYPE_CHECKING:
+    from whenever import Instant
+
+    from eascheduler.clocks import ClockBase
+    from eascheduler.jobs.base import JobBase
+
+
+def _get_priority(job: JobBase) -> int:
+    return job.priority
+
+
+class TimingWheelScheduler(SchedulerBase):
+    """Hierarchical timing wheel. Adding and removing a job is O(1) which makes it very cheap
+    to reset jobs very often (e.g. countdown jobs which are used for debouncing).
+
+    Jobs are executed with the granularity of a tick, and they will never run before their next run time.
+    Jobs that are further in the future than the wheels can hold are put into an overflow bucket
+    which gets redistributed every time the top level wheel completes a revolution.
+    """
+
+    __slots__ = ('_current', '_job_slot', '_levels', '_loop', '_overflow', '_slots', '_tick', '_timer_tick', '_wheels',
+                 'timer')
+
+    def __init__(self, event_loop: asyncio.AbstractEventLoop | None = None, *,
+                 tick: float = 0.05, slots: int = 64, levels: int = 4, clock: ClockBase | None = None) -> None:
+        """
+
+        :param event_loop: event loop, if not provided the running loop will be used
+        :param tick: duration of a tick in seconds. This is the granularity with which the jobs are executed.
+        :param slots: number of slots per wheel
+        :param levels: number of wheels
+        :param clock: clock which is used to read the current time, defaults to the system clock
+        """
+        if tick <= 0:
+            msg = 'Tick must be positive'
+            raise ValueError(msg)
+        if not isinstance(slots, int) or slots < 2:  # noqa: PLR2004
+            msg = 'Slots must be an int >= 2'
+            raise ValueError(msg)
+        if not isinstance(levels, int) or levels < 1:
+            msg = 'Levels must be an int >= 1'
+            raise ValueError(msg)
+
+        super().__init__(clock)
+        self._loop: Final = event_loop if event_loop is not None else asyncio.get_running_loop()
+        self._tick: Final = tick
+        self._slots: Final = slots
+        self._levels: Final = levels
+        self.timer: asyncio.TimerHandle | None = None
+        # The timer is only set for the ticks where something has to be done
+        self._timer_tick: int | None = None
+
+        # every slot maps job -> deadline tick
+        self._wheels: Final[tuple[tuple[dict[JobBase, int], ...], ...]] = tuple(
+            tuple({} for _ in range(slots)) for _ in range(levels)
+        )
+        self._overflow: Final[dict[JobBase, int]] = {}
+        self._job_slot: Final[dict[JobBase, dict[JobBase, int]]] = {}
+
+        # the last tick that has been processed
+        self._current: int = floor(self._loop.time() / tick)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} jobs={len(self._job_slot):d} tick={self._tick:.3f}s>'
+
+    def _insert(self, job: JobBase, deadline: int) -> int:
+        """Insert the job and return the tick when the wheel has to process it, either to run it
+        or to move it to a lower level"""
+        current = self._current
+        slots = self._slots
+        shifted_deadline = deadline
+        shifted_current = current
+        size = 1
+
+        # The job is put into the lowest level where all higher digits of the deadline match the current tick
+        for wheel in self._wheels:
+            if shifted_deadline // slots == shifted_current // slots:
+                slot = wheel[shifted_deadline % slots]
+                event = shifted_deadline * size
+                break
+            shifted_deadline //= slots
+            shifted_current //= slots
+            size *= slots
+        else:
+            slot = self._overflow
+            event = (shifted_current + 1) * size
+
+        slot[job] = deadline
+        self._job_slot[job] = slot
+        return event
+
+    def _next_event(self) -> int | None:
+        """Return the next tick where a job is due or a slot of a higher level has to be redistributed"""
+        current = self._current
+        slots = self._slots
+        size = 1
+
+        # The lower levels always have the earlier events, so the first occupied slot is the next event
+        for wheel in self._wheels:
+            pos = current // size % slots
+            block = current // size - pos
+            for i in range(pos + 1, slots):
+                if wheel[i]:
+                    return (block + i) * size
+            size *= slots
+
+        if self._overflow:
+            return (current // size + 1) * size
+        return None
+
+    def _cascade(self, slot: dict[JobBase, int]) -> None:
+        if not slot:
+            return None
+
+        jobs = tuple(slot.items())
+        slot.clear()
+        for job, deadline in jobs:
+            self._insert(job, deadline)
+
+    def _advance(self, now: Instant) -> None:
+        self._current = tick = self._current + 1
+        slots = self._slots
+        wheels = self._wheels
+
+        # redistribute the higher levels if the lower levels completed a revolution
+        shifted = tick
+        for level in range(1, self._levels + 1):
+            if shifted % slots:
+                break
+            shifted //= slots
+            self._cascade(wheels[level][shifted % slots] if level < self._levels else self._overflow)
+
+        if not (due := wheels[0][tick % slots]):
+            return None
+
+        # Jobs with a higher priority run first, the sort is stable so the insertion order is kept otherwise
+        jobs = sorted(due, key=_get_priority, reverse=True)
+
+        # The jobs are moved to their own slot before the batch runs, that way the callbacks can cancel or
+        # reschedule other jobs of the batch. These jobs are not in the batch any more and are skipped.
+        batch = due.copy()
+        due.clear()
+        job_slot = self._job_slot
+        for job in jobs:
+            job_slot[job] = batch
+
+        for job in jobs:
+            if job_slot.get(job) is not batch:
+                continue
+            del job_slot[job]
+
+            try:
+                if not job.update_postponed(now):
+                    job.execute(now)
+            except Exception as e:
+                process_exception(e)
+
+            # Reschedule job if it's still running
+            if job.status is STATUS_RUNNING:
+                self.add_job(job)
+
+    def run_jobs(self) -> None:
+        self.timer = None
+        self._timer_tick = None
+
+        try:
+            target = floor(self._loop.time() / self._tick)
+            now = self.clock.now()
+            while self._current < target and self._job_slot:
+                # Nothing happens in the ticks before the next event, so they are skipped
+                if (event := self._next_event()) is None or event > target:
+                    self._current = target
+                    break
+                self._current = event - 1
+                self._advance(now)
+        except Exception as e:
+            process_exception(e)
+
+        self._set_timer()
+
+    def _set_timer(self) -> None:
+        if not self._job_slot:
+            if (timer := self.timer) is not None:
+                self.timer = None
+                self._timer_tick = None
+                timer.cancel()
+            return None
+
+        if (event := self._next_event()) is not None:
+            self._arm_timer(event)
+
+    def _arm_timer(self, tick: int) -> None:
+        # Keep the timer if it fires earlier
+        if (timer := self.timer) is not None:
+            if self._timer_tick is not None and self._timer_tick <= tick:
+                return None
+            timer.cancel()
+
+        self._timer_tick = tick
+        self.timer = self._loop.call_at(tick * self._tick, self.run_jobs)
+
+    @override
+    def add_job(self, job: JobBase) -> Self:
+        if job.status is not STATUS_RUNNING:
+            return self
+
+        if (next_run := job.next_run) is None:
+            raise JobExecutionTimeIsNotSetError()
+
+        loop_time = self._loop.time()
+
+        self._remove(job)
+        # Nothing was processed while the wheel was empty
+        if not self._job_slot:
+            self._current = floor(loop_time / self._tick)
+        # Nothing happens before the timer fires, so the ticks up to the timer can be skipped
+        elif (timer_tick := self._timer_tick) is not None:
+            self._current = max(self._current, min(floor(loop_time / self._tick), timer_tick - 1))
+
+        # the earliest possible tick is the next one
+        deadline = ceil((loop_time + (next_run - self.clock.now()).in_seconds()) / self._tick)
+        self._arm_timer(self._insert(job, max(deadline, self._current + 1)))
+        return self
+
+    def _remove(self, job: JobBase) -> bool:
+        if (slot := self._job_slot.pop(job, None)) is None:
+            return False
+        del slot[job]
+        return True
+
+    @override
+    def remove_job(self, job: JobBase) -> Self:
+        if self._remove(job) and not self._job_slot:
+            self._set_timer()
+        return self
+
+    @override
+    def update_job(self, job: JobBase) -> Self:
+        # add_job replaces the job, that way the timer is not canceled when the job is the only one
+        if job.status is STATUS_RUNNING:
+            return self.add_job(job)
+        return self.remove_job(job)
+
+    @override
+    def remove_all(self) -> Self:
+        jobs = tuple(reversed(tuple(self._job_slot)))
+
+        self._job_slot.clear()
+        self._overflow.clear()
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._set_timer()
+
+        self._finish_jobs(jobs)
+        return self
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from whenever import reset_system_tz
+
+from eascheduler.errors.handler import process_exception
+from eascheduler.jobs import DateTimeJob
+from eascheduler.producers.base import invalidate_producer_caches
+
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from eascheduler.schedulers.async_scheduler import AsyncScheduler
+
+
+log = logging.getLogger('EAScheduler')
+
+# The system timezone is read from the TZ environment variable or this file
+LOCALTIME: Final = Path('/etc/localtime')
+
+
+class ClockWatchdog:
+    """Periodically checks if the system time jumped (e.g. NTP step or suspend of the host)
+    or the system timezone changed. If that's the case the DateTimeJobs of the scheduler are rescheduled
+    and the timer is set again. CountdownJobs and OneTimeJobs run at a fixed instant, so they are not affected.
+    The system timezone is only reloaded if the TZ environment variable or the timezone file changed.
+    """
+
+    __slots__ = ('_interval', '_offset', '_scheduler', '_threshold', '_timer', '_tz', '_tz_source',
+                 'jumps', 'tz_changes')
+
+    def __init__(self, scheduler: AsyncScheduler, *, interval: float = 10, threshold: float = 1) -> None:
+        """
+
+        :param scheduler: scheduler which will be watched
+        :param interval: interval of the checks in seconds
+        :param threshold: a drift between the loop time and the system time above this value in seconds is a jump
+        """
+        if interval <= 0:
+            msg = 'Interval must be positive'
+            raise ValueError(msg)
+        if threshold <= 0:
+            msg = 'Threshold must be positive'
+            raise ValueError(msg)
+
+        self._scheduler: Final = scheduler
+        self._interval: Final = interval
+        self._threshold: Final = threshold
+        self._timer: asyncio.TimerHandle | None = None
+
+        self._offset: float = self._get_offset()
+        self._tz_source: tuple[str | None, str, int] | None = self._get_tz_source()
+        self._tz: str = self._get_tz()
+
+        self.jumps: int = 0
+        self.tz_changes: int = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__:s} jumps={self.jumps:d} tz_changes={self.tz_changes:d}>'
+
+    def _get_offset(self) -> float:
+        # The loop time is monotonic, so the offset only changes if the system time jumps
+        return self._scheduler.clock.now().timestamp() - self._scheduler.event_loop.time()
+
+    @staticmethod
+    def _get_tz_source() -> tuple[str | None, str, int] | None:
+        # Reloading the timezone is expensive, so it's only done if the configuration of the timezone changed.
+        # If there is no timezone file the change can't be detected and the timezone is always reloaded.
+        try:
+            path = LOCALTIME.resolve()
+            return os.environ.get('TZ'), str(path), path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_tz(self) -> str:
+        # the timezone is cached so it has to be reloaded
+        reset_system_tz()
+        dt = self._scheduler.clock.now().to_system_tz()
+        return dt.tz if dt.tz is not None else str(dt.offset)
+
+    def start(self) -> None:
+        if self._timer is None:
+            self._offset = self._get_offset()
+            self._tz_source = self._get_tz_source()
+            self._tz = self._get_tz()
+            self._schedule()
+
+    def stop(self) -> None:
+        if (timer := self._timer) is not None:
+            self._timer = None
+            timer.cancel()
+
+    def _schedule(self) -> None:
+        self._timer = self._scheduler.event_loop.call_later(self._interval, self._run)
+
+    def _run(self) -> None:
+        try:
+            self.check()
+        except Exception as e:
+            process_exception(e)
+        self._schedule()
+
+    def check(self) -> bool:
+        """Check the system time and timezone and reschedule the jobs if necessary
+
+        :return: True if the jobs were rescheduled
+        """
+        changed = False
+
+        offset = self._get_offset()
+        if abs(offset - self._offset) > self._threshold:
+            log.warning(f'System time jumped by {offset - self._offset:.3f}s')
+            self.jumps += 1
+            changed = True
+        self._offset = offset
+
+        if (source := self._get_tz_source()) is None or source != self._tz_source:
+            if (tz := self._get_tz()) != self._tz:
+                log.warning(f'System timezone changed from {self._tz:s} to {tz:s}')
+                self.tz_changes += 1
+                changed = True
+            self._tz = tz
+        self._tz_source = source
+
+        if not changed:
+            return False
+
+        invalidate_producer_caches()
+        moved = self._scheduler.reschedule([job for job in self._scheduler.jobs if isinstance(job, DateTimeJob)])
+        log.debug(f'Rescheduled {moved:d} jobs')
+        return True
@@ -3,6 +3,7 @@ import asyncio
 from eascheduler.builder import JobBuilder
 from eascheduler.executor.base import SyncExecutor
 from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.timing_wheel import TimingWheelScheduler
 from tests.helper import CountDownHelper
 
 
@@ -25,3 +26,38 @@ async def test_countdown() -> None:
 
     calls.assert_called()
     assert job.status.is_paused
+
+
+async def test_countdown_scheduler() -> None:
+
+    calls = CountDownHelper()
+
+    scheduler = AsyncScheduler()
+    wheel = TimingWheelScheduler(tick=0.005)
+    builder = JobBuilder(scheduler, SyncExecutor, countdown_scheduler=wheel)
+    job = calls.link_job(builder.countdown(0.1, calls))
+    assert job._job._scheduler is wheel
+
+    calls.reset()
+    assert repr(wheel) == '<TimingWheelScheduler jobs=1 tick=0.005s>'
+    assert not scheduler.jobs
+
+    await asyncio.sleep(0.15)
+    calls.assert_called()
+    assert job.status.is_paused
+
+
+async def test_countdown_bulk() -> None:
+
+    scheduler = AsyncScheduler()
+    builder = JobBuilder(scheduler, SyncExecutor)
+    with builder.bulk() as b:
+        assert b is builder
+        jobs = [builder.countdown(1, lambda: None) for _ in range(5)]
+        for job in jobs:
+            job.reset()
+        assert not scheduler.jobs
+
+    assert len(scheduler.jobs) == 5
+    assert scheduler.timer_stats.armed == 1
+    scheduler.remove_all()
@@ -0,0 +1,48 @@
+import asyncio
+
+from eascheduler.builder import JobBuilder
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+
+
+async def test_debounce() -> None:
+    calls = []
+
+    builder = JobBuilder(AsyncScheduler(), SyncExecutor)
+    job = builder.debounce(0.05, calls.append)
+
+    for _ in range(5):
+        job.trigger('a')
+        job.trigger('b')
+        await asyncio.sleep(0.01)
+
+    assert calls == []
+    assert job.pending == 2
+    assert job.suppressed == {'a': 4, 'b': 4}
+    await asyncio.sleep(0.1)
+
+    assert calls == ['a', 'b']
+    assert job.pending == 0
+    assert job.suppressed == {}
+    assert job.status.is_paused
+
+
+async def test_throttle() -> None:
+    calls = []
+
+    builder = JobBuilder(AsyncScheduler(), SyncExecutor)
+    job = builder.throttle(0.05, calls.append)
+
+    for _ in range(3):
+        job.trigger('a')
+    assert calls == ['a']
+    assert job.suppressed == {'a': 2}
+
+    await asyncio.sleep(0.1)
+    assert job.pending == 0
+    assert job.suppressed == {}
+    job.trigger('a')
+    assert calls == ['a', 'a']
+
+    job.cancel()
+    assert job.status.is_finished
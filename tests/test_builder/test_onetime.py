@@ -21,3 +21,16 @@ async def test_onetime() -> None:
     await asyncio.sleep(0.02)
 
     assert_called_at(calls, target)
+
+
+async def test_onetime_priority() -> None:
+    calls = []
+
+    builder = JobBuilder(AsyncScheduler(), SyncExecutor)
+    target = ZonedDateTime.now_in_system_tz() + TimeDelta(seconds=0.01)
+    builder.once(target, calls.append, 'low', priority=-1)
+    builder.once(target, calls.append, 'default')
+    builder.once(target, calls.append, 'high', priority=1)
+
+    await asyncio.sleep(0.03)
+    assert calls == ['high', 'default', 'low']
@@ -1,5 +1,9 @@
 
-from eascheduler.builder import TriggerBuilder
+import pytest
+from whenever import Instant
+
+from eascheduler.builder import JobBuilder, TriggerBuilder
+from eascheduler.executor.base import SyncExecutor
 from eascheduler.producers import (
     EarliestProducerOperation,
     IntervalProducer,
@@ -10,6 +14,7 @@ from eascheduler.producers import (
     SunElevationProducerCompare,
     TimeProducer,
 )
+from eascheduler.schedulers.simulated import SimulatedScheduler
 
 
 def test_trigger_producer_names() -> None:
@@ -44,3 +49,33 @@ def test_producer_trigger_immutable() -> None:
     assert o1._producer._producer._interval == 3
     assert o2._producer._producer._interval == 4
     assert t._producer._interval == 5
+
+
+def test_trigger_limits() -> None:
+    t = TriggerBuilder.interval(None, 2)
+    limited = t.max_runs(3).until(Instant.from_utc(2001, 1, 1)).offset(1)
+    assert (limited._max_runs, limited._until) == (3, Instant.from_utc(2001, 1, 1))
+    assert (t._max_runs, t._until) == (None, None)
+
+    with pytest.raises(ValueError, match='Max runs must be an int >= 1'):
+        t.max_runs(0)
+    with pytest.raises(ValueError, match='can only be set on the trigger of the job'):
+        TriggerBuilder.group(t, limited)
+
+
+def test_trigger_limits_job() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    builder = JobBuilder(s, SyncExecutor)
+
+    runs = builder.at(TriggerBuilder.interval(start.add(seconds=10), 10).max_runs(3), lambda: None)
+    until = builder.at(TriggerBuilder.interval(start.add(seconds=10), 10).until(start.add(seconds=300)),
+                       lambda: None)
+
+    s.run_for(3600)
+    assert runs.status.is_finished
+    assert until.status.is_finished
+    assert runs._job.runs == 3
+    assert until._job.runs == 30
+    assert until.last_run_datetime == start.add(seconds=300).to_system_tz().to_plain().py_datetime()
+    assert len(s.jobs) == 0
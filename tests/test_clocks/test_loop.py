@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from whenever import Instant
+
+from eascheduler.clocks import CoarseClock, LoopClock
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.jobs import CountdownJob
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from tests.helper import CountDownHelper
+
+
+async def test_coarse_clock() -> None:
+    clock = CoarseClock()
+
+    now = clock.now()
+    await asyncio.sleep(0.01)
+    assert clock.now() is clock.now()
+    assert clock.now() > now
+
+    # the time is cached for the whole loop iteration
+    first = clock.now()
+    for _ in range(100):
+        assert clock.now() is first
+
+
+async def test_coarse_clock_thread() -> None:
+    clock = CoarseClock()
+    cached = clock.now()
+
+    # other threads always read the system time
+    values = await asyncio.to_thread(lambda: [clock.now() for _ in range(3)])
+    assert all(value is not cached for value in values)
+    assert values[0] >= cached
+
+
+def test_coarse_clock_not_running() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        clock = CoarseClock(loop)
+
+        # the time is only cached when the clock knows the thread of the loop
+        assert clock.now() is not clock.now()
+
+        async def read() -> bool:
+            return clock.now() is clock.now()
+
+        assert loop.run_until_complete(read())
+    finally:
+        loop.close()
+
+
+async def test_loop_clock() -> None:
+    with pytest.raises(ValueError, match='Sync interval must be positive'):
+        LoopClock(sync_interval=0)
+
+    clock = LoopClock()
+    for _ in range(3):
+        before = Instant.now()
+        now = clock.now()
+        assert abs((now - before).in_seconds()) < 0.01
+        await asyncio.sleep(0.01)
+
+    # the clock gets synchronized with the system time
+    clock = LoopClock(sync_interval=0.001)
+    ref = clock._ref_instant
+    await asyncio.sleep(0.01)
+    assert clock.now() is clock._ref_instant
+    assert clock._ref_instant > ref
+
+
+@pytest.mark.parametrize('clock', [CoarseClock, LoopClock])
+async def test_scheduler_clock(clock) -> None:
+    calls = CountDownHelper()
+
+    s = AsyncScheduler(clock=clock())
+    job = calls.link_job(CountdownJob(SyncExecutor(calls), 0.05))
+    job.link_scheduler(s)
+
+    calls.reset()
+    await asyncio.sleep(0.03)
+    calls.reset()
+    await asyncio.sleep(0.03)
+    calls.assert_not_called()
+
+    await asyncio.sleep(0.04)
+    calls.assert_called()
@@ -0,0 +1,29 @@
+import pytest
+from whenever import Instant
+
+from eascheduler.clocks import SYSTEM_CLOCK, VirtualClock
+
+
+def test_system_clock() -> None:
+    before = Instant.now()
+    assert before <= SYSTEM_CLOCK.now() <= Instant.now()
+    assert repr(SYSTEM_CLOCK) == '<SystemClock>'
+
+
+def test_virtual_clock() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    clock = VirtualClock(start)
+    assert clock.now() == start
+    assert repr(clock) == '<VirtualClock 2001-01-01T00:00:00Z>'
+
+    clock.advance(1.5)
+    assert clock.now() == start.add(seconds=1.5)
+
+    clock.set(start.add(hours=1))
+    assert clock.now() == start.add(hours=1)
+
+    with pytest.raises(ValueError, match='Virtual clock can not go backwards'):
+        clock.set(start)
+    with pytest.raises(ValueError, match='Virtual clock can not go backwards'):
+        clock.advance(-1)
+    assert clock.now() == start.add(hours=1)
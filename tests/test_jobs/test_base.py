@@ -1,3 +1,4 @@
+import pytest
 from whenever import Instant
 
 from eascheduler.executor.base import SyncExecutor
@@ -20,3 +21,33 @@ async def test_cmp() -> None:
     a.next_run = Instant.from_utc(2001, 1, 1)
     b.next_run = Instant.from_utc(2001, 1, 1, nanosecond=1)
     assert a < b
+
+
+def test_priority() -> None:
+    a = JobBase(SyncExecutor(AlwaysError()), priority=1)
+    b = JobBase(SyncExecutor(AlwaysError()))
+    a.next_run = b.next_run = Instant.from_utc(2001, 1, 1)
+    assert a < b
+    assert not b < a
+
+    for value in (2 ** 15, -(2 ** 15) - 1, 1.5):
+        with pytest.raises(ValueError, match='Priority must be an int between -32768 and 32767'):
+            JobBase(SyncExecutor(AlwaysError()), priority=value)
+
+
+def test_slots_and_lazy_callbacks() -> None:
+    job = JobBase(SyncExecutor(AlwaysError()))
+    assert not hasattr(job, '__dict__')
+    assert not hasattr(job.executor, '__dict__')
+
+    # handlers are only created when they are accessed
+    assert job._on_update is None
+    assert job._on_finished is None
+    job.set_next_run(Instant.now().add(seconds=1))
+    assert job._on_update is None
+
+    calls = []
+    job.on_update.register(calls.append)
+    assert job.on_update is job._on_update
+    job.set_next_run(None)
+    assert calls == [job]
@@ -1,9 +1,12 @@
 import asyncio
 
+from whenever import Instant
+
 from eascheduler.executor.base import SyncExecutor
 from eascheduler.jobs.base import STATUS_PAUSED, STATUS_RUNNING
 from eascheduler.jobs.job_countdown import CountdownJob
 from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.simulated import SimulatedScheduler
 from tests.helper import CountDownHelper
 
 
@@ -52,3 +55,45 @@ async def test_stop() -> None:
 
     calls.assert_called()
     assert job.status is STATUS_PAUSED
+
+
+def test_lazy_reset() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    calls = []
+
+    job = CountdownJob(SyncExecutor(lambda: calls.append(s.clock.now())), 10, job_id='lazy', lazy_reset=True)
+    updates = []
+    job.on_update.register(updates.append)
+    job.link_scheduler(s)
+
+    job.reset()
+    updates.clear()
+    queued = job.next_run
+    assert queued == start.add(seconds=10)
+
+    for _ in range(4):
+        assert s.run_for(2) == 0
+        job.reset()
+
+    # Only the deadline moved, the job was not queued again and no callback was run
+    assert job.next_run == queued
+    assert job.deadline == start.add(seconds=18)
+    assert s.jobs.peek_deadline() == queued.timestamp_nanos()
+    assert updates == []
+
+    # The stale entry comes due and the job is queued with the new deadline
+    assert s.run_for(2) == 0
+    assert job.next_run == start.add(seconds=18)
+    assert updates == [job]
+    assert calls == []
+
+    assert s.run_for(8) == 1
+    assert calls == [start.add(seconds=18)]
+    assert job.status is STATUS_PAUSED
+    assert job.deadline is None
+
+    # A reset after the countdown ran out queues the job again
+    job.reset()
+    assert job.next_run == start.add(seconds=28)
+    assert s.run_for(10) == 1
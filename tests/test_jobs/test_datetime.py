@@ -1,12 +1,14 @@
 import asyncio
 
+import pytest
 from whenever import Instant, TimeDelta
 
 from eascheduler.executor.base import SyncExecutor
-from eascheduler.jobs.base import STATUS_PAUSED, STATUS_RUNNING
+from eascheduler.jobs.base import STATUS_FINISHED, STATUS_PAUSED, STATUS_RUNNING
 from eascheduler.jobs.job_datetime import DateTimeJob
 from eascheduler.producers import IntervalProducer
 from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.simulated import SimulatedScheduler
 
 
 async def test_datetime() -> None:
@@ -42,3 +44,22 @@ async def test_datetime() -> None:
     job.job_resume()
     assert job.status is STATUS_RUNNING
     assert job.next_run == now.add(seconds=4)
+
+
+def test_limits() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+
+    job = DateTimeJob(SyncExecutor(lambda: None), IntervalProducer(start, 60), max_runs=2)
+    job.link_scheduler(s)
+    assert s.run_for(3600) == 2
+    assert job.status is STATUS_FINISHED
+
+    # The end is already reached when the job is linked
+    job = DateTimeJob(SyncExecutor(lambda: None), IntervalProducer(start, 60), until=start)
+    job.link_scheduler(s)
+    assert job.status is STATUS_FINISHED
+    assert not s.jobs
+
+    with pytest.raises(ValueError, match='Max runs must be an int >= 1'):
+        DateTimeJob(SyncExecutor(lambda: None), IntervalProducer(start, 60), max_runs=0)
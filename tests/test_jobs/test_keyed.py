@@ -0,0 +1,89 @@
+from whenever import Instant
+
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.jobs import DebounceJob, ThrottleJob
+from eascheduler.jobs.base import STATUS_PAUSED, STATUS_RUNNING
+from eascheduler.schedulers.simulated import SimulatedScheduler
+
+
+def test_debounce() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    calls = []
+
+    job = DebounceJob(SyncExecutor, 10, lambda key, value: calls.append((s.clock.now(), key, value)), ('v', ))
+    job.link_scheduler(s)
+    assert job.status is STATUS_PAUSED
+
+    job.trigger('a')
+    s.run_for(5)
+    job.trigger('a')
+    job.trigger('b')
+    assert job.status is STATUS_RUNNING
+    assert len(job) == 2
+    assert len(s.jobs) == 1
+
+    # the first deadline of 'a' was moved, so nothing runs
+    assert s.run_for(5) == 1
+    assert calls == []
+    assert job.suppressed == {'a': 1}
+
+    # the keys are removed when they run
+    s.run_for(5)
+    assert sorted(calls) == [(start.add(seconds=15), 'a', 'v'), (start.add(seconds=15), 'b', 'v')]
+    assert job.suppressed == {}
+    assert job._executors == {}
+    assert job.status is STATUS_PAUSED
+    assert not s.jobs
+
+    job.trigger('c')
+    assert job.discard('c')
+    assert not job.discard('c')
+    s.run_for(10)
+    assert len(calls) == 2
+    assert job.status is STATUS_PAUSED
+
+
+def test_throttle() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    calls = []
+
+    job = ThrottleJob(SyncExecutor, 10, lambda key: calls.append((s.clock.now(), key)))
+    job.link_scheduler(s)
+
+    for _ in range(3):
+        job.trigger('a')
+        s.run_for(3)
+    assert job.suppressed == {'a': 2}
+
+    # the first window expires, so the key starts again
+    for _ in range(2):
+        job.trigger('a')
+        s.run_for(3)
+    assert calls == [(start, 'a'), (start.add(seconds=12), 'a')]
+    assert job.suppressed == {}
+    assert len(job) == 1
+    assert len(job._executors) == 1
+
+    # the key is removed when the window expires
+    s.run_for(10)
+    assert len(job) == 0
+    assert job.suppressed == {}
+    assert job._executors == {}
+    assert job.status is STATUS_PAUSED
+
+
+def test_tick_time() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    calls = []
+
+    job = DebounceJob(SyncExecutor, 10, calls.append)
+    job.link_scheduler(s)
+    job.trigger('a')
+
+    # the keys are processed with the time of the tick and not with the time of the clock
+    job.execute(start.add(seconds=10))
+    assert calls == ['a']
+    assert s.clock.now() == start
@@ -1,5 +1,7 @@
-from whenever import Time, ZonedDateTime
+import pytest
+from whenever import Date, Instant, Time, ZonedDateTime, reset_system_tz
 
+from eascheduler.producers import IntervalProducer
 from eascheduler.producers.prod_filter import (
     AllGroupProducerFilter,
     AnyGroupProducerFilter,
@@ -104,3 +106,79 @@ def test_and_group() -> None:
 
     # Test Copy
     compare_with_copy(f, f.copy())
+
+
+def test_skip_to() -> None:
+    dt = ZonedDateTime.from_system_tz(2001, 1, 1, 12)     # Monday
+
+    assert TimeProducerFilter(lower=Time(14)).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 1, 14)
+    assert TimeProducerFilter(Time(8), Time(9)).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 2, 8)
+    assert TimeProducerFilter(upper=Time(9)).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 2)
+    assert TimeProducerFilter(Time(22), Time(2)).skip_to(dt) is None
+
+    assert DayOfWeekProducerFilter([3, 6]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 3)
+    assert DayOfWeekProducerFilter([1]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 8)
+    assert DayOfMonthProducerFilter([5]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 2)
+    assert MonthOfYearProducerFilter([3]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 3, 1)
+    assert MonthOfYearProducerFilter([1]).skip_to(dt) == ZonedDateTime.from_system_tz(2002, 1, 1)
+    assert InvertingProducerFilter(DayOfWeekProducerFilter([1])).skip_to(dt) is None
+
+    # all filters have to allow the time so the latest one is used
+    f = AllGroupProducerFilter([DayOfWeekProducerFilter([3]), TimeProducerFilter(lower=Time(14))])
+    assert f.skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 3)
+    # one filter has to allow the time so the earliest one is used
+    f = AnyGroupProducerFilter([DayOfWeekProducerFilter([3]), TimeProducerFilter(lower=Time(14))])
+    assert f.skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 1, 14)
+    f.add_filter(InvertingProducerFilter(DayOfWeekProducerFilter([1])))
+    assert f.skip_to(dt) is None
+
+
+@pytest.fixture
+def posix_tz(monkeypatch):
+    # POSIX TZ strings don't have a timezone name
+    monkeypatch.setenv('TZ', 'CET-1CEST,M3.5.0,M10.5.0/3')
+    reset_system_tz()
+    yield
+    monkeypatch.undo()
+    reset_system_tz()
+
+
+@pytest.mark.usefixtures('posix_tz')
+def test_skip_to_posix_tz() -> None:
+    dt = ZonedDateTime.from_system_tz(2001, 1, 1, 12)     # Monday
+    assert dt.tz is None
+
+    assert TimeProducerFilter(Time(8), Time(9)).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 2, 8)
+    assert DayOfWeekProducerFilter([3, 6]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 1, 3)
+    assert MonthOfYearProducerFilter([3]).skip_to(dt) == ZonedDateTime.from_system_tz(2001, 3, 1)
+
+    # the skipped time is moved to the earlier offset, so it stays a lower bound
+    dt = ZonedDateTime.from_system_tz(2001, 3, 24, 12)
+    assert TimeProducerFilter(Time(2, 30)).skip_to(dt) == Instant.from_utc(2001, 3, 25, 0, 30).to_system_tz()
+
+    p = IntervalProducer(Instant.from_utc(2001, 1, 1, 11), 3600)
+    p._filter = TimeProducerFilter(Time(8), Time(9))
+    assert p.get_next(Instant.from_utc(2001, 1, 1, 11)) == Instant.from_utc(2001, 1, 2, 7)
+
+
+def test_next_date() -> None:
+    date = Date(2001, 1, 1)     # Monday
+
+    assert TimeProducerFilter(lower=Time(14)).allow_date(date) is None
+    assert TimeProducerFilter(lower=Time(14)).next_date(date) == date
+    assert DayOfWeekProducerFilter([3, 6]).next_date(date) == Date(2001, 1, 3)
+    assert DayOfMonthProducerFilter([29]).next_date(Date(2001, 2, 1)) == Date(2001, 3, 29)
+    assert MonthOfYearProducerFilter([12]).next_date(date) == Date(2001, 12, 1)
+    assert MonthOfYearProducerFilter([1]).next_date(Date(2001, 2, 5)) == Date(2002, 1, 1)
+    assert InvertingProducerFilter(DayOfWeekProducerFilter([1, 2])).next_date(date) == Date(2001, 1, 3)
+    assert InvertingProducerFilter(TimeProducerFilter(lower=Time(14))).next_date(date) == date
+
+    f = AllGroupProducerFilter([DayOfWeekProducerFilter([7]), DayOfMonthProducerFilter([29]),
+                                MonthOfYearProducerFilter([2, 3]), TimeProducerFilter(lower=Time(14))])
+    assert f.next_date(date) == Date(2004, 2, 29)
+    assert f.allow_date(Date(2004, 2, 29)) is None
+    assert f.allow_date(Date(2004, 2, 28)) is False
+
+    f = AnyGroupProducerFilter([DayOfWeekProducerFilter([7]), MonthOfYearProducerFilter([2])])
+    assert f.next_date(date) == Date(2001, 1, 7)
+    assert f.allow_date(Date(2001, 2, 5)) is True
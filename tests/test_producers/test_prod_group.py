@@ -1,4 +1,25 @@
-from eascheduler.producers.prod_filter import DayOfWeekProducerFilter
+import pytest
+from whenever import Instant, Time
+
+from eascheduler.helpers import TimeReplacer
+from eascheduler.producers import (
+    EarliestProducerOperation,
+    JitterProducerOperation,
+    LatestProducerOperation,
+    OffsetProducerOperation,
+    TimeProducer,
+)
+from eascheduler.producers.base import (
+    DateTimeProducerBase,
+    ProducerFilterBase,
+    invalidate_producer_caches,
+)
+from eascheduler.producers.prod_filter import (
+    AnyGroupProducerFilter,
+    DayOfMonthProducerFilter,
+    DayOfWeekProducerFilter,
+    TimeProducerFilter,
+)
 from eascheduler.producers.prod_group import GroupProducer
 from eascheduler.producers.prod_interval import IntervalProducer
 from tests.helper import compare_with_copy, get_system_as_instant
@@ -40,3 +61,88 @@ def test_filter() -> None:
 
     # Test copy
     compare_with_copy(p, p.copy())
+
+
+def _get_next_uncached(p: GroupProducer, dt: Instant) -> Instant:
+    # The implementation before the cache, which evaluates all producers in every iteration
+    next_dt = dt
+    while True:
+        values = sorted(c.get_next(next_dt) for c in p._producers)
+        next_dt = values[0]
+        for value in values:
+            if value > dt and ((f := p._filter) is None or f.allow(value.to_system_tz())):
+                return value
+
+
+def _time(hour: int, minute: int = 0) -> TimeProducer:
+    return TimeProducer(TimeReplacer(Time(hour, minute), 'after', 'earlier'))
+
+
+def _filtered(producer: DateTimeProducerBase, producer_filter: ProducerFilterBase) -> DateTimeProducerBase:
+    producer._filter = producer_filter
+    return producer
+
+
+@pytest.mark.parametrize('producers', [
+    [IntervalProducer(get_system_as_instant(1, 1, 8), 3600 * 5),
+     IntervalProducer(get_system_as_instant(1, 1, 8), 3600 * 3)],
+    [_time(8), _time(12, 30), _time(12, 30), IntervalProducer(get_system_as_instant(1, 1, 0, 7), 3600 * 7)],
+    [_time(h) for h in range(0, 24, 2)],
+    [_time(11), _time(18, 30), OffsetProducerOperation(_time(18), 3600)],
+    [_time(12), OffsetProducerOperation(_time(10), -5400), OffsetProducerOperation(_time(22), 7200)],
+    [_time(12), EarliestProducerOperation(_time(6), TimeReplacer(Time(8), 'after', 'earlier'))],
+    [_time(9), LatestProducerOperation(_time(22), TimeReplacer(Time(20), 'after', 'earlier'))],
+    [_time(15), _filtered(_time(10), DayOfWeekProducerFilter([1, 3])),
+     _filtered(OffsetProducerOperation(_time(11), 1800), DayOfMonthProducerFilter([2, 4]))],
+])
+@pytest.mark.parametrize('producer_filter', [
+    None,
+    DayOfWeekProducerFilter([2, 6]),
+    TimeProducerFilter(Time(9), Time(13)),
+    AnyGroupProducerFilter([DayOfMonthProducerFilter([3]), TimeProducerFilter(upper=Time(8, 30))]),
+])
+def test_same_as_uncached(producers: list[DateTimeProducerBase], producer_filter: ProducerFilterBase | None) -> None:
+    p = GroupProducer(producers)
+    p._filter = producer_filter
+
+    # both are called with the same instant, like a job which calculates the next run from the last run
+    start = get_system_as_instant(1, 1, 5)
+    dt = start
+    for _ in range(50):
+        expected = _get_next_uncached(p, dt)
+        assert p.get_next(dt) == expected
+        dt = expected
+
+    # instants in between the results, also going back in time
+    for minutes in (*range(0, 4 * 24 * 60, 97), 23 * 60, 13 * 60, 6 * 60):
+        dt = start.add(minutes=minutes)
+        assert p.get_next(dt) == _get_next_uncached(p, dt)
+
+
+def test_invalidate_cache() -> None:
+    p = GroupProducer([_time(8), _time(12)])
+    assert p.get_next(get_system_as_instant(1, 1, 6)) == get_system_as_instant(1, 1, 8)
+
+    # e.g. the timezone changed, so the cached value is outdated
+    p._cache[0] = (get_system_as_instant(1, 1, 6), get_system_as_instant(1, 1, 7))
+    assert p.get_next(get_system_as_instant(1, 1, 6)) == get_system_as_instant(1, 1, 7)
+
+    invalidate_producer_caches()
+    assert p.get_next(get_system_as_instant(1, 1, 6)) == get_system_as_instant(1, 1, 8)
+
+
+def test_not_range_stable() -> None:
+    jitter = JitterProducerOperation(_time(8), 3600)
+    p = GroupProducer([_time(12), jitter])
+    assert _time(8).is_range_stable()
+    assert not jitter.is_range_stable()
+    assert not OffsetProducerOperation(_time(8), 60).is_range_stable()
+    assert not p.is_range_stable()
+    assert GroupProducer([_time(8), _time(12)]).is_range_stable()
+
+    # the jitter is drawn again for every call instead of returning the cached value
+    dt = get_system_as_instant(1, 1, 6)
+    values = {p.get_next(dt) for _ in range(20)}
+    assert len(values) > 1
+    assert all(get_system_as_instant(1, 1, 8) <= value <= get_system_as_instant(1, 1, 9) for value in values)
+    assert p._cache[1] is None
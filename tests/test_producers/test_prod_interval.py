@@ -1,4 +1,14 @@
-from eascheduler.producers.prod_filter import DayOfWeekProducerFilter
+import pytest
+from whenever import Instant, Time
+
+from eascheduler.producers.base import ProducerFilterBase
+from eascheduler.producers.prod_filter import (
+    AllGroupProducerFilter,
+    AnyGroupProducerFilter,
+    DayOfMonthProducerFilter,
+    DayOfWeekProducerFilter,
+    TimeProducerFilter,
+)
 from eascheduler.producers.prod_interval import IntervalProducer
 from tests.helper import compare_with_copy, get_ger_str, get_german_as_instant, get_system_as_instant
 
@@ -82,3 +92,43 @@ def test_copy() -> None:
 
     p._filter = DayOfWeekProducerFilter([6])
     compare_with_copy(p, p.copy())
+
+
+def test_start_far_away() -> None:
+    # The next run is calculated directly and not by stepping through all intervals
+    p = IntervalProducer(Instant.from_utc(1970, 1, 1), 1)
+    assert p.get_next(Instant.from_utc(2001, 1, 1, nanosecond=1)) == Instant.from_utc(2001, 1, 1, second=1)
+
+    p = IntervalProducer(Instant.from_utc(2100, 1, 1), 1)
+    assert p.get_next(Instant.from_utc(2001, 1, 1)) == Instant.from_utc(2001, 1, 1, second=1)
+
+
+def test_no_drift() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    p = IntervalProducer(start, 0.1)
+
+    dt = start
+    for _ in range(100_000):
+        dt = p.get_next(dt)
+    assert dt == start.add(seconds=10_000)
+
+
+@pytest.mark.parametrize('producer_filter', [
+    AllGroupProducerFilter([DayOfWeekProducerFilter([1, 2, 3, 4, 5]), TimeProducerFilter(Time(8), Time(9))]),
+    AnyGroupProducerFilter([DayOfWeekProducerFilter([3]), TimeProducerFilter(Time(23, 59, 50))]),
+    AllGroupProducerFilter([DayOfMonthProducerFilter([1, 3]), TimeProducerFilter(upper=Time(0, 1, 7))]),
+])
+def test_filter_skip(producer_filter: ProducerFilterBase) -> None:
+    start = get_system_as_instant(1, 1, 0, 0, 7)
+    producer = IntervalProducer(start, 13)
+    producer._filter = producer_filter
+
+    # compare with stepping through all runs
+    dt = expected = start
+    for _ in range(30):
+        dt = producer.get_next(dt)
+
+        expected = expected.add(seconds=13)
+        while not producer_filter.allow(expected.to_system_tz()):
+            expected = expected.add(seconds=13)
+        assert dt == expected
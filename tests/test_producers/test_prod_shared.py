@@ -0,0 +1,169 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+from holidays import country_holidays
+from whenever import Instant, Time
+
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.helpers import TimeReplacer
+from eascheduler.jobs import DateTimeJob
+from eascheduler.producers import (
+    EarliestProducerOperation,
+    GroupProducer,
+    IntervalProducer,
+    JitterProducerOperation,
+    OffsetProducerOperation,
+    ProducerPool,
+    SharedProducer,
+    SunsetProducer,
+    TimeProducer,
+    WorkDayProducerFilter,
+)
+from eascheduler.producers.base import DateTimeProducerBase, invalidate_producer_caches
+from eascheduler.producers.prod_filter import AllGroupProducerFilter, DayOfWeekProducerFilter, TimeProducerFilter
+from eascheduler.schedulers.simulated import SimulatedScheduler
+from tests.helper import get_system_as_instant
+
+
+HOLIDAYS = country_holidays('DE', 'BE')
+
+
+def _time(hour: int) -> TimeProducer:
+    return TimeProducer(TimeReplacer(Time(hour), 'after', 'earlier'))
+
+
+def _sunset() -> DateTimeProducerBase:
+    p = OffsetProducerOperation(SunsetProducer(), -900)
+    p._filter = WorkDayProducerFilter(HOLIDAYS)
+    return p
+
+
+def test_shared_key() -> None:
+    assert _sunset().shared_key() == _sunset().shared_key()
+    assert _time(8).shared_key() == _time(8).shared_key()
+    assert _time(8).shared_key() != _time(9).shared_key()
+    assert GroupProducer([_time(8), _sunset()]).shared_key() == GroupProducer([_time(8), _sunset()]).shared_key()
+
+    # the filter is part of the key
+    p1 = _time(8)
+    p1._filter = AllGroupProducerFilter([DayOfWeekProducerFilter([1, 2]), TimeProducerFilter(Time(7))])
+    p2 = _time(8)
+    p2._filter = AllGroupProducerFilter([DayOfWeekProducerFilter([1, 2]), TimeProducerFilter(Time(7))])
+    assert p1.shared_key() == p2.shared_key()
+    p2._filter = AllGroupProducerFilter([DayOfWeekProducerFilter([1, 3]), TimeProducerFilter(Time(7))])
+    assert p1.shared_key() != p2.shared_key()
+    assert p1.shared_key() != _time(8).shared_key()
+
+    # producers with a state or random values can not be shared
+    assert IntervalProducer(None, 60).shared_key() is None
+    assert JitterProducerOperation(_time(8), 60).shared_key() is None
+    assert GroupProducer([_time(8), JitterProducerOperation(_time(8), 60)]).shared_key() is None
+
+
+def test_pool() -> None:
+    pool = ProducerPool()
+
+    p1 = pool.share(_sunset())
+    p2 = pool.share(_sunset())
+    assert isinstance(p1, SharedProducer)
+    assert p1 is p2
+    assert pool.share(p1) is p1
+
+    p3 = pool.share(_time(8))
+    assert p3 is not p1
+    interval = IntervalProducer(None, 60)
+    assert pool.share(interval) is interval
+
+    assert len(pool) == 2
+    assert (pool.shared, pool.reused, pool.unshared) == (3, 1, 1)
+
+    # the producers are removed when they are not used any more
+    del p1, p2
+    gc.collect()
+    assert len(pool) == 1
+
+    pool.reset()
+    assert (pool.shared, pool.reused, pool.unshared) == (0, 0, 0)
+
+
+def test_memo() -> None:
+    pool = ProducerPool()
+    p = pool.share(GroupProducer([_time(8), _time(12)]))
+
+    dt = get_system_as_instant(1, 1, 6)
+    for _ in range(5):
+        assert p.get_next(dt) == get_system_as_instant(1, 1, 8)
+    assert p.get_next(get_system_as_instant(1, 1, 8)) == get_system_as_instant(1, 1, 12)
+    assert (pool.calls, pool.evaluations) == (6, 2)
+
+    # the result is also the result for every instant up to it, e.g. for jobs which were created later
+    for minute in range(0, 60, 10):
+        assert p.get_next(get_system_as_instant(1, 1, 7, minute)) == get_system_as_instant(1, 1, 8)
+    assert p.get_next(get_system_as_instant(1, 1, 5)) == get_system_as_instant(1, 1, 8)
+    assert (pool.calls, pool.evaluations) == (13, 3)
+
+    # memoized results are dropped e.g. when the location changes
+    invalidate_producer_caches()
+    assert p.get_next(dt) == get_system_as_instant(1, 1, 8)
+    assert (pool.calls, pool.evaluations) == (14, 4)
+
+    # a copy is not shared
+    c = p.copy()
+    assert isinstance(c, GroupProducer)
+    assert c == p._producer
+
+
+def test_memo_not_range_stable() -> None:
+    pool = ProducerPool()
+    producer = EarliestProducerOperation(_time(6), TimeReplacer(Time(8), 'after', 'earlier'))
+    p = pool.share(producer.copy())
+    assert not p.is_range_stable()
+
+    # the result depends on the reference instant, so it's only memoized for the same instant
+    assert p.get_next(get_system_as_instant(1, 1, 5)) == get_system_as_instant(1, 1, 8)
+    dt = get_system_as_instant(1, 1, 7)
+    assert p.get_next(dt) == producer.get_next(dt) == get_system_as_instant(1, 2, 8)
+    assert p.get_next(dt) == get_system_as_instant(1, 2, 8)
+    assert (pool.calls, pool.evaluations) == (3, 2)
+
+
+def test_hash() -> None:
+    pool = ProducerPool()
+    p1 = pool.share(_sunset())
+    p2 = SharedProducer(_sunset(), pool)
+    assert p1 == p2
+    assert hash(p1) == hash(p2)
+
+
+def test_threads() -> None:
+    pool = ProducerPool()
+    producers = [pool.share(GroupProducer([_time(8), _time(12), _time(18)])) for _ in range(4)]
+    start = get_system_as_instant(1, 1, 6)
+
+    def run(p: DateTimeProducerBase) -> list[Instant]:
+        values = [start]
+        while len(values) <= 500:
+            values.append(p.get_next(values[-1]))
+        return values
+
+    # The jobs of the ShardedScheduler share the producer across threads
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(run, producers))
+
+    assert all(result == results[0] for result in results)
+    assert pool.calls == 2_000
+
+
+def test_job_producer() -> None:
+    s = SimulatedScheduler(get_system_as_instant(1, 1, 6))
+    producers = [_time(8) for _ in range(2)]
+    jobs = [DateTimeJob(SyncExecutor(lambda: None), p) for p in producers]
+    for job in jobs:
+        job.link_scheduler(s)
+
+    # the configured producer is kept, the jobs evaluate the shared one
+    assert [job.producer for job in jobs] == producers
+    assert jobs[0].producer is producers[0]
+    assert (s.producer_pool.shared, s.producer_pool.reused) == (2, 1)
+    assert jobs[0].next_run == jobs[1].next_run == get_system_as_instant(1, 1, 8)
+    s.remove_all()
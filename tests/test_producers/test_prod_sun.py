@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
@@ -7,8 +8,11 @@ from whenever import Instant, ZonedDateTime
 
 from eascheduler import get_sun_position
 from eascheduler.producers import (
+    AllGroupProducerFilter,
+    DayOfMonthProducerFilter,
     DayOfWeekProducerFilter,
     DuskProducer,
+    MonthOfYearProducerFilter,
     SunAzimuthProducerCompare,
     SunElevationProducerCompare,
     SunriseProducer,
@@ -169,3 +173,31 @@ def test_sun_cache_hits() -> None:
         producer_elevation4.get_next(dt.to_instant())
 
     assert (hits, misses) == (0, 30 * 7)
+
+
+def test_filter_next_date() -> None:
+    # The sun is only calculated for the allowed date
+    producer = SunsetProducer()
+    producer._filter = AllGroupProducerFilter([MonthOfYearProducerFilter([12]), DayOfMonthProducerFilter([29])])
+    expected = SunsetProducer().get_next(get_system_as_instant(12, 29, 0))
+
+    prod_sun_module.SUN_CACHE.clear()
+    assert producer.get_next(get_system_as_instant(1, 1, 7)) == expected
+    assert len(prod_sun_module.SUN_CACHE) <= 2
+
+
+def test_sun_cache_threads() -> None:
+    start = get_system_as_instant(1, 1, 12, year=2024)
+
+    def run(offset: int) -> list[Instant]:
+        p = SunriseProducer()
+        # every thread fills the cache with different days so it is constantly trimmed
+        return [p.get_next(start.add(hours=24 * (day * 4 + offset))) for day in range(100)]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(run, range(4)))
+
+    p = SunriseProducer()
+    for offset, result in enumerate(results):
+        assert result == [p.get_next(start.add(hours=24 * (day * 4 + offset))) for day in range(100)]
+    assert len(prod_sun_module.SUN_CACHE) <= 64
@@ -4,7 +4,12 @@ from whenever import Time, ZonedDateTime
 
 from eascheduler.helpers import TimeReplacer
 from eascheduler.producers import TimeProducer
-from eascheduler.producers.prod_filter import DayOfWeekProducerFilter
+from eascheduler.producers.prod_filter import (
+    AllGroupProducerFilter,
+    DayOfMonthProducerFilter,
+    DayOfWeekProducerFilter,
+    MonthOfYearProducerFilter,
+)
 from tests.helper import compare_with_copy, get_ger_str, get_german_as_instant, get_system_as_instant
 
 
@@ -125,3 +130,10 @@ def test_dst_twice() -> None:
         assert get_ger_str(dst_2) == '2001-10-28T02:30:00+02:00'
         assert get_ger_str(dst_3) == '2001-10-28T02:30:00+01:00'
         assert get_ger_str(dst_4) == '2001-10-29T02:30:00+01:00'
+
+
+def test_filter_next_date() -> None:
+    producer = TimeProducer(TimeReplacer(Time(8), 'after', 'earlier'))
+    producer._filter = AllGroupProducerFilter([MonthOfYearProducerFilter([12]), DayOfMonthProducerFilter([29])])
+    assert producer.get_next(get_system_as_instant(1, 1, 7)) == get_system_as_instant(12, 29, 8)
+    assert producer.get_next(get_system_as_instant(12, 29, 8)) == get_system_as_instant(12, 29, 8, year=2002)
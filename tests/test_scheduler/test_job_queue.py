@@ -0,0 +1,157 @@
+import pytest
+from whenever import Instant
+
+from eascheduler.errors.errors import JobExecutionTimeIsNotSetError
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.jobs.base import JobBase
+from eascheduler.schedulers.job_queue import DequeJobQueue, HeapJobQueue, JobQueueBase
+from tests.helper import AlwaysError
+
+
+def get_job(second: int, job_id: str | None = None) -> JobBase:
+    job = JobBase(SyncExecutor(AlwaysError()), job_id=job_id)
+    job.next_run = Instant.from_utc(2001, 1, 1, second=second)
+    return job
+
+
+@pytest.fixture(params=[DequeJobQueue, HeapJobQueue])
+def queue(request) -> JobQueueBase:
+    return request.param()
+
+
+def test_order(queue: JobQueueBase) -> None:
+    jobs = [get_job(s) for s in (5, 1, 3, 2, 4)]
+    for job in jobs:
+        queue.push(job)
+
+    assert len(queue) == 5
+    assert queue.peek() is jobs[1]
+    # iteration is in the order the jobs are run
+    assert list(queue) == [jobs[1], jobs[3], jobs[2], jobs[4], jobs[0]]
+    assert [queue.pop().next_run.timestamp() for _ in range(5)] == [978307200 + i for i in range(1, 6)]
+    assert not queue
+    assert queue.peek() is None
+
+
+def test_same_time_is_fifo(queue: JobQueueBase) -> None:
+    jobs = [get_job(1, job_id=str(i)) for i in range(10)]
+    for job in jobs:
+        queue.push(job)
+
+    assert [queue.pop() for _ in range(10)] == jobs
+
+
+def test_remove(queue: JobQueueBase) -> None:
+    a, b, c = get_job(1), get_job(2), get_job(3)
+    for job in (a, b, c):
+        queue.push(job)
+
+    assert queue.remove(a)
+    assert not queue.remove(a)
+    assert queue.peek() is b
+    assert len(queue) == 2
+    assert set(queue) == {b, c}
+
+    queue.clear()
+    assert not queue
+    assert queue.peek() is None
+
+
+def test_next_run_required(queue: JobQueueBase) -> None:
+    job = get_job(1)
+    job.next_run = None
+    with pytest.raises(JobExecutionTimeIsNotSetError):
+        queue.push(job)
+
+
+def test_heap_push_replaces() -> None:
+    queue = HeapJobQueue()
+    job = get_job(5)
+    other = get_job(3)
+    queue.push(job)
+    queue.push(other)
+
+    job.next_run = Instant.from_utc(2001, 1, 1, second=1)
+    queue.push(job)
+
+    assert len(queue) == 2
+    assert queue.pop() is job
+    assert queue.pop() is other
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_heap_compact() -> None:
+    queue = HeapJobQueue()
+    jobs = [get_job(i % 60) for i in range(200)]
+    for job in jobs:
+        queue.push(job)
+
+    for job in jobs[:150]:
+        queue.remove(job)
+
+    # dead entries got removed
+    assert len(queue._heap) < 200
+    assert len(queue) == 50
+
+    popped = [queue.pop() for _ in range(50)]
+    assert set(popped) == set(jobs[150:])
+    assert [j.next_run for j in popped] == sorted(j.next_run for j in popped)
+    assert queue.peek() is None
+
+
+def test_peek_deadline(queue: JobQueueBase) -> None:
+    assert queue.peek_deadline() is None
+
+    a, b = get_job(2), get_job(1)
+    queue.push(a)
+    queue.push(b)
+    assert queue.peek_deadline() == b.next_run.timestamp_nanos()
+
+    queue.remove(b)
+    assert queue.peek_deadline() == a.next_run.timestamp_nanos()
+
+
+def test_heap_caches_deadline() -> None:
+    queue = HeapJobQueue()
+    job = get_job(2)
+    queue.push(job)
+
+    # The deadline is cached when the job is pushed
+    job.next_run = Instant.from_utc(2001, 1, 1, second=5)
+    assert queue.peek_deadline() == Instant.from_utc(2001, 1, 1, second=2).timestamp_nanos()
+
+
+@pytest.mark.parametrize('existing', [0, 1, 100])
+def test_push_many(queue: JobQueueBase, existing: int) -> None:
+    for _ in range(existing):
+        queue.push(get_job(3))
+
+    jobs = [get_job(s, job_id=str(s)) for s in (5, 1, 4, 2)]
+    queue.push_many(jobs)
+    assert len(queue) == existing + 4
+
+    order = [queue.pop() for _ in range(existing + 4)]
+    assert order[:2] == [jobs[1], jobs[3]]
+    assert order[-2:] == [jobs[2], jobs[0]]
+
+    job = JobBase(SyncExecutor(AlwaysError()))
+    with pytest.raises(JobExecutionTimeIsNotSetError):
+        queue.push_many([job])
+
+
+def test_same_time_priority(queue: JobQueueBase) -> None:
+    jobs = [get_job(1, job_id=str(i)) for i in range(4)]
+    high = JobBase(SyncExecutor(AlwaysError()), job_id='high', priority=10)
+    low = JobBase(SyncExecutor(AlwaysError()), job_id='low', priority=-10)
+    for job in (high, low):
+        job.next_run = Instant.from_utc(2001, 1, 1, second=1)
+
+    queue.push(low)
+    queue.push_many(jobs[:2])
+    queue.push(high)
+    queue.push_many(jobs[2:])
+    # priority is only a tie-breaker, an earlier job is always first
+    queue.push(early := get_job(0))
+
+    assert [queue.pop() for _ in range(7)] == [early, high, *jobs, low]
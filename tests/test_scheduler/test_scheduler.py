@@ -1,15 +1,25 @@
 import asyncio
+import time
 from time import monotonic
 
-from whenever import Instant, TimeDelta
+import pytest
+from typing_extensions import Self
+from whenever import Instant, Time, TimeDelta
 
+from eascheduler.clocks import SYSTEM_CLOCK, VirtualClock
 from eascheduler.executor.base import SyncExecutor
-from eascheduler.jobs import DateTimeJob
-from eascheduler.jobs.base import STATUS_FINISHED
+from eascheduler.helpers import TimeReplacer
+from eascheduler.job_stores import InMemoryStore
+from eascheduler.jobs import CountdownJob, DateTimeJob
+from eascheduler.jobs.base import STATUS_FINISHED, JobBase
 from eascheduler.jobs.job_onetime import OneTimeJob
-from eascheduler.producers import IntervalProducer
+from eascheduler.producers import IntervalProducer, TimeProducer
 from eascheduler.schedulers.async_scheduler import AsyncScheduler
-from tests.helper import assert_called_at
+from eascheduler.schedulers.base import SchedulerBase
+from eascheduler.schedulers.job_queue import DequeJobQueue
+from eascheduler.schedulers.misfire import MISFIRE_CATCH_UP, MISFIRE_COALESCE, MISFIRE_SKIP, MisfireHandler
+from eascheduler.schedulers.stats import SchedulerMetrics
+from tests.helper import CountDownHelper, assert_called_at, get_system_as_instant
 
 
 async def test_scheduler() -> None:
@@ -99,3 +109,477 @@ async def test_scheduler_calls() -> None:
         assert_called_at(obj, start + 0.2 * i)
 
     assert s.timer is None
+
+
+async def test_scheduler_deque_queue() -> None:
+
+    calls = []
+
+    s = AsyncScheduler(queue=DequeJobQueue())
+    for i in (3, 1, 2):
+        job = OneTimeJob(SyncExecutor(calls.append, (i, )), Instant.now() + TimeDelta(seconds=0.01 * i))
+        job.link_scheduler(s)
+
+    await asyncio.sleep(0.1)
+
+    assert calls == [1, 2, 3]
+    assert s.timer is None
+    assert not s.jobs
+
+
+async def test_scheduler_coalesce() -> None:
+
+    with pytest.raises(ValueError, match='Coalesce window must not be negative'):
+        AsyncScheduler(coalesce=-1)
+
+    calls = []
+
+    s = AsyncScheduler(coalesce=0.02)
+    start = Instant.now()
+    for i in range(5):
+        job = OneTimeJob(SyncExecutor(calls.append, (i, )), start + TimeDelta(seconds=0.03 + i * 0.004))
+        job.link_scheduler(s)
+
+    await asyncio.sleep(0.025)
+    assert not calls
+
+    # all jobs run in the first tick
+    await asyncio.sleep(0.01)
+    assert calls == [0, 1, 2, 3, 4]
+    assert s.timer is None
+    assert not s.jobs
+
+
+async def test_scheduler_coalesce_no_double_run() -> None:
+
+    calls = []
+
+    s = AsyncScheduler(coalesce=0.05)
+    start = Instant.now()
+    job = DateTimeJob(SyncExecutor(calls.append, (1, )), IntervalProducer(start + TimeDelta(seconds=0.1), 0.1))
+    job.link_scheduler(s)
+    job.job_resume()
+
+    await asyncio.sleep(0.32)
+    job.job_finish()
+
+    assert calls == [1, 1, 1]
+
+
+async def test_scheduler_coalesce_once_per_tick() -> None:
+    calls = []
+
+    s = AsyncScheduler(coalesce=0.05)
+    start = Instant.now()
+    job = DateTimeJob(SyncExecutor(calls.append, (1, )), IntervalProducer(start, 0.01))
+    job.link_scheduler(s)
+    job.job_resume()
+
+    # the next runs are within the coalesce window, but the job only runs once per tick
+    s.run_jobs()
+    assert calls == [1]
+    assert job in s.jobs
+    job.job_finish()
+
+
+async def test_execute_before_next_run() -> None:
+    s = AsyncScheduler(enabled=False)
+    start = Instant.now().add(seconds=10)
+    job = DateTimeJob(SyncExecutor(lambda: None), IntervalProducer(start, 20))
+    job.link_scheduler(s)
+    assert job.next_run == start
+
+    # Job is executed before the next run -> calculation has to be from the next run
+    now = Instant.now()
+    job.execute(now)
+    assert job.last_run == now
+    assert job.next_run == start.add(seconds=20)
+
+
+async def test_scheduler_timer_rearm() -> None:
+    s = AsyncScheduler()
+    stats = s.timer_stats
+
+    job = CountdownJob(SyncExecutor(lambda: None), 0.1)
+    job.link_scheduler(s)
+    job.reset()
+    assert (stats.armed, stats.kept, stats.canceled) == (1, 0, 0)
+    timer = s.timer
+
+    # later deadline keeps the timer
+    for _ in range(10):
+        job.reset()
+    assert (stats.armed, stats.kept, stats.canceled) == (1, 10, 0)
+    assert s.timer is timer
+
+    # earlier deadline re-arms the timer
+    job.set_countdown(0.05)
+    job.reset()
+    assert (stats.armed, stats.kept, stats.canceled) == (2, 10, 1)
+    assert s.timer is not timer
+
+    # removing the last job cancels the timer
+    job.job_pause()
+    assert (stats.armed, stats.kept, stats.canceled) == (2, 10, 2)
+    assert s.timer is None
+    assert repr(stats) == '<TimerStats armed=2 canceled=2 kept=10>'
+
+    stats.reset()
+    assert repr(stats) == '<TimerStats armed=0 canceled=0 kept=0>'
+
+
+async def test_scheduler_kept_timer_fires_early() -> None:
+    calls = CountDownHelper()
+
+    s = AsyncScheduler()
+    job = calls.link_job(CountdownJob(SyncExecutor(calls), 0.05))
+    job.link_scheduler(s)
+    calls.reset()
+
+    await asyncio.sleep(0.03)
+    calls.reset()
+    assert s.timer_stats.kept == 1
+
+    # the first timer fires but there is nothing to do, so it gets re-armed
+    await asyncio.sleep(0.03)
+    calls.assert_not_called()
+    assert s.timer_stats.armed == 2
+
+    await asyncio.sleep(0.05)
+    calls.assert_called()
+
+
+async def test_scheduler_batch() -> None:
+    calls = []
+
+    s = AsyncScheduler()
+    start = Instant.now()
+    with s.batch():
+        jobs = [OneTimeJob(SyncExecutor(calls.append, (i, )), start + TimeDelta(seconds=0.01 * i)) for i in (3, 1, 2)]
+        for job in jobs:
+            job.link_scheduler(s)
+
+        # nothing is scheduled until the batch is done
+        with s.batch():
+            removed = OneTimeJob(SyncExecutor(calls.append, (4, )), start + TimeDelta(seconds=0.01))
+            removed.link_scheduler(s)
+        removed.job_finish()
+
+        assert not s.jobs
+        assert s.timer is None
+
+    assert len(s.jobs) == 3
+    assert s.timer_stats.armed == 1
+
+    await asyncio.sleep(0.05)
+    assert calls == [1, 2, 3]
+    assert s.timer is None
+
+
+async def test_scheduler_add_jobs() -> None:
+    s = AsyncScheduler()
+    start = Instant.now()
+    jobs = [OneTimeJob(SyncExecutor(lambda: None), start + TimeDelta(seconds=i + 1)) for i in range(10)]
+    for job in jobs:
+        job._scheduler = s
+        job.update_first()
+
+    s.add_jobs(jobs)
+    assert len(s.jobs) == 10
+    assert s.jobs.peek() is jobs[0]
+    assert s.timer_stats.armed == 1
+
+    with s.batch():
+        s.remove_all()
+    assert not s.jobs
+    assert s.timer is None
+
+
+async def test_scheduler_remove_all() -> None:
+    finished = []
+
+    s = AsyncScheduler()
+    store = InMemoryStore()
+    start = Instant.now()
+    for i in range(100):
+        job = OneTimeJob(SyncExecutor(lambda: None), start + TimeDelta(seconds=i + 1), job_id=i)
+        store.add_job(job)
+        job.on_finished.register(finished.append)
+        job.link_scheduler(s)
+    jobs = [store[i] for i in range(100)]
+
+    s.remove_all()
+    assert not s.jobs
+    assert s.timer is None
+    assert s.timer_stats.canceled == 1
+
+    assert not len(store)
+    # the jobs are finished in reverse order of their next run
+    assert finished == jobs[::-1]
+    assert all(job.status is STATUS_FINISHED and job._scheduler is None for job in jobs)
+
+
+class FinishErrorJob(OneTimeJob):
+    __slots__ = ()
+
+    def _set_finished(self) -> None:
+        super()._set_finished()
+        raise ValueError()
+
+
+async def test_scheduler_remove_all_error(caught_exceptions: list[Exception]) -> None:
+    s = AsyncScheduler()
+    start = Instant.now()
+    jobs = [FinishErrorJob(SyncExecutor(lambda: None), start + TimeDelta(seconds=i + 1)) for i in range(3)]
+    for job in jobs:
+        job.link_scheduler(s)
+
+    # an error while finishing a job does not stop the other jobs from finishing
+    s.remove_all()
+    assert all(job.status is STATUS_FINISHED for job in jobs)
+    assert len(caught_exceptions) == 3
+    caught_exceptions.clear()
+
+
+async def test_scheduler_metrics() -> None:
+    s = AsyncScheduler()
+    assert s.get_metrics() is None
+
+    metrics = SchedulerMetrics(lag_buckets=(0.001, 1), slowest=2)
+    s = AsyncScheduler(metrics=metrics)
+    start = Instant.now()
+    for i in range(3):
+        job = OneTimeJob(SyncExecutor(lambda: None), start + TimeDelta(seconds=0.01), job_id=i)
+        job.link_scheduler(s)
+    OneTimeJob(SyncExecutor(lambda: None), start + TimeDelta(seconds=10), job_id=3).link_scheduler(s)
+
+    await asyncio.sleep(0.05)
+
+    snap = s.get_metrics()
+    assert snap.ticks == 1
+    assert snap.dispatched == 3
+    assert snap.tick_jobs_max == 3
+    assert snap.queue_depth == 1
+    assert snap.queue_depth_max == 1
+    assert snap.tick_max >= snap.tick_mean > 0
+    assert snap.timer_armed == 2
+
+    assert [b for b, _ in snap.lag_buckets] == [0.001, 1, float('inf')]
+    assert sum(c for _, c in snap.lag_buckets) == 3
+    assert 0 <= snap.lag_mean <= snap.lag_max < 1
+
+    assert len(snap.slowest_updates) == 2
+    assert {job_id for job_id, _ in snap.slowest_updates} <= {0, 1, 2}
+    assert snap.slowest_updates[0][1] >= snap.slowest_updates[1][1]
+
+    # the snapshot does not change
+    metrics.reset()
+    assert snap.dispatched == 3
+    assert repr(metrics) == '<SchedulerMetrics ticks=0 dispatched=0>'
+    s.remove_all()
+
+
+def test_metrics_lag_histogram() -> None:
+    with pytest.raises(ValueError, match='Lag buckets must be ascending'):
+        SchedulerMetrics(lag_buckets=(1, 0.1))
+
+    metrics = SchedulerMetrics(lag_buckets=(0.001, 0.01))
+    for lag in (-5, 1_000_000, 1_000_001, 5_000_000, 2_000_000_000):
+        metrics.add_lag(lag)
+
+    snap = metrics.snapshot()
+    assert snap.lag_buckets == ((0.001, 2), (0.01, 2), (float('inf'), 1))
+    assert snap.lag_max == 2
+    assert snap.timer_armed == 0
+
+
+@pytest.mark.parametrize('budget', [{'max_jobs': 3}, {'max_time': 0.000_001}])
+async def test_scheduler_budget(budget: dict) -> None:
+    calls = []
+    ticks = []
+
+    s = AsyncScheduler(**budget)
+    start = Instant.now() + TimeDelta(seconds=0.01)
+    for i in range(10):
+        job = OneTimeJob(SyncExecutor(calls.append, (i, )), start + TimeDelta(microseconds=i))
+        job.link_scheduler(s)
+
+    async def other_task() -> None:
+        while len(calls) < 10:
+            ticks.append(len(calls))
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(other_task(), 1)
+
+    # the order is kept and the loop could run in between
+    assert calls == list(range(10))
+    assert len({t for t in ticks if 0 < t < 10}) >= 2
+    assert s.timer is None
+
+
+async def test_scheduler_budget_postponed() -> None:
+    calls = []
+
+    clock = VirtualClock(get_system_as_instant())
+    s = AsyncScheduler(enabled=False, max_jobs=1, clock=clock)
+    countdown = CountdownJob(SyncExecutor(calls.append, ('countdown', )), 1, lazy_reset=True)
+    countdown.link_scheduler(s)
+    countdown.reset()
+    OneTimeJob(SyncExecutor(calls.append, ('one time', )), clock.now().add(seconds=1.2)).link_scheduler(s)
+
+    # the countdown gets postponed when it is due, which does not count as a run
+    clock.advance(0.5)
+    countdown.reset()
+    clock.advance(0.8)
+    s.run_jobs()
+    assert calls == ['one time']
+    assert countdown.next_run == get_system_as_instant(second=1, microsecond=500_000)
+    s.remove_all()
+
+
+async def test_scheduler_budget_invalid() -> None:
+    with pytest.raises(ValueError, match='Max jobs must be >= 1'):
+        AsyncScheduler(max_jobs=0)
+    with pytest.raises(ValueError, match='Max time must be positive'):
+        AsyncScheduler(max_time=0)
+
+
+@pytest.mark.parametrize(('policy', 'job_policy', 'count'), [
+    (MISFIRE_COALESCE, None, 1), (MISFIRE_SKIP, None, 0), (MISFIRE_CATCH_UP, None, 5),
+    (MISFIRE_COALESCE, MISFIRE_SKIP, 0),
+])
+async def test_scheduler_misfire(policy, job_policy, count: int) -> None:
+    calls = []
+
+    misfire = MisfireHandler(0.01, policy, stall=0.2)
+    s = AsyncScheduler(misfire=misfire)
+    start = Instant.now()
+    job = DateTimeJob(SyncExecutor(calls.append, (1, )), IntervalProducer(start.add(seconds=0.1), 0.1))
+    job.misfire_policy = job_policy
+    job.link_scheduler(s)
+
+    # block the loop, so the runs at 0.1 ... 0.5 are missed
+    time.sleep(0.55)  # noqa: ASYNC251
+    await asyncio.sleep(0.02)
+
+    assert len(calls) == count
+    assert misfire.stalls == 1
+    assert misfire.last_stall >= 0.4
+    assert job.next_run == start.add(seconds=0.6)
+    assert misfire.coalesced + misfire.skipped + misfire.caught_up == max(count, 1)
+
+    # afterward the job runs normally
+    await asyncio.sleep(0.1)
+    assert len(calls) == count + 1
+    job.job_finish()
+
+
+async def test_scheduler_misfire_catch_up_interval() -> None:
+    calls = []
+
+    s = AsyncScheduler(misfire=MisfireHandler(0.01, MISFIRE_CATCH_UP, catch_up_interval=0.1))
+    start = Instant.now()
+    job = DateTimeJob(SyncExecutor(calls.append, ('catch up', )), IntervalProducer(start.add(seconds=0.01), 0.01))
+    job.link_scheduler(s)
+
+    # block the loop, so the interval job has missed runs
+    time.sleep(0.05)  # noqa: ASYNC251
+    OneTimeJob(SyncExecutor(calls.append, ('other', )), Instant.now().add(seconds=0.02)).link_scheduler(s)
+
+    # only the job with the missed runs waits for the catch up interval
+    await asyncio.sleep(0.05)
+    assert calls == ['catch up', 'other']
+
+    await asyncio.sleep(0.1)
+    assert calls.count('catch up') >= 2
+    s.remove_all()
+    assert job.status is STATUS_FINISHED
+
+
+async def test_scheduler_misfire_skip_once(caplog: pytest.LogCaptureFixture) -> None:
+    calls = []
+
+    misfire = MisfireHandler(0.01, MISFIRE_SKIP)
+    s = AsyncScheduler(misfire=misfire)
+    job = OneTimeJob(SyncExecutor(calls.append, (1, )), Instant.now().add(seconds=0.01), job_id='once')
+    job.link_scheduler(s)
+
+    time.sleep(0.05)  # noqa: ASYNC251
+    await asyncio.sleep(0.01)
+
+    # the job is finished without being run, which is logged
+    assert calls == []
+    assert job.status is STATUS_FINISHED
+    assert misfire.skipped == 1
+    assert "Skipped misfired run of job 'once', job is finished now" in caplog.text
+
+
+async def test_scheduler_misfire_metrics() -> None:
+    metrics = SchedulerMetrics(slowest=10)
+    s = AsyncScheduler(misfire=MisfireHandler(0.01, MISFIRE_COALESCE), metrics=metrics)
+    start = Instant.now()
+    for i in range(2):
+        job = OneTimeJob(SyncExecutor(lambda: None), start.add(seconds=0.01), job_id=i)
+        job.link_scheduler(s)
+
+    # block the loop, so the jobs are misfired
+    time.sleep(0.05)  # noqa: ASYNC251
+    await asyncio.sleep(0.01)
+
+    # the misfired runs are measured, too
+    assert sum(metrics.lag_buckets) == 2
+    assert sorted(job_id for _, _, job_id in metrics.slowest_updates) == [0, 1]
+
+
+@pytest.mark.parametrize('policy', [None, MISFIRE_COALESCE, MISFIRE_SKIP, MISFIRE_CATCH_UP])
+async def test_metrics_exclude_executor(policy) -> None:
+    metrics = SchedulerMetrics()
+    misfire = MisfireHandler(0.01, policy) if policy is not None else None
+    s = AsyncScheduler(misfire=misfire, metrics=metrics)
+    job = OneTimeJob(SyncExecutor(time.sleep, (0.05, )), Instant.now().add(seconds=0.01), job_id=1)
+    job.link_scheduler(s)
+
+    if misfire is not None:
+        time.sleep(0.05)  # noqa: ASYNC251
+    await asyncio.sleep(0.1)
+
+    # only the calculation of the next run is measured
+    assert [job_id for _, _, job_id in metrics.slowest_updates] == [1]
+    assert metrics.slowest_updates[0][0] < 10_000_000
+
+
+def test_misfire_handler() -> None:
+    with pytest.raises(ValueError, match='Grace time must not be negative'):
+        MisfireHandler(-1)
+    with pytest.raises(ValueError, match='Catch up interval must not be negative'):
+        MisfireHandler(catch_up_interval=-1)
+    with pytest.raises(ValueError, match='Stall time must be positive'):
+        MisfireHandler(stall=0)
+
+    assert repr(MisfireHandler()) == '<MisfireHandler policy=coalesce coalesced=0 skipped=0 caught_up=0 stalls=0>'
+
+
+class LegacyScheduler(SchedulerBase):
+    __slots__ = ('jobs', )
+
+    def __init__(self) -> None:
+        # does not call super().__init__()
+        self.jobs = []
+
+    def add_job(self, job: JobBase) -> Self:
+        self.jobs.append(job)
+        return self
+
+
+def test_scheduler_without_init() -> None:
+    s = LegacyScheduler()
+    job = DateTimeJob(SyncExecutor(lambda: None), TimeProducer(TimeReplacer(Time(8), 'after', 'earlier')))
+    job.link_scheduler(s)
+
+    assert s.jobs == [job]
+    assert s.clock is SYSTEM_CLOCK
+    assert s.producer_pool is s.producer_pool
+    assert len(s.producer_pool) == 1
+
+    with pytest.raises(AttributeError, match="'LegacyScheduler' object has no attribute 'missing'"):
+        _ = s.missing
@@ -0,0 +1,91 @@
+import time
+from threading import Event, Lock, current_thread
+
+import pytest
+from whenever import Instant
+
+from eascheduler.builder import JobBuilder, TriggerBuilder
+from eascheduler.executor import AsyncExecutor, SyncExecutor
+from eascheduler.jobs.base import STATUS_FINISHED
+from eascheduler.schedulers.sharded import ShardedScheduler
+
+
+@pytest.fixture
+def scheduler():
+    s = ShardedScheduler(4)
+    yield s
+    s.remove_all()
+    s.stop(1)
+
+
+def wait_for(func, timeout: float = 1) -> None:
+    end = time.monotonic() + timeout
+    while not func():
+        assert time.monotonic() < end
+        time.sleep(0.005)
+
+
+def test_init() -> None:
+    with pytest.raises(ValueError, match='Shards must be an int >= 1'):
+        ShardedScheduler(0)
+
+
+def test_shards(scheduler: ShardedScheduler) -> None:
+    lock = Lock()
+    threads = {}
+
+    def func(i: int) -> None:
+        with lock:
+            threads[i] = current_thread().name
+
+    builder = JobBuilder(scheduler, SyncExecutor)
+    start = Instant.now().add(seconds=0.05)
+    with builder.bulk():
+        for i in range(100):
+            builder.once(start, func, i, job_id=i)
+    assert repr(scheduler) == '<ShardedScheduler shards=4 jobs=100>'
+    assert all(len(shard.jobs) == 25 for shard in scheduler.shards)
+
+    wait_for(lambda: len(threads) == 100)
+    assert {threads[i] for i in range(4)} == {f'EASchedulerShard{i:d}' for i in range(4)}
+    assert all(threads[i] == f'EASchedulerShard{i % 4:d}' for i in range(100))
+    wait_for(lambda: not len(scheduler))
+
+
+def test_async_executor(scheduler: ShardedScheduler) -> None:
+    done = Event()
+
+    async def func() -> None:
+        done.set()
+
+    builder = JobBuilder(scheduler, AsyncExecutor)
+    builder.once(Instant.now().add(seconds=0.01), func)
+    assert done.wait(1)
+
+
+def test_control(scheduler: ShardedScheduler) -> None:
+    calls = []
+
+    builder = JobBuilder(scheduler, SyncExecutor)
+    countdown = builder.countdown(0.05, calls.append, 'countdown')
+    interval = builder.at(TriggerBuilder.interval(None, 0.02), calls.append, 'interval')
+
+    countdown.reset()
+    for _ in range(5):
+        time.sleep(0.01)
+        countdown.reset()
+    countdown.stop()
+
+    interval.pause()
+    calls.clear()
+    time.sleep(0.1)
+    assert calls == []
+
+    interval.resume()
+    countdown.reset()
+    time.sleep(0.08)
+    assert calls.count('countdown') == 1
+    assert calls.count('interval') >= 2
+
+    interval.cancel()
+    assert interval.status is STATUS_FINISHED
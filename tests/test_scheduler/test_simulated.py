@@ -0,0 +1,116 @@
+import pytest
+from whenever import Instant, ZonedDateTime
+
+from eascheduler.builder import FilterBuilder, JobBuilder, TriggerBuilder
+from eascheduler.builder.triggers import TriggerObject
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.jobs.base import STATUS_FINISHED
+from eascheduler.schedulers.simulated import SimulatedScheduler
+
+
+def test_simulated_interval() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    calls = []
+
+    builder = JobBuilder(s, SyncExecutor)
+    job = builder.at(TriggerBuilder.interval(start.add(seconds=10), 60), lambda: calls.append(s.clock.now()),
+                     job_id='interval')
+    assert job._job.next_run == start.add(seconds=10)
+
+    assert s.run_for(3_600) == 60
+    assert s.clock.now() == start.add(hours=1)
+    assert calls == [start.add(seconds=10 + 60 * i) for i in range(60)]
+    assert s.fired == [(c, 'interval') for c in calls]
+
+    # execution time and the next run are calculated from the virtual clock
+    assert job._job.last_run == start.add(seconds=3_550)
+    assert job._job.next_run == start.add(seconds=3_610)
+
+    job.pause()
+    assert s.run_for(3_600) == 0
+    job.resume()
+    assert job._job.next_run == start.add(seconds=7_210)
+
+
+def test_simulated_year() -> None:
+    start = ZonedDateTime.from_system_tz(2001, 1, 1, 12).to_instant()
+    s = SimulatedScheduler(start, record=False)
+    builder = JobBuilder(s, SyncExecutor)
+
+    calls = []
+    builder.at(TriggerBuilder.time('08:00:00'), lambda: calls.append(s.clock.now().to_system_tz()))
+    builder.at(TriggerBuilder.sunrise(), lambda: None)
+
+    assert s.run_until(ZonedDateTime.from_system_tz(2002, 1, 1, 12).to_instant()) == 2 * 365
+    assert not s.fired
+    assert len(calls) == 365
+    assert {(c.hour, c.minute, c.second) for c in calls} == {(8, 0, 0)}
+    assert str(calls[0].date()) == '2001-01-02'
+    assert str(calls[-1].date()) == '2002-01-01'
+
+
+def test_simulated_once_and_remove_all() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    builder = JobBuilder(s, SyncExecutor)
+
+    once = builder.once(start.add(seconds=5), lambda: None)
+    countdown = builder.countdown(30, lambda: None)
+    countdown.reset()
+    assert countdown._job.next_run == start.add(seconds=30)
+    assert repr(s) == '<SimulatedScheduler jobs=2 now=2001-01-01T00:00:00Z>'
+
+    assert s.run_for(10) == 1
+    assert once.status is STATUS_FINISHED
+
+    s.remove_all()
+    assert countdown.status is STATUS_FINISHED
+    assert not s.jobs
+
+
+def test_simulated_next_run_in_the_past() -> None:
+    start = Instant.from_utc(2001, 1, 1)
+    s = SimulatedScheduler(start)
+    builder = JobBuilder(s, SyncExecutor)
+
+    # the next run may be slightly before the current time
+    once = builder.once(start.subtract(milliseconds=50), lambda: None)
+    assert once._job.next_run < s.clock.now()
+    assert s.run_for(1) == 1
+    assert once.status is STATUS_FINISHED
+    assert s.fired == [(start, once.id)]
+
+    with pytest.raises(ValueError, match='Virtual clock can not go backwards'):
+        s.run_until(start)
+    assert s.clock.now() == start.add(seconds=1)
+
+
+def test_simulated_shared_producer() -> None:
+    start = ZonedDateTime.from_system_tz(2001, 1, 1, 12).to_instant()
+    s = SimulatedScheduler(start)
+    builder = JobBuilder(s, SyncExecutor)
+
+    def trigger() -> TriggerObject:
+        return TriggerBuilder.sunset().offset(-900).only_on(FilterBuilder.weekdays('Mo-Fr'))
+
+    for i in range(20):
+        builder.at(trigger(), lambda: None, job_id=i)
+    builder.at(TriggerBuilder.interval(None, 3_600), lambda: None, job_id='interval')
+
+    pool = s.producer_pool
+    assert len(pool) == 1
+    assert (pool.shared, pool.reused, pool.unshared) == (20, 19, 1)
+
+    # all jobs run at the same time, so the producer is evaluated only once for all of them
+    pool.reset()
+    assert s.run_until(start.add(hours=24 * 31)) == 20 * 23 + 31 * 24
+    assert pool.calls == 20 * 23
+    assert pool.evaluations == 23
+
+    # same results as a job with its own producer
+    sunsets = [dt for dt, job_id in s.fired if job_id == 0]
+    s_single = SimulatedScheduler(start)
+    JobBuilder(s_single, SyncExecutor).at(trigger(), lambda: None, job_id=0)
+    s_single.run_until(start.add(hours=24 * 31))
+    assert [dt for dt, _ in s_single.fired] == sunsets
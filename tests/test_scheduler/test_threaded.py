@@ -0,0 +1,96 @@
+import time
+from threading import Event, Thread
+
+import pytest
+from whenever import Instant
+
+from eascheduler.builder import JobBuilder, TriggerBuilder
+from eascheduler.executor import SyncExecutor, ThreadExecutor
+from eascheduler.jobs import OneTimeJob
+from eascheduler.jobs.base import STATUS_FINISHED
+from eascheduler.schedulers.threaded import ThreadedScheduler
+
+
+@pytest.fixture
+def scheduler():
+    s = ThreadedScheduler()
+    yield s
+    s.remove_all()
+    s.stop(1)
+    assert repr(s) == '<ThreadedScheduler stopped jobs=0>'
+
+
+def test_once(scheduler: ThreadedScheduler) -> None:
+    calls = []
+    done = Event()
+
+    def func(i: int) -> None:
+        calls.append(i)
+        if len(calls) == 3:
+            done.set()
+
+    builder = JobBuilder(scheduler, SyncExecutor)
+    start = Instant.now()
+    for i in (3, 1, 2):
+        builder.once(start.add(seconds=0.01 * i), func, i)
+    assert repr(scheduler) == '<ThreadedScheduler jobs=3>'
+
+    assert done.wait(1)
+    assert calls == [1, 2, 3]
+    assert not scheduler.jobs
+
+
+def test_countdown_thread_executor(scheduler: ThreadedScheduler) -> None:
+    done = Event()
+
+    builder = JobBuilder(scheduler, ThreadExecutor)
+    job = builder.countdown(0.05, done.set)
+    start = time.monotonic()
+    job.reset()
+
+    # an earlier job wakes up the dispatcher
+    job.set_countdown(0.02)
+    job.reset()
+
+    assert done.wait(1)
+    assert time.monotonic() - start < 0.045
+    assert job.status.is_paused
+
+
+def test_interval(scheduler: ThreadedScheduler) -> None:
+    calls = []
+
+    builder = JobBuilder(scheduler, SyncExecutor)
+    job = builder.at(TriggerBuilder.interval(None, 0.02), calls.append, 1)
+    time.sleep(0.11)
+    job.cancel()
+
+    assert 4 <= len(calls) <= 6
+
+
+def test_threads(scheduler: ThreadedScheduler) -> None:
+    calls = []
+    start = Instant.now().add(seconds=0.05)
+
+    def add(offset: int) -> None:
+        for i in range(100):
+            OneTimeJob(SyncExecutor(calls.append, (offset + i, )), start).link_scheduler(scheduler)
+
+    threads = [Thread(target=add, args=(i * 100, )) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for _ in range(100):
+        if len(calls) == 400:
+            break
+        time.sleep(0.01)
+    assert sorted(calls) == list(range(400))
+
+
+def test_remove_all(scheduler: ThreadedScheduler) -> None:
+    builder = JobBuilder(scheduler, SyncExecutor)
+    jobs = [builder.once(Instant.now().add(seconds=1 + i), lambda: None) for i in range(5)]
+    scheduler.remove_all()
+    assert all(job.status is STATUS_FINISHED for job in jobs)
@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+from whenever import Instant, TimeDelta
+
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.jobs import CountdownJob, OneTimeJob
+from eascheduler.jobs.base import STATUS_FINISHED, STATUS_PAUSED, STATUS_RUNNING
+from eascheduler.schedulers.timing_wheel import TimingWheelScheduler
+from tests.helper import CountDownHelper
+
+
+async def test_init() -> None:
+    with pytest.raises(ValueError, match='Tick must be positive'):
+        TimingWheelScheduler(tick=0)
+    with pytest.raises(ValueError, match='Slots must be an int >= 2'):
+        TimingWheelScheduler(slots=1)
+    with pytest.raises(ValueError, match='Levels must be an int >= 1'):
+        TimingWheelScheduler(levels=0)
+
+
+@pytest.mark.parametrize('offset', [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 100, 300])
+async def test_cascade(offset: int) -> None:
+    s = TimingWheelScheduler(tick=1, slots=4, levels=3)
+    fired = []
+
+    for start in range(20):
+        s._current = start
+        job = CountdownJob(SyncExecutor(lambda: fired.append(s._current)), 1)
+        s._insert(job, start + offset)
+
+        while s._job_slot:
+            s._advance(Instant.now())
+
+        assert fired == [start + offset], f'start {start:d}'
+        fired.clear()
+
+
+@pytest.mark.parametrize('offset', [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 100, 300])
+async def test_skip_to_next_event(offset: int) -> None:
+    s = TimingWheelScheduler(tick=1, slots=4, levels=3)
+    fired = []
+
+    for start in range(20):
+        s._current = start
+        job = CountdownJob(SyncExecutor(lambda: fired.append(s._current)), 1)
+        event = s._insert(job, start + offset)
+        assert event == s._next_event()
+
+        advances = 0
+        while s._job_slot:
+            s._current = s._next_event() - 1
+            s._advance(Instant.now())
+            advances += 1
+
+        assert fired == [start + offset], f'start {start:d}'
+        # the job is only touched when it is moved to a lower level, redistributed from the overflow or when it runs
+        assert advances <= 4 + offset // 64
+        fired.clear()
+
+
+class CountingTimingWheelScheduler(TimingWheelScheduler):
+    __slots__ = ('runs', )
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.runs = 0
+
+    def run_jobs(self) -> None:
+        self.runs += 1
+        super().run_jobs()
+
+
+async def test_timer_sleeps_until_due() -> None:
+    s = CountingTimingWheelScheduler(tick=0.005)
+    calls = []
+    job = CountdownJob(SyncExecutor(calls.append, (1, )), 0.2)
+    job.link_scheduler(s)
+    job.reset()
+
+    await asyncio.sleep(0.3)
+    assert calls == [1]
+    # the scheduler only wakes up to redistribute the job and to run it, not for every tick
+    assert s.runs <= 3
+    assert s.timer is None
+
+
+async def test_add_past() -> None:
+    s = TimingWheelScheduler(tick=1, slots=4, levels=2)
+    job = CountdownJob(SyncExecutor(lambda: None), 1)
+    job.link_scheduler(s)
+    job.next_run = Instant.now() - TimeDelta(seconds=30)
+    job.status = STATUS_RUNNING
+    s.add_job(job)
+
+    # job runs on the next tick
+    assert s._job_slot[job][job] == s._current + 1
+    s._advance(Instant.now())
+    assert job not in s._job_slot
+    assert job.status is STATUS_PAUSED
+
+
+async def test_remove() -> None:
+    s = TimingWheelScheduler(tick=1, slots=4, levels=2)
+    jobs = [CountdownJob(SyncExecutor(lambda: None), 1) for _ in range(3)]
+
+    for i, job in enumerate(jobs):
+        s._insert(job, s._current + 1 + i * 10)
+
+    s.remove_job(jobs[1])
+    assert set(s._job_slot) == {jobs[0], jobs[2]}
+    assert sum(len(slot) for wheel in s._wheels for slot in wheel) + len(s._overflow) == 2
+
+    # remove is a no-op if the job is not in the wheel
+    s.remove_job(jobs[1])
+
+
+@pytest.mark.parametrize('action', ['finish', 'reset'])
+async def test_change_job_of_same_tick(action: str) -> None:
+    s = TimingWheelScheduler(tick=1, slots=4, levels=2)
+    ran = []
+
+    b = CountdownJob(SyncExecutor(ran.append, ('b', )), 60)
+    b.link_scheduler(s)
+    b.reset()
+
+    def run_a() -> None:
+        ran.append('a')
+        if action == 'finish':
+            b.job_finish()
+        else:
+            b.reset()
+
+    a = CountdownJob(SyncExecutor(run_a), 60)
+    a.link_scheduler(s)
+    a.reset()
+
+    # both jobs are due in the same tick and the callback of a changes b
+    s._remove(a)
+    s._remove(b)
+    s._insert(a, s._current + 1)
+    s._insert(b, s._current + 1)
+    s._advance(Instant.now())
+
+    assert ran == ['a']
+    if action == 'finish':
+        assert b.status is STATUS_FINISHED
+        assert b not in s._job_slot
+    else:
+        assert b.status is STATUS_RUNNING
+        assert b in s._job_slot
+    assert a not in s._job_slot
+    s.remove_all()
+
+
+async def test_countdown() -> None:
+    calls = CountDownHelper()
+
+    s = TimingWheelScheduler(tick=0.005)
+    job = calls.link_job(CountdownJob(SyncExecutor(calls), 0.1))
+    job.link_scheduler(s)
+
+    calls.reset()
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        calls.reset()
+
+    calls.assert_not_called()
+    await asyncio.sleep(0.15)
+
+    calls.assert_called()
+    assert job.status is STATUS_PAUSED
+    assert s.timer is None
+
+
+async def test_many_resets() -> None:
+    calls = []
+
+    s = TimingWheelScheduler(tick=0.005)
+    jobs = [CountdownJob(SyncExecutor(calls.append, (i, )), 0.05) for i in range(1_000)]
+    for job in jobs:
+        job.link_scheduler(s)
+        job.reset()
+
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+        for job in jobs[::2]:
+            job.reset()
+
+    await asyncio.sleep(0.2)
+    assert sorted(calls) == list(range(1_000))
+    assert s.timer is None
+
+
+async def test_onetime_and_remove_all() -> None:
+    calls = []
+
+    s = TimingWheelScheduler(tick=0.005)
+    job = OneTimeJob(SyncExecutor(calls.append, (1, )), Instant.now() + TimeDelta(seconds=0.02))
+    job.link_scheduler(s)
+    await asyncio.sleep(0.05)
+    assert calls == [1]
+    assert job.status is STATUS_FINISHED
+
+    job = OneTimeJob(SyncExecutor(calls.append, (2, )), Instant.now() + TimeDelta(seconds=0.02))
+    job.link_scheduler(s)
+    s.remove_all()
+    assert job.status is STATUS_FINISHED
+    assert s.timer is None
+
+    await asyncio.sleep(0.05)
+    assert calls == [1]
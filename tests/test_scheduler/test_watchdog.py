@@ -0,0 +1,102 @@
+import asyncio
+import logging
+
+import pytest
+from whenever import Instant, reset_system_tz
+
+from eascheduler.builder import JobBuilder, TriggerBuilder
+from eascheduler.clocks import VirtualClock
+from eascheduler.executor.base import SyncExecutor
+from eascheduler.schedulers import watchdog as watchdog_module
+from eascheduler.schedulers.async_scheduler import AsyncScheduler
+from eascheduler.schedulers.watchdog import ClockWatchdog
+from tests.helper import get_system_as_instant
+
+
+@pytest.fixture
+def reset_tz(monkeypatch):
+    yield monkeypatch
+    monkeypatch.undo()
+    reset_system_tz()
+
+
+async def test_watchdog_init() -> None:
+    s = AsyncScheduler()
+    with pytest.raises(ValueError, match='Interval must be positive'):
+        ClockWatchdog(s, interval=0)
+    with pytest.raises(ValueError, match='Threshold must be positive'):
+        ClockWatchdog(s, threshold=0)
+
+    watchdog = ClockWatchdog(s)
+    assert repr(watchdog) == '<ClockWatchdog jumps=0 tz_changes=0>'
+    assert not watchdog.check()
+
+
+async def test_watchdog_jump(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG)
+    clock = VirtualClock(get_system_as_instant(1, 1, 12))
+    start = clock.now()
+
+    s = AsyncScheduler(clock=clock)
+    builder = JobBuilder(s, SyncExecutor)
+    interval = builder.at(TriggerBuilder.interval(start.add(seconds=60), 60), lambda: None)
+    daily = builder.at(TriggerBuilder.time('08:00:00'), lambda: None)
+    once = builder.once(start.add(hours=2), lambda: None)
+
+    watchdog = ClockWatchdog(s)
+    clock.advance(3_600)
+    assert watchdog.check()
+    assert watchdog.jumps == 1
+
+    # only the DateTimeJobs are rescheduled and only the interval job moved
+    assert interval._job.next_run == start.add(seconds=3_660)
+    assert daily._job.next_run == get_system_as_instant(1, 2, 8)
+    assert once._job.next_run == start.add(hours=2)
+    assert s.timer is not None
+    assert 'Rescheduled 1 jobs' in caplog.text
+    assert s.reschedule([interval._job, daily._job]) == 0
+
+    assert not watchdog.check()
+    s.remove_all()
+
+
+async def test_watchdog_tz_reload(reset_tz) -> None:
+    calls = []
+    reset_tz.setattr(watchdog_module, 'reset_system_tz', lambda: calls.append(1))
+
+    watchdog = ClockWatchdog(AsyncScheduler())
+    calls.clear()
+
+    # the timezone is only reloaded if its configuration changed
+    for _ in range(3):
+        assert not watchdog.check()
+    assert calls == ([] if watchdog._tz_source is not None else [1, 1, 1])
+
+    calls.clear()
+    reset_tz.setenv('TZ', 'Asia/Tokyo')
+    watchdog.check()
+    assert calls == [1]
+
+
+async def test_watchdog_tz(reset_tz) -> None:
+    reset_tz.setenv('TZ', 'Europe/Berlin')
+    reset_system_tz()
+
+    s = AsyncScheduler()
+    builder = JobBuilder(s, SyncExecutor)
+    job = builder.at(TriggerBuilder.time('08:00:00'), lambda: None)
+    next_run = job._job.next_run
+    assert next_run.to_tz('Europe/Berlin').hour == 8
+
+    watchdog = ClockWatchdog(s, interval=0.01)
+    watchdog.start()
+
+    reset_tz.setenv('TZ', 'Asia/Tokyo')
+    await asyncio.sleep(0.015)
+    watchdog.stop()
+
+    assert watchdog.tz_changes == 1
+    assert watchdog.jumps == 0
+    assert job._job.next_run.to_tz('Asia/Tokyo').hour == 8
+    assert job._job.next_run > Instant.now()
+    s.remove_all()